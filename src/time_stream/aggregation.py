@@ -15,12 +15,14 @@ Both share a common abstract base class :class:`AggregationPipeline`.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import timedelta
-from typing import Callable, get_args
+from copy import copy
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterable, Iterator, Mapping, Sequence, get_args
+from zoneinfo import ZoneInfo
 
 import polars as pl
-from polars.dataframe.group_by import DynamicGroupBy, RollingGroupBy
+from polars.lazyframe.group_by import LazyGroupBy
 
 from time_stream import Period
 from time_stream.exceptions import AggregationError, AggregationPeriodError, MissingCriteriaError, TimeWindowError
@@ -31,9 +33,12 @@ from time_stream.utils import TimeWindow, check_columns_in_dataframe
 
 @dataclass(frozen=True)
 class AggregationCtx:
-    """Immutable context passed to aggregations."""
+    """Immutable context passed to aggregations.
 
-    df: pl.DataFrame
+    ``df`` may be a ``LazyFrame``, in which case the pipelines build a deferred query plan rather than an eager result.
+    """
+
+    df: pl.DataFrame | pl.LazyFrame
     time_name: str
     time_anchor: TimeAnchor
     periodicity: Period
@@ -60,6 +65,237 @@ class AggregationFunction(Operation, ABC):
         """Return additional Polars expressions to be applied after the aggregation."""
         return []
 
+    def partial_expr(self, _ctx: AggregationCtx, _columns: list[str]) -> list[pl.Expr] | None:
+        """Return the Polars expressions for the partial aggregates of this aggregation, or ``None`` if the
+        aggregation cannot be built up from partial aggregates.
+
+        Partial aggregates of a fine period can be combined (see ``combine_expr``) into the partial aggregates of
+        a coarser period, without going back to the original data. The ``count_<column>`` columns are always
+        available alongside the partial aggregates.
+        """
+        return None
+
+    def combine_expr(self, _ctx: AggregationCtx, _columns: list[str]) -> list[pl.Expr]:
+        """Return the Polars expressions combining the partial aggregates of the periods in a group."""
+        return []
+
+    def final_expr(self, _ctx: AggregationCtx, _columns: list[str]) -> list[pl.Expr]:
+        """Return the Polars expressions computing the result of this aggregation from its partial aggregates."""
+        return []
+
+
+AggregationFunctionSpec = str | type[AggregationFunction] | AggregationFunction
+MultiAggregationSpec = (
+    AggregationFunctionSpec
+    | Sequence[AggregationFunctionSpec]
+    | Mapping[str, AggregationFunctionSpec | Sequence[AggregationFunctionSpec]]
+)
+
+
+class MultiAggregation(AggregationFunction):
+    """An aggregation that combines several aggregation functions, each applied to its own columns.
+
+    The expressions of all the functions are evaluated together, so the data is only grouped once and the
+    ``count_*``, ``expected_count_*`` and ``valid_*`` columns are shared between the functions.
+
+    Args:
+        functions: Pairs of an aggregation function and the columns it is applied to.
+    """
+
+    name = "multi"
+
+    def __init__(self, functions: list[tuple[AggregationFunction, list[str]]]):
+        super().__init__()
+        self.functions = functions
+
+    @classmethod
+    def resolve(
+        cls, spec: MultiAggregationSpec, columns: str | list[str], **kwargs
+    ) -> tuple[AggregationFunction, list[str]]:
+        """Resolve the aggregation function(s) requested by the user, and the columns that they are applied to.
+
+        Args:
+            spec: The aggregation function(s) to apply:
+
+                - a single function (name, class or instance), applied to ``columns``
+                - a sequence of functions, each applied to ``columns``
+                - a mapping of column name to the function(s) applied to that column, in which case ``columns``
+                  is ignored
+            columns: The column(s) to apply the functions to, when ``spec`` is not a mapping.
+            **kwargs: Parameters used to initialise the functions given by name or class. Functions given as instances
+                are used as-is, so use instances to configure functions with different parameters.
+
+        Returns:
+            The aggregation function, and all of the columns that it aggregates.
+
+        Raises:
+            AggregationError: If no aggregation functions are given.
+        """
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        if isinstance(spec, (str, type, AggregationFunction)):
+            return AggregationFunction.get(spec, **kwargs), columns
+
+        if isinstance(spec, Mapping):
+            functions = []
+            for column, column_spec in spec.items():
+                column_specs = (
+                    [column_spec] if isinstance(column_spec, (str, type, AggregationFunction)) else column_spec
+                )
+                functions.extend((AggregationFunction.get(s, **kwargs), [column]) for s in column_specs)
+            columns = list(spec.keys())
+        else:
+            functions = [(AggregationFunction.get(s, **kwargs), columns) for s in spec]
+
+        if not functions:
+            raise AggregationError("At least one aggregation function must be given.")
+        return cls(functions), columns
+
+    def expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Return the Polars expressions of all the aggregation functions.
+
+        Raises:
+            AggregationError: If two of the functions produce a column with the same name.
+        """
+        expressions = [e for func, func_columns in self.functions for e in func.expr(ctx, func_columns)]
+        names = [e.meta.output_name() for e in expressions]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise AggregationError(
+                f"Aggregation functions produce duplicate columns: {duplicates}. "
+                "Aggregate these functions in separate calls."
+            )
+        return expressions
+
+    def post_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Return the post-aggregation Polars expressions of all the aggregation functions."""
+        return [e for func, func_columns in self.functions for e in func.post_expr(ctx, func_columns)]
+
+    def partial_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr] | None:
+        """Return the partial aggregate expressions of all the aggregation functions, or ``None`` if any of the
+        functions cannot be built up from partial aggregates."""
+        expressions = []
+        for func, func_columns in self.functions:
+            partial = func.partial_expr(ctx, func_columns)
+            if partial is None:
+                return None
+            expressions.extend(partial)
+        return expressions
+
+    def combine_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Return the partial aggregate combining expressions of all the aggregation functions."""
+        return [e for func, func_columns in self.functions for e in func.combine_expr(ctx, func_columns)]
+
+    def final_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Return the expressions computing the results of all the aggregation functions from partial aggregates."""
+        return [e for func, func_columns in self.functions for e in func.final_expr(ctx, func_columns)]
+
+
+def validate_aggregation_period(aggregation_period: Period, periodicity: Period) -> None:
+    """Validate that data of a periodicity can be grouped into fixed aggregation periods.
+
+    Args:
+        aggregation_period: The period to aggregate into.
+        periodicity: The periodicity of the time series.
+
+    Raises:
+        AggregationPeriodError: If the aggregation period is not epoch agnostic, or the periodicity is not a subperiod
+            of the aggregation period.
+    """
+    if not aggregation_period.is_epoch_agnostic():
+        raise AggregationPeriodError(
+            f"Non-epoch agnostic aggregation periods are not supported: '{aggregation_period}'."
+        )
+    if not periodicity.is_subperiod_of(aggregation_period):
+        raise AggregationPeriodError(
+            f"Incompatible aggregation period '{aggregation_period}' with TimeFrame periodicity "
+            f"'{periodicity}'. TimeFrame periodicity must be a subperiod of the aggregation period."
+        )
+
+
+def group_by_period(
+    df: pl.LazyFrame,
+    time_name: str,
+    aggregation_period: Period,
+    time_anchor: TimeAnchor,
+    aggregation_time_anchor: TimeAnchor,
+    group_by: str | list[str] | None = None,
+) -> LazyGroupBy:
+    """Group a time series into fixed aggregation periods, using ``group_by_dynamic``.
+
+    Args:
+        df: The time series data.
+        time_name: The name of the time column.
+        aggregation_period: The period to aggregate into.
+        time_anchor: The time anchor of the time series, which decides the period that a boundary time falls into.
+        aggregation_time_anchor: The time anchor for the output timestamps of the periods.
+        group_by: Optional column(s) to also group by, within each period.
+
+    Returns:
+        The Polars grouper.
+    """
+    label = "right" if aggregation_time_anchor == "end" else "left"
+    closed = "right" if time_anchor == "end" else "left"
+    return df.group_by_dynamic(
+        index_column=time_name,
+        every=aggregation_period.pl_interval,
+        offset=aggregation_period.pl_offset,
+        closed=closed,
+        label=label,
+        group_by=group_by,
+    )
+
+
+def _mean_from_sum_expr(sum_name: str, column: str) -> pl.Expr:
+    """A Polars expression for the mean of a column, from the partial aggregates of its sum and count.
+
+    Args:
+        sum_name: The name of the column holding the sum of the values.
+        column: The name of the aggregated column.
+
+    Returns:
+        Polars expression for the mean, which is null when there are no values.
+    """
+    count = pl.col(f"count_{column}")
+    return pl.when(count > 0).then(pl.col(sum_name) / count)
+
+
+def _local_datetime(value: date, time_dtype: pl.DataType) -> datetime:
+    """The wall-clock time of a time value in the time zone of a time column.
+
+    ``group_by_dynamic`` groups the rows of a time zone aware column by their local time, so aggregation periods are
+    found from the naive local time of a value rather than from the time in its own time zone.
+
+    Args:
+        value: The time value.
+        time_dtype: The data type of the time column.
+
+    Returns:
+        The naive local datetime of the time value.
+    """
+    if not isinstance(value, datetime):
+        return datetime.combine(value, datetime.min.time())
+    time_zone = getattr(time_dtype, "time_zone", None)
+    if value.tzinfo is not None and time_zone is not None:
+        value = value.astimezone(ZoneInfo(time_zone))
+    return value.replace(tzinfo=None)
+
+
+def _time_lit(value: datetime, time_dtype: pl.DataType) -> pl.Expr:
+    """A Polars literal of a wall-clock time, with the data type (and time zone) of a time column.
+
+    Args:
+        value: The naive local datetime.
+        time_dtype: The data type of the time column.
+
+    Returns:
+        Polars literal expression of the time.
+    """
+    time_zone = getattr(time_dtype, "time_zone", None)
+    if time_zone is None:
+        return pl.lit(value).cast(time_dtype)
+    naive_dtype = pl.Datetime(time_dtype.time_unit)
+    return pl.lit(value.replace(tzinfo=None)).cast(naive_dtype).dt.replace_time_zone(time_zone, ambiguous="earliest")
+
 
 class AggregationPipeline(ABC):
     """Abstract base class for aggregation pipelines.
@@ -97,9 +333,19 @@ class AggregationPipeline(ABC):
         Returns:
             The aggregated DataFrame.
         """
+        return self.execute_lazy().collect()
+
+    def execute_lazy(self) -> pl.LazyFrame:
+        """Build the aggregation pipeline as a Polars query plan, without executing it.
+
+        The context DataFrame may be a ``LazyFrame``, in which case the aggregation is appended to its query plan.
+
+        Returns:
+            The query plan of the aggregation.
+        """
         self._validate()
 
-        df = self._prepare_df(self.ctx.df)
+        df = self._prepare_df(self.ctx.df.lazy())
         grouper = self._get_grouper(df)
 
         # Build expressions to go in the .agg method
@@ -125,7 +371,7 @@ class AggregationPipeline(ABC):
 
         return df
 
-    def _prepare_df(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _prepare_df(self, df: pl.LazyFrame) -> pl.LazyFrame:
         """Pre-process the DataFrame before grouping.
 
          Default is to do nothing - subclasses can override this.
@@ -144,7 +390,7 @@ class AggregationPipeline(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def _get_grouper(self, df: pl.DataFrame) -> DynamicGroupBy | RollingGroupBy:
+    def _get_grouper(self, df: pl.LazyFrame) -> LazyGroupBy:
         """Return the Polars grouper (e.g. ``group_by_dynamic`` or ``rolling``).
 
         Args:
@@ -170,7 +416,8 @@ class AggregationPipeline(ABC):
 
     def _validate_common(self) -> None:
         """Carry out validation checks common to all pipeline types."""
-        if self.ctx.df.is_empty():
+        # The size of a lazy query plan is only known once it is collected
+        if isinstance(self.ctx.df, pl.DataFrame) and self.ctx.df.is_empty():
             raise AggregationError("Cannot aggregate an empty DataFrame.")
         check_columns_in_dataframe(self.ctx.df, self.columns + [self.ctx.time_name])
 
@@ -313,11 +560,195 @@ class StandardAggregationPipeline(AggregationPipeline):
         time_window: TimeWindow | None = None,
     ):
         super().__init__(agg_func, ctx, aggregation_period, columns, missing_criteria)
-        self.aggregation_time_anchor = (
+        self.aggregation_time_anchor: TimeAnchor = (
             aggregation_time_anchor if aggregation_time_anchor is not None else ctx.time_anchor
         )
         self.time_window = time_window
 
+    def execute_chunked(self, chunks: Iterable[pl.DataFrame] | pl.LazyFrame) -> Iterator[pl.DataFrame]:
+        """Run the aggregation pipeline over a source that is read in time-ordered chunks.
+
+        Each chunk is cut at the start of the last aggregation period it reaches. The rows of that (possibly
+        incomplete) period are carried over to the next chunk, so every aggregation period is aggregated from all
+        of its rows, in a single pass of the eager pipeline. The concatenated results are therefore identical to
+        those of :meth:`execute` on the whole series, while only one chunk (plus one aggregation period) of the
+        input is held in memory at a time.
+
+        The DataFrame of the context is not aggregated; it is only used for validating the aggregation.
+
+        Args:
+            chunks: An iterable of DataFrames, or a LazyFrame that is collected in batches by the streaming engine.
+                The rows must be in strictly increasing time order, within and across chunks.
+
+        Yields:
+            The aggregated DataFrame of each chunk of complete aggregation periods, in time order.
+
+        Raises:
+            AggregationError: If the chunks are not in time order.
+        """
+        self._validate()
+        if isinstance(chunks, pl.LazyFrame):
+            chunks = chunks.collect_batches(maintain_order=True)
+
+        time_name = self.ctx.time_name
+        carry: pl.DataFrame | None = None
+        for chunk in chunks:
+            if chunk.is_empty():
+                continue
+            if not chunk[time_name].is_sorted() or (carry is not None and chunk[time_name][0] <= carry[time_name][-1]):
+                raise AggregationError("Chunked aggregation requires the chunks to be in time order.")
+
+            df = chunk if carry is None else pl.concat([carry, chunk], rechunk=False)
+            open_period = self._open_period_expr(df[time_name][-1], df.schema[time_name])
+            if df.head(1).select(open_period).item():
+                # All the rows so far are in the same aggregation period, so there is nothing to aggregate yet
+                carry = df
+                continue
+            complete, carry = df.filter(~open_period), df.filter(open_period)
+            if carry.is_empty():
+                carry = None
+            yield self._with_ctx_df(complete).execute()
+
+        if carry is not None:
+            yield self._with_ctx_df(carry).execute()
+
+    def execute_update(self, previous: pl.DataFrame, start: date, end: date) -> pl.DataFrame:
+        """Update the result of a previous aggregation after the data within a time range has changed.
+
+        Only the aggregation periods that the time range touches are aggregated again, from the rows of the context
+        DataFrame within those periods. The new aggregates replace those periods in the previous result, and all other
+        periods are kept as they were, so the cost depends on the size of the time range rather than of the series.
+
+        Args:
+            previous: The previous result of this aggregation pipeline.
+            start: The start of the time range of the changed data (inclusive).
+            end: The end of the time range of the changed data (inclusive).
+
+        Returns:
+            The updated aggregated DataFrame.
+
+        Raises:
+            AggregationError: If the end of the time range is before the start, or the columns of the previous result
+                do not match the columns of this aggregation.
+        """
+        if end < start:
+            raise AggregationError(f"End of the changed time range '{end}' is before the start '{start}'.")
+        self._validate()
+
+        # The schema of the aggregation is known from its query plan, without aggregating any data
+        expected_columns = self.execute_lazy().collect_schema().names()
+        if set(previous.columns) != set(expected_columns):
+            missing = [column for column in expected_columns if column not in previous.columns]
+            unexpected = [column for column in previous.columns if column not in expected_columns]
+            raise AggregationError(
+                "Previous aggregation columns do not match the aggregation function(s) and columns given. "
+                f"Missing: {missing}; unexpected: {unexpected}."
+            )
+        previous = previous.select(expected_columns)
+
+        time_name = self.ctx.time_name
+        time_dtype = self.ctx.df.collect_schema()[time_name]
+        first, last = self._period_ordinal(start, time_dtype), self._period_ordinal(end, time_dtype)
+
+        # Recompute the touched periods from all of their rows, not only the changed ones
+        rows = self.ctx.df.lazy().filter(self._periods_expr(first, last, time_dtype)).collect()
+
+        # Labels of the touched periods in the previous result, which are replaced by the new aggregates
+        period = self.aggregation_period
+        label_shift = 1 if self.aggregation_time_anchor == "end" else 0
+        label_dtype = previous.schema[time_name]
+        first_label = _time_lit(period.datetime(first + label_shift), label_dtype)
+        last_label = _time_lit(period.datetime(last + label_shift), label_dtype)
+
+        parts = [previous.filter(pl.col(time_name) < first_label)]
+        if not rows.is_empty():
+            # All rows of a touched period may have been removed, in which case it is dropped from the result
+            parts.append(self._with_ctx_df(rows).execute().cast(previous.schema))
+        parts.append(previous.filter(pl.col(time_name) > last_label))
+        return pl.concat(parts)
+
+    def _period_ordinal(self, value: date, time_dtype: pl.DataType) -> int:
+        """The ordinal of the aggregation period that the rows at a time value are aggregated into.
+
+        Args:
+            value: The time value.
+            time_dtype: The data type of the time column.
+
+        Returns:
+            The ordinal of the aggregation period.
+        """
+        value = _local_datetime(value, time_dtype)
+        if self.ctx.time_anchor == "end":
+            # Periods are closed on the right, so a time on a period boundary belongs to the period it ends
+            value = value - timedelta(microseconds=1)
+        return self.aggregation_period.ordinal(value)
+
+    def _periods_expr(self, first: int, last: int, time_dtype: pl.DataType) -> pl.Expr:
+        """A Polars expression selecting the rows of a range of aggregation periods.
+
+        Args:
+            first: The ordinal of the first aggregation period.
+            last: The ordinal of the last aggregation period.
+            time_dtype: The data type of the time column.
+
+        Returns:
+            Boolean Polars expression, True for the rows within the aggregation periods.
+        """
+        period = self.aggregation_period
+        start = _time_lit(period.datetime(first), time_dtype)
+        end = _time_lit(period.datetime(last + 1), time_dtype)
+        closed = "right" if self.ctx.time_anchor == "end" else "left"
+        return pl.col(self.ctx.time_name).is_between(start, end, closed=closed)
+
+    def _open_period_expr(self, last_time: date, time_dtype: pl.DataType) -> pl.Expr:
+        """A Polars expression selecting the rows of the aggregation period that the last time of a chunk is in.
+
+        This period may continue into the next chunk, so its rows cannot yet be aggregated.
+
+        Args:
+            last_time: The last time value of the chunk.
+            time_dtype: The data type of the time column.
+
+        Returns:
+            Boolean Polars expression, True for the rows of the last aggregation period.
+        """
+        last_time = _local_datetime(last_time, time_dtype)
+
+        period = self.aggregation_period
+        time_col = pl.col(self.ctx.time_name)
+        if self.ctx.time_anchor == "end":
+            # Periods are closed on the right, so a time on a period boundary belongs to the period it ends
+            start = period.datetime(period.ordinal(last_time - timedelta(microseconds=1)))
+            return time_col > _time_lit(start, time_dtype)
+        start = period.datetime(period.ordinal(last_time))
+        return time_col >= _time_lit(start, time_dtype)
+
+    def _with_ctx_df(self, df: pl.DataFrame) -> "StandardAggregationPipeline":
+        """Return a copy of this pipeline, aggregating a different DataFrame.
+
+        Args:
+            df: The DataFrame to aggregate.
+
+        Returns:
+            The new pipeline.
+        """
+        pipeline = copy(self)
+        pipeline.ctx = replace(self.ctx, df=df)
+        return pipeline
+
+    def _with_anchor(self, aggregation_time_anchor: TimeAnchor) -> "StandardAggregationPipeline":
+        """Return a copy of this pipeline, with a different time anchor for the output timestamps.
+
+        Args:
+            aggregation_time_anchor: The time anchor for the output timestamps.
+
+        Returns:
+            The new pipeline.
+        """
+        pipeline = copy(self)
+        pipeline.aggregation_time_anchor = aggregation_time_anchor
+        return pipeline
+
     def _validate(self) -> None:
         """Validate period compatibility and time_window settings."""
         self._validate_common()
@@ -326,15 +757,7 @@ class StandardAggregationPipeline(AggregationPipeline):
 
     def _validate_period_compatibility(self) -> None:
         """Validate that the aggregation period is compatible with the time series periodicity."""
-        if not self.aggregation_period.is_epoch_agnostic():
-            raise AggregationPeriodError(
-                f"Non-epoch agnostic aggregation periods are not supported: '{self.aggregation_period}'."
-            )
-        if not self.ctx.periodicity.is_subperiod_of(self.aggregation_period):
-            raise AggregationPeriodError(
-                f"Incompatible aggregation period '{self.aggregation_period}' with TimeFrame periodicity "
-                f"'{self.ctx.periodicity}'. TimeFrame periodicity must be a subperiod of the aggregation period."
-            )
+        validate_aggregation_period(self.aggregation_period, self.ctx.periodicity)
 
     def _validate_time_window(self) -> None:
         """Validate that the time_window, if provided, is compatible with the aggregation."""
@@ -347,10 +770,10 @@ class StandardAggregationPipeline(AggregationPipeline):
         if periodicity_td is None or periodicity_td >= timedelta(days=1):
             raise TimeWindowError("'time_window' requires the data periodicity to be sub-daily.")
 
-    def _prepare_df(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _prepare_df(self, df: pl.LazyFrame) -> pl.LazyFrame:
         """Filter rows to the time-of-day window if one is set."""
         if self.time_window:
-            return self.time_window.filter_df(df, self.ctx.time_name)
+            return df.filter(self.time_window.filter_expr(self.ctx.time_name))
         return df
 
     def _get_label_closed(self) -> tuple[str, str]:
@@ -363,15 +786,10 @@ class StandardAggregationPipeline(AggregationPipeline):
         closed = "right" if self.ctx.time_anchor == "end" else "left"
         return label, closed
 
-    def _get_grouper(self, df: pl.DataFrame) -> DynamicGroupBy:
+    def _get_grouper(self, df: pl.LazyFrame) -> LazyGroupBy:
         """Return a ``group_by_dynamic`` grouper for fixed-period aggregation."""
-        label, closed = self._get_label_closed()
-        return df.group_by_dynamic(
-            index_column=self.ctx.time_name,
-            every=self.aggregation_period.pl_interval,
-            offset=self.aggregation_period.pl_offset,
-            closed=closed,  # type: ignore[arg-type] - Polars Literal is a string
-            label=label,  # type: ignore[arg-type] - Polars Literal is a string
+        return group_by_period(
+            df, self.ctx.time_name, self.aggregation_period, self.ctx.time_anchor, self.aggregation_time_anchor
         )
 
     def _static_expected_count_expr(self) -> pl.Expr | None:
@@ -405,6 +823,155 @@ class StandardAggregationPipeline(AggregationPipeline):
         return self._count_between_expr(start_expr, end_expr, closed)
 
 
+class AggregationCascade:
+    """Aggregates data into several periods, building each period from the partial aggregates of a finer period where
+    possible, rather than from the original data.
+
+    A period can be built from a finer period if the finer period is a subperiod of it (e.g. days from hours, or
+    months from days, but not weeks from months), and the aggregation function supports partial aggregates (see
+    :meth:`AggregationFunction.partial_expr`). Otherwise, the period is aggregated from the original data. The expected
+    counts are calculated for each period from the periodicity of the original data, so the results are the same as
+    aggregating the original data into each period separately.
+
+    Args:
+        agg_func: The aggregation function to apply.
+        ctx: Immutable aggregation context (DataFrame, time column, anchor, periodicity).
+        aggregation_periods: The periods to aggregate into.
+        columns: The column(s) to aggregate.
+        missing_criteria: Optional completeness requirement as ``(policy, threshold)``.
+        aggregation_time_anchor: The time anchor for output timestamps. Defaults to the input anchor.
+    """
+
+    def __init__(
+        self,
+        agg_func: AggregationFunction,
+        ctx: AggregationCtx,
+        aggregation_periods: list[Period],
+        columns: str | list[str],
+        missing_criteria: tuple[MissingCriteria, float | int] | None = None,
+        aggregation_time_anchor: TimeAnchor | None = None,
+    ):
+        self.agg_func = agg_func
+        self.ctx = ctx
+        self.aggregation_periods = aggregation_periods
+        self.columns = [columns] if isinstance(columns, str) else columns
+        self.missing_criteria = missing_criteria
+        self.aggregation_time_anchor: TimeAnchor = (
+            aggregation_time_anchor if aggregation_time_anchor is not None else ctx.time_anchor
+        )
+
+    def execute(self) -> list[pl.DataFrame]:
+        """Run the aggregation into each of the periods.
+
+        Returns:
+            The aggregated DataFrame for each aggregation period, in the order of ``aggregation_periods``.
+        """
+        pipelines = [self._pipeline(period) for period in self.aggregation_periods]
+        for pipeline in pipelines:
+            pipeline._validate()
+
+        if self.agg_func.partial_expr(self.ctx, self.columns) is None:
+            return [pipeline._with_anchor(self.aggregation_time_anchor).execute() for pipeline in pipelines]
+
+        partials: dict[int, pl.DataFrame] = {}
+        for i in self._finest_first():
+            # Build from the computed period with the fewest rows that nests within this one
+            sources = [j for j in partials if self.aggregation_periods[j].is_subperiod_of(self.aggregation_periods[i])]
+            source = min((partials[j] for j in sources), key=len) if sources else None
+            partials[i] = self._partial_df(pipelines[i], source)
+
+        return [self._final_df(pipeline, partials[i]) for i, pipeline in enumerate(pipelines)]
+
+    def _pipeline(self, aggregation_period: Period) -> StandardAggregationPipeline:
+        """Build the pipeline of the partial aggregates for one of the aggregation periods.
+
+        The partial aggregates are labelled on the closed side of each period, so that the periods nest within the
+        coarser periods under the same ``closed`` semantics as the original data.
+
+        Args:
+            aggregation_period: The aggregation period.
+
+        Returns:
+            The pipeline.
+        """
+        return StandardAggregationPipeline(
+            self.agg_func,
+            replace(self.ctx, aggregation_period=aggregation_period),
+            aggregation_period,
+            self.columns,
+            missing_criteria=self.missing_criteria,
+            aggregation_time_anchor="end" if self.ctx.time_anchor == "end" else "start",
+        )
+
+    def _finest_first(self) -> list[int]:
+        """Order the aggregation periods so that each period comes after all of its subperiods.
+
+        Returns:
+            The indices of the aggregation periods, in order.
+        """
+        periods = self.aggregation_periods
+        pending = list(range(len(periods)))
+        order = []
+        while pending:
+            # Take a period that has no (strictly) finer subperiods still to compute
+            i = next(
+                i
+                for i in pending
+                if not any(
+                    periods[j].is_subperiod_of(periods[i]) and not periods[i].is_subperiod_of(periods[j])
+                    for j in pending
+                )
+            )
+            pending.remove(i)
+            order.append(i)
+        return order
+
+    def _partial_df(self, pipeline: StandardAggregationPipeline, source: pl.DataFrame | None) -> pl.DataFrame:
+        """Compute the partial aggregates of an aggregation period.
+
+        Args:
+            pipeline: The pipeline of the aggregation period.
+            source: The partial aggregates of a finer aggregation period, or None to aggregate the original data.
+
+        Returns:
+            DataFrame of the partial aggregates, with the actual and expected counts.
+        """
+        ctx = pipeline.ctx
+        if source is None:
+            df = pipeline._prepare_df(ctx.df.lazy())
+            agg_expressions = [*(self.agg_func.partial_expr(ctx, self.columns) or []), *pipeline._actual_count_expr()]
+        else:
+            df = source.lazy()
+            agg_expressions = [
+                *self.agg_func.combine_expr(ctx, self.columns),
+                *[pl.col(f"count_{col}").sum().cast(pl.UInt32) for col in self.columns],
+            ]
+        return pipeline._get_grouper(df).agg(agg_expressions).with_columns(pipeline._expected_count_expr()).collect()
+
+    def _final_df(self, pipeline: StandardAggregationPipeline, partial: pl.DataFrame) -> pl.DataFrame:
+        """Compute the aggregation result of an aggregation period from its partial aggregates.
+
+        Args:
+            pipeline: The pipeline of the aggregation period.
+            partial: The partial aggregates of the aggregation period.
+
+        Returns:
+            The aggregated DataFrame, with the same columns as the standard aggregation pipeline.
+        """
+        ctx = pipeline.ctx
+        df = partial.lazy().with_columns(self.agg_func.final_expr(ctx, self.columns))
+        df = df.with_columns([*pipeline._missing_data_expr(), *self.agg_func.post_expr(ctx, self.columns)])
+
+        # Move the labels to the side of each period given by the requested time anchor
+        label_right = pipeline.aggregation_time_anchor == "end"
+        if label_right != (self.aggregation_time_anchor == "end"):
+            interval = pipeline.aggregation_period.pl_interval
+            df = df.with_columns(pl.col(ctx.time_name).dt.offset_by(f"-{interval}" if label_right else interval))
+
+        columns = pipeline._with_anchor(self.aggregation_time_anchor).execute_lazy().collect_schema().names()
+        return df.select(columns).collect()
+
+
 class RollingAggregationPipeline(AggregationPipeline):
     """Aggregation pipeline that slides a window over the data using ``rolling``.
 
@@ -474,7 +1041,7 @@ class RollingAggregationPipeline(AggregationPipeline):
             half_us = int(td.total_seconds() * 1_000_000) // 2
             return "both", f"-{half_us}us"
 
-    def _get_grouper(self, df: pl.DataFrame) -> RollingGroupBy:
+    def _get_grouper(self, df: pl.LazyFrame) -> LazyGroupBy:
         """Return a ``rolling`` grouper for sliding-window aggregation."""
         closed, offset = self._get_rolling_params()
         rolling_kwargs: dict = {
@@ -518,6 +1085,18 @@ class Mean(AggregationFunction):
         """Return the `Polars` expression for calculating the mean in an aggregation period."""
         return [pl.col(col).mean().alias(f"mean_{col}") for col in columns]
 
+    def partial_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """The mean is built up from the sum of the values, and the count of the values."""
+        return [pl.col(col).sum().alias(f"__{self.name}_sum_{col}") for col in columns]
+
+    def combine_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Add up the sums of the periods in the group."""
+        return [pl.col(f"__{self.name}_sum_{col}").sum() for col in columns]
+
+    def final_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Divide the sum by the count of the values."""
+        return [_mean_from_sum_expr(f"__{self.name}_sum_{col}", col).alias(f"{self.name}_{col}") for col in columns]
+
 
 @AggregationFunction.register
 class AngularMean(AggregationFunction):
@@ -555,6 +1134,14 @@ class Sum(AggregationFunction):
         """Return the `Polars` expression for calculating the sum in an aggregation period."""
         return [pl.col(col).sum().alias(f"sum_{col}") for col in columns]
 
+    def partial_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """The sum of a period is its own partial aggregate."""
+        return self.expr(ctx, columns)
+
+    def combine_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Add up the sums of the periods in the group."""
+        return [pl.col(f"sum_{col}").sum() for col in columns]
+
 
 @AggregationFunction.register
 class MeanSum(AggregationFunction):
@@ -568,6 +1155,18 @@ class MeanSum(AggregationFunction):
         counts, which is calculated after in the post_expr method."""
         return [pl.col(col).mean().alias(f"mean_sum_{col}") for col in columns]
 
+    def partial_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """The mean is built up from the sum of the values, and the count of the values."""
+        return [pl.col(col).sum().alias(f"__{self.name}_sum_{col}") for col in columns]
+
+    def combine_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Add up the sums of the periods in the group."""
+        return [pl.col(f"__{self.name}_sum_{col}").sum() for col in columns]
+
+    def final_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Divide the sum by the count of the values, to give the mean that is used by the post expression."""
+        return [_mean_from_sum_expr(f"__{self.name}_sum_{col}", col).alias(f"{self.name}_{col}") for col in columns]
+
     def post_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
         """Multiply the mean by the expected count to get the mean sum."""
         return [
@@ -596,6 +1195,18 @@ class Min(AggregationFunction):
             )
         return expressions
 
+    def partial_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """The minimum of a period, and its datetime, are their own partial aggregates."""
+        return self.expr(ctx, columns)
+
+    def combine_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Take the minimum of the periods in the group, and the datetime it occurred on."""
+        expressions = []
+        for col in columns:
+            value, time_of = f"{self.name}_{col}", f"{ctx.time_name}_of_{self.name}_{col}"
+            expressions.extend([pl.col(value).min(), pl.col(time_of).get(pl.col(value).arg_min())])
+        return expressions
+
 
 @AggregationFunction.register
 class Max(AggregationFunction):
@@ -617,6 +1228,18 @@ class Max(AggregationFunction):
             )
         return expressions
 
+    def partial_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """The maximum of a period, and its datetime, are their own partial aggregates."""
+        return self.expr(ctx, columns)
+
+    def combine_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Take the maximum of the periods in the group, and the datetime it occurred on."""
+        expressions = []
+        for col in columns:
+            value, time_of = f"{self.name}_{col}", f"{ctx.time_name}_of_{self.name}_{col}"
+            expressions.extend([pl.col(value).max(), pl.col(time_of).get(pl.col(value).arg_max())])
+        return expressions
+
 
 @AggregationFunction.register
 class Percentile(AggregationFunction):
@@ -694,6 +1317,48 @@ class StDev(AggregationFunction):
         """Return the `Polars` expression for calculating the standard deviation in an aggregation period."""
         return [pl.col(col).std().alias(f"{self.name}_{col}") for col in columns]
 
+    def partial_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """The standard deviation is built up from the count, the mean and the sum of squared differences from the
+        mean of the values. These are used rather than the sum of squares, which loses precision when the values are
+        large compared to their spread."""
+        expressions = []
+        for col in columns:
+            expressions.extend(
+                [
+                    pl.col(col).mean().alias(f"__{self.name}_mean_{col}"),
+                    (pl.col(col) - pl.col(col).mean()).pow(2).sum().alias(f"__{self.name}_m2_{col}"),
+                ]
+            )
+        return expressions
+
+    def combine_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Combine the means and squared differences of the periods in the group (Chan et al. parallel algorithm)."""
+        expressions = []
+        for col in columns:
+            count, mean, m2 = (
+                pl.col(f"count_{col}"),
+                pl.col(f"__{self.name}_mean_{col}"),
+                pl.col(f"__{self.name}_m2_{col}"),
+            )
+            # The mean is null, rather than NaN, for groups without any values, so it can be combined again
+            group_mean = pl.when(count.sum() > 0).then((count * mean).sum() / count.sum())
+            expressions.extend(
+                [
+                    group_mean.alias(f"__{self.name}_mean_{col}"),
+                    (m2.sum() + (count * (mean - group_mean).pow(2)).sum()).alias(f"__{self.name}_m2_{col}"),
+                ]
+            )
+        return expressions
+
+    def final_expr(self, ctx: AggregationCtx, columns: list[str]) -> list[pl.Expr]:
+        """Compute the (sample) standard deviation from the sum of squared differences from the mean."""
+        return [
+            pl.when(pl.col(f"count_{col}") > 1)
+            .then((pl.col(f"__{self.name}_m2_{col}") / (pl.col(f"count_{col}") - 1)).sqrt())
+            .alias(f"{self.name}_{col}")
+            for col in columns
+        ]
+
 
 @AggregationFunction.register
 class Nth(AggregationFunction):
@@ -33,37 +33,53 @@ Main responsibilities
 
 from __future__ import annotations
 
-from copy import deepcopy
+import weakref
+from copy import copy, deepcopy
 from datetime import datetime, time
-from typing import Any, Sequence, Type, overload
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Sequence, Type, overload
 
 import polars as pl
 
+from time_stream import persistence
 from time_stream.aggregation import (
+    AggregationCascade,
     AggregationCtx,
-    AggregationFunction,
+    MultiAggregation,
+    MultiAggregationSpec,
     RollingAggregationPipeline,
     StandardAggregationPipeline,
+    group_by_period,
+    validate_aggregation_period,
 )
 from time_stream.calculations import calculate_min_max_envelope
 from time_stream.exceptions import (
+    AggregationError,
     ColumnNotFoundError,
     ColumnTypeError,
     DuplicateColumnError,
+    InfillError,
     MetadataError,
+    TimeOrderError,
 )
 from time_stream.flags.flag_manager import (
     CategoricalSingleFlagColumn,
     FlagColumn,
+    FlagColumnUpdate,
     FlagManager,
+    FlagStorageLiteral,
     FlagSystemType,
+    FlagUpdateSpec,
 )
 from time_stream.flags.flag_system import FlagSystemBase, FlagSystemLiteral
 from time_stream.formatting import timeframe_repr
-from time_stream.infill import InfillMethod
+from time_stream.infill import InfillCtx, InfillMethod, InfillMethodPipeline, MultiInfillSpec
+from time_stream.lazy import LazyTimeFrame
 from time_stream.metadata import ColumnMetadataDict
 from time_stream.period import Period
-from time_stream.qc import QCCheck
+from time_stream.persistence import IpcCompression, TimeFrameState
+from time_stream.qc import QCCheck, QcCheckSpec, QcCtx, QcSuitePipeline
 from time_stream.time_manager import TimeManager
 from time_stream.types import (
     ClosedInterval,
@@ -73,7 +89,14 @@ from time_stream.types import (
     TimeAnchor,
     ValidationErrorOptions,
 )
-from time_stream.utils import TimeWindow, check_columns_in_dataframe, configure_period_object, pad_time
+from time_stream.utils import (
+    TimeWindow,
+    check_columns_in_dataframe,
+    configure_period_object,
+    gap_index,
+    pad_time,
+    sort_by_column,
+)
 
 
 class TimeFrame:
@@ -172,6 +195,8 @@ class TimeFrame:
     _flag_manager: FlagManager
     _metadata: dict[str, Any]
     _column_metadata: ColumnMetadataDict
+    _metadata_shared: bool
+    _gap_cache: dict[str, tuple[weakref.ref[pl.DataFrame], pl.DataFrame]]
 
     def __init__(
         self,
@@ -202,11 +227,44 @@ class TimeFrame:
 
         self._metadata = {}
         self._column_metadata = ColumnMetadataDict(lambda: self.df.columns)
+        self._metadata_shared = False
         self._flag_manager = FlagManager()
+        self._gap_cache = {}
+
+    @classmethod
+    def _from_validated(cls, df: pl.DataFrame, time_manager: TimeManager) -> TimeFrame:
+        """Build a TimeFrame from data that is already known to satisfy the time properties of ``time_manager``.
+
+        This is an internal construction path for results derived by the package itself (e.g. aggregation output),
+        where the pipeline guarantees the time values are unique, sorted and aligned. It skips the duplicate
+        handling, alignment / periodicity validation and sorting carried out by the public constructor.
+
+        The ``time_manager`` acts as the proof of the invariants: it must describe the time properties that the
+        producing pipeline has guaranteed for ``df``.
+
+        Args:
+            df: The time series data, with unique, sorted time values that conform to ``time_manager``.
+            time_manager: The time manager describing the time properties of ``df``.
+
+        Returns:
+            A new TimeFrame, with no metadata or flag systems.
+        """
+        tf = cls.__new__(cls)
+        tf._time_manager = time_manager
+        tf._df = df
+        tf._metadata = {}
+        tf._column_metadata = ColumnMetadataDict(lambda: tf.df.columns)
+        tf._metadata_shared = False
+        tf._flag_manager = FlagManager()
+        tf._gap_cache = {}
+        return tf
 
     def copy(self, share_df: bool = True) -> TimeFrame:
         """Return a shallow copy of this ``TimeFrame``, either sharing or cloning the underlying DataFrame.
 
+        The time values of this TimeFrame are already validated, so the copy is not re-validated. Metadata is
+        copy-on-write: it is shared between this TimeFrame and the copy until either of them accesses it.
+
         Args:
             share_df: If True, the copy references the same DataFrame object. If False, a cloned DataFrame is used.
 
@@ -214,36 +272,148 @@ class TimeFrame:
             A copy of this TimeFrame
         """
         df = self.df if share_df else self.df.clone()
-        out = TimeFrame(
-            df,
-            time_name=self.time_name,
-            resolution=self.resolution,
-            offset=self.offset,
-            periodicity=self.periodicity,
-            time_anchor=self.time_anchor,
-        )
+        out = TimeFrame._from_validated(df, copy(self._time_manager))
 
-        out.metadata = deepcopy(self._metadata)
-        out.column_metadata.update(deepcopy(self._column_metadata))
+        out._metadata = self._metadata
+        out._column_metadata.update(self._column_metadata)
+        out._metadata_shared = self._metadata_shared = True
 
         out._flag_manager = self._flag_manager.copy()
 
         return out
 
-    def with_df(self, new_df: pl.DataFrame) -> TimeFrame:
+    def _unshare_metadata(self) -> None:
+        """Take a private copy of any metadata still shared with the TimeFrame this was copied from (or to)."""
+        if not self._metadata_shared:
+            return
+        self._metadata = deepcopy(self._metadata)
+        for column, column_metadata in list(self._column_metadata.items()):
+            self._column_metadata[column] = deepcopy(column_metadata)
+        self._metadata_shared = False
+
+    def with_df(self, new_df: pl.DataFrame, trust_time: bool = False) -> TimeFrame:
         """Return a new TimeFrame with a new DataFrame, checking the integrity of the time values hasn't
         been compromised between the old and new TimeFrame.
 
         Args:
             new_df: The new Polars DataFrame to set as the new time series data.
+            trust_time: If True, skip the time integrity check. Only use this when the new DataFrame is known to
+                have the same time values as the old, e.g. when it has been derived by only changing other columns.
         """
-        old_df = self._df.clone()
-        self._time_manager._check_time_integrity(old_df, new_df)
+        if not trust_time:
+            self._time_manager._check_time_integrity(self._df, new_df)
         tf = self.copy()
         tf._df = new_df
         tf._column_metadata.sync()
         return tf
 
+    def append(
+        self,
+        new_rows: pl.DataFrame,
+        on_duplicates: DuplicateOption | None = None,
+        on_misaligned_rows: ValidationErrorOptions | None = None,
+    ) -> TimeFrame:
+        """Return a new TimeFrame with rows appended to the end of the time series.
+
+        Only the new rows are validated: they are checked for duplicates, alignment and periodicity together with the
+        last existing row, so that the cost of an append depends on the number of new rows rather than the length of
+        the time series. The new rows are added as a new chunk of the DataFrame, without copying the existing data.
+
+        Columns of the TimeFrame that are missing from the new rows are filled with nulls, or, for flag columns, with
+        no flags set. Other columns are cast to the dtypes of the TimeFrame.
+
+        As each append adds a chunk to the DataFrame, a TimeFrame that is appended to many times may be made faster
+        to work with by rechunking it, e.g. ``tf.with_df(tf.df.rechunk(), trust_time=True)``.
+
+        Args:
+            new_rows: The rows to append. Their time values must not be earlier than the last time in the TimeFrame.
+            on_duplicates: What to do with duplicate time values, including a new row at the same time as the last
+                existing row. Defaults to the option the TimeFrame was created with.
+            on_misaligned_rows: What to do with new rows that are not aligned to the resolution of the TimeFrame.
+                Defaults to the option the TimeFrame was created with.
+
+        Returns:
+            A new TimeFrame with the rows appended.
+
+        Raises:
+            ColumnNotFoundError: If the new rows are missing the time column, or have columns that are not in the
+                TimeFrame.
+            TimeOrderError: If any new time value is earlier than the last time in the TimeFrame.
+        """
+        check_columns_in_dataframe(new_rows, [self.time_name])
+        unknown_columns = [column for column in new_rows.columns if column not in self.df.columns]
+        if unknown_columns:
+            raise ColumnNotFoundError(f"Appended rows have columns that are not in the TimeFrame: {unknown_columns}")
+
+        time_manager = copy(self._time_manager)
+        if on_duplicates is not None:
+            time_manager._on_duplicates = on_duplicates
+        if on_misaligned_rows is not None:
+            time_manager._on_misaligned_rows = on_misaligned_rows
+
+        chunk = self._append_chunk(new_rows)
+        if chunk.is_empty():
+            return self.copy()
+
+        history = self.df
+        if not history.is_empty():
+            last_time = history[self.time_name][-1]
+            if chunk[self.time_name].min() < last_time:
+                raise TimeOrderError(
+                    f"Appended rows must not be earlier than the last time in the TimeFrame: {last_time}"
+                )
+            # Process the last existing row with the new rows, so that duplicate times and periodicity are checked
+            # across the boundary
+            chunk = pl.concat([history.tail(1), chunk])
+            history = history.head(-1)
+
+        chunk = time_manager._handle_time_duplicates(chunk)
+        chunk = time_manager._handle_misaligned_rows(chunk)
+        time_manager.validate(chunk)
+
+        df = history.vstack(chunk)
+        tf = self.copy()
+        tf._df = df.with_columns(df[self.time_name].set_sorted())
+        return tf
+
+    def _append_chunk(self, new_rows: pl.DataFrame) -> pl.DataFrame:
+        """Conform rows to be appended to the schema of this TimeFrame.
+
+        Args:
+            new_rows: The rows to append.
+
+        Returns:
+            The rows, with the columns and dtypes of this TimeFrame.
+        """
+        exprs = []
+        decoded_columns = []
+        for column, dtype in self.df.schema.items():
+            if column in new_rows.columns:
+                exprs.append(pl.col(column).cast(dtype))
+            elif column in self.flag_columns:
+                flag_column = self.get_flag_column(column)
+                exprs.append(self._default_flag_expr(flag_column.flag_system, flag_column.storage).alias(column))
+                if flag_column.is_decoded:
+                    decoded_columns.append(flag_column)
+            else:
+                exprs.append(pl.lit(None, dtype=dtype).alias(column))
+
+        chunk = new_rows.select(exprs)
+        for flag_column in decoded_columns:
+            chunk = flag_column.decode(chunk)
+        return chunk.cast(self.df.schema)
+
+    def lazy(self) -> LazyTimeFrame:
+        """Return a lazy view of this TimeFrame, backed by a Polars ``LazyFrame`` query plan.
+
+        Operations on the returned :class:`~time_stream.lazy.LazyTimeFrame` are added to the query plan rather than
+        being run straight away, and the result is only computed (and validated) when ``collect`` is called.
+
+        Returns:
+            A ``LazyTimeFrame`` starting from the data of this TimeFrame.
+        """
+        return LazyTimeFrame.from_timeframe(self)
+
     def with_metadata(self, metadata: dict[str, Any]) -> TimeFrame:
         """Return a new TimeFrame with TimeFrame-level metadata.
 
@@ -306,6 +476,7 @@ class TimeFrame:
     @property
     def metadata(self) -> dict[str, Any]:
         """TimeFrame-level metadata."""
+        self._unshare_metadata()
         return self._metadata
 
     @metadata.setter
@@ -317,6 +488,7 @@ class TimeFrame:
         Args:
             value: The new metadata to set.
         """
+        self._unshare_metadata()
         if value is None:
             self._metadata = {}
         elif isinstance(value, dict):
@@ -327,11 +499,13 @@ class TimeFrame:
     @metadata.deleter
     def metadata(self) -> None:
         """Clear TimeFrame-level metadata."""
+        self._unshare_metadata()
         self._metadata.clear()
 
     @property
     def column_metadata(self) -> dict[str, dict[str, Any]]:
         """Per-column metadata."""
+        self._unshare_metadata()
         return self._column_metadata
 
     @column_metadata.setter
@@ -343,6 +517,7 @@ class TimeFrame:
         Args:
             value: The new metadata to set.
         """
+        self._unshare_metadata()
         if value is None:
             # Reset all the columns metadata to empty dicts
             self._column_metadata = ColumnMetadataDict(lambda: self.df.columns)
@@ -356,6 +531,7 @@ class TimeFrame:
     @column_metadata.deleter
     def column_metadata(self) -> None:
         """Clear all per-column metadata."""
+        self._unshare_metadata()
         self._column_metadata.clear()
 
     @property
@@ -414,8 +590,11 @@ class TimeFrame:
         return [c for c in self.columns if c not in self.flag_columns]
 
     def sort_time(self) -> None:
-        """Sort the TimeFrame DataFrame by the time column."""
-        self._df = self.df.sort(self.time_name)
+        """Sort the TimeFrame DataFrame by the time column.
+
+        The sort is skipped if the time column is already in order.
+        """
+        self._df = sort_by_column(self.df, self.time_name)
 
     def pad(self, start: datetime | None = None, end: datetime | None = None) -> TimeFrame:
         """Pad the time series with missing datetime rows, filling in NULLs for missing values.
@@ -473,7 +652,9 @@ class TimeFrame:
         """
         return self._flag_manager.get_flag_system(name)
 
-    def register_flag_column(self, column_name: str, flag_system_name: str) -> None:
+    def register_flag_column(
+        self, column_name: str, flag_system_name: str, storage: FlagStorageLiteral = "values"
+    ) -> None:
         """Mark the specified existing column as a flag column.
 
         All non-null values in the column must be valid flag values for the given flag system.
@@ -481,22 +662,30 @@ class TimeFrame:
         Args:
             column_name: A column name to mark as a flag column.
             flag_system_name: The name of the registered flag system.
+            storage: Categorical flag systems only. ``"values"`` (default) keeps the raw flag values in the column.
+                ``"enum"`` converts the column to a ``pl.Enum`` of the flag values, so that each row holds a small
+                physical code rather than a repeated value, and decoding only reinterprets the codes. ``"bitset"``
+                (categorical list systems of up to 64 flags) packs each list into a ``UInt64`` bitmask.
 
         Raises:
             BitwiseFlagUnknownError: If the column contains values with bits not in the bitwise flag system.
+            CategoricalFlagTypeError: If the column holds ``pl.Enum`` values and ``storage`` is ``"values"``.
             CategoricalFlagUnknownError: If the column contains values not in the categorical flag system.
+            FlagSystemTypeError: If ``storage`` is not supported for the flag system.
         """
         check_columns_in_dataframe(self.df, column_name)
         flag_system = self.get_flag_system(flag_system_name)
 
-        flag_system.validate_column(self.df[column_name])
-        self._flag_manager.register_flag_column(column_name, flag_system_name)
+        flag_system.validate_column(self.df[column_name], storage)
+        self._flag_manager.register_flag_column(column_name, flag_system_name, storage)
+        self._df = self.get_flag_column(column_name).to_storage(self.df)
 
     def init_flag_column(
         self,
         flag_system_name: str,
         column_name: str | None = None,
         data: int | str | Sequence[int | str] | None = None,
+        storage: FlagStorageLiteral = "values",
     ) -> None:
         """Add a new column to the TimeFrame DataFrame, setting it as a Flag Column.
 
@@ -504,6 +693,16 @@ class TimeFrame:
         For ``CategoricalSingleFlag`` systems, the column is initialised with null values.
         For ``CategoricalListFlag`` systems, the column is initialised with empty lists.
 
+        Categorical flag columns can be held as a ``pl.Enum`` of the flag values with ``storage="enum"``. Each row
+        (or list element) is then a small physical code rather than a repeated value, flag filters compare codes, and
+        decoding and encoding only reinterpret the codes. For int-valued flag systems, the categories of the
+        ``pl.Enum`` are the flag values as strings.
+
+        Categorical list flag columns of up to 64 flags can instead be packed into a ``UInt64`` bitmask per row with
+        ``storage="bitset"``, where each flag is the bit at its position in the flag system. Adding, removing and
+        filtering flags are then integer operations, and the column is only expanded to lists of flag names by
+        :meth:`decode_flag_column`.
+
         Args:
             flag_system_name: The name of the registered flag system.
             column_name: Optional name for the new flag column. If omitted, a name of the
@@ -512,29 +711,22 @@ class TimeFrame:
             data: The default value(s) to populate the flag column with. Can be a scalar or
                     list-like. For bitwise systems defaults to ``0``; for categorical systems defaults
                     to ``None`` (null) in single mode or an empty list in list mode.
+            storage: How the values of a categorical flag column are held - ``"values"`` (default), ``"enum"``, or
+                    ``"bitset"``.
+
+        Raises:
+            FlagSystemTypeError: If ``storage`` is not supported for the flag system.
         """
         flag_sys = self.get_flag_system(flag_system_name)
-        flag_type = flag_sys.flag_type
-
-        # 1. Resolve dtype
-        if flag_type in ("categorical", "categorical_list"):
-            inner_dtype = pl.Int32 if flag_sys.value_type() is int else pl.Utf8
-            col_dtype = pl.List(inner_dtype) if flag_type == "categorical_list" else inner_dtype
-        else:
-            col_dtype = pl.Int64
 
-        # 2. Build column - if it's a scalar or missing, use pl.lit; otherwise it's a sequence so cast to a Series
+        # 1. Build column - if it's a scalar or missing, use pl.lit; otherwise it's a sequence so cast to a Series.
+        #    The column holds the raw flag values until it is converted to the storage of the flag column.
         if isinstance(data, (int, str)) or data is None:
-            if data is None:
-                if flag_type == "categorical_list":
-                    data = []
-                elif flag_type == "bitwise":
-                    data = 0
-            col_data = pl.lit(data, dtype=col_dtype)
+            col_data = self._default_flag_expr(flag_sys) if data is None else pl.lit(data, self._flag_dtype(flag_sys))
         else:
-            col_data = pl.Series(data, dtype=col_dtype)
+            col_data = pl.Series(data, dtype=self._flag_dtype(flag_sys))
 
-        # 3. Determine name of flag column
+        # 2. Determine name of flag column
         if not column_name:
             column_name = f"__flag__{flag_system_name}"
             if column_name in self.df.columns:
@@ -543,11 +735,51 @@ class TimeFrame:
                     col_suffix += 1
                 column_name = f"{column_name}__{col_suffix}"
 
-        # 4. Add and register as a flag column
-        self._df = self.df.with_columns(col_data.alias(column_name))
-        self._flag_manager.register_flag_column(column_name, flag_system_name)
+        # 3. Add and register as a flag column
+        df = self.df.with_columns(col_data.alias(column_name))
+        self._flag_manager.register_flag_column(column_name, flag_system_name, storage)
+        self._df = self.get_flag_column(column_name).to_storage(df)
         self._column_metadata.sync()
 
+    @staticmethod
+    def _flag_dtype(flag_system: type[FlagSystemBase], storage: FlagStorageLiteral = "values") -> pl.DataType:
+        """The dtype of the (encoded) values of a flag column using a flag system.
+
+        Args:
+            flag_system: The flag system.
+            storage: How the values of a categorical flag column are held.
+
+        Returns:
+            The Polars dtype of the flag column.
+        """
+        if flag_system.flag_type == "categorical_list" and storage == "bitset":
+            return pl.UInt64()
+        if flag_system.flag_type in ("categorical", "categorical_list"):
+            if storage == "enum":
+                inner_dtype = pl.Enum([str(value) for value in flag_system.to_dict().values()])
+            else:
+                inner_dtype = pl.Int32() if flag_system.value_type() is int else pl.Utf8()
+            return pl.List(inner_dtype) if flag_system.flag_type == "categorical_list" else inner_dtype
+        return pl.Int64()
+
+    @classmethod
+    def _default_flag_expr(cls, flag_system: type[FlagSystemBase], storage: FlagStorageLiteral = "values") -> pl.Expr:
+        """The default (encoded) value of a flag column using a flag system, with no flags set.
+
+        Args:
+            flag_system: The flag system.
+            storage: How the values of a categorical flag column are held.
+
+        Returns:
+            Polars literal expression of the default value.
+        """
+        default: int | list | None = None
+        if flag_system.flag_type == "categorical_list":
+            default = 0 if storage == "bitset" else []
+        elif flag_system.flag_type == "bitwise":
+            default = 0
+        return pl.lit(default, dtype=cls._flag_dtype(flag_system, storage))
+
     def get_flag_column(self, flag_column_name: str) -> FlagColumn:
         """Look up a registered flag column by name.
 
@@ -607,6 +839,86 @@ class TimeFrame:
         flag_column = self.get_flag_column(column_name)
         self._df = flag_column.remove_flag(self.df, flag_value, expr)
 
+    def flag_many(self, updates: Sequence[FlagUpdateSpec]) -> None:
+        """Add and remove many flag values in the flag columns in one pass of the data.
+
+        The updates of each flag column are folded into a single expression, and the expressions of all the flag
+        columns are evaluated together in one ``with_columns`` call, so each flag column is rewritten once rather than
+        once per update. Decoded flag columns are encoded and decoded once, rather than around every update.
+
+        The updates are applied in the order given, so a later update of a flag in a row takes precedence over an
+        earlier one. However, the rows to update of every update are evaluated on the data as it was before the batch,
+        so an expression that reads a flag column does not see the updates made to it earlier in the same batch. When
+        no expression reads a flag column that the batch updates, the result is the same as calling
+        :meth:`add_flag` and :meth:`remove_flag` for each update in turn.
+
+        Args:
+            updates: The flag updates, each given as a tuple of ``(flag column name, flag value, expr, action)``,
+                where ``expr`` defines the rows to update and ``action`` is ``"add"`` or ``"remove"``.
+
+        Raises:
+            ValueError: If an update is not given as a four-element tuple with an action of ``"add"`` or
+                ``"remove"``.
+
+        Examples:
+            >>> tf.flag_many(
+            ...     [
+            ...         ("qc_flags", "OUT_OF_RANGE", pl.col("flow") > 500, "add"),
+            ...         ("qc_flags", "SPIKE", pl.col("flow").diff().abs() > 50, "add"),
+            ...         ("qc_flags", "OUT_OF_RANGE", pl.col("flow").is_null(), "remove"),
+            ...     ]
+            ... )
+        """
+        for update in updates:
+            if len(update) != 4 or update[3] not in ("add", "remove"):
+                raise ValueError(
+                    "Flag updates must be given as (flag column name, flag value, expr, action), with an action of "
+                    f"'add' or 'remove'; got {update!r}."
+                )
+        if updates:
+            self._df = self._with_flag_updates(self.df, updates)
+
+    def _with_flag_updates(self, df: pl.DataFrame, updates: Iterable[FlagUpdateSpec]) -> pl.DataFrame:
+        """Apply many flag updates to the flag columns of a DataFrame in a single ``with_columns`` call.
+
+        The updates of each flag column are folded into one expression, so each flag column is only rewritten once.
+        The rows to update are evaluated within the same ``with_columns`` call, so Polars can share any common
+        sub-expressions between them.
+
+        Args:
+            df: The DataFrame holding the flag columns of this TimeFrame.
+            updates: The flag updates, each given as (flag column name, flag value, rows to update, action).
+
+        Returns:
+            The DataFrame with the flag columns updated.
+        """
+        updates_by_column: dict[str, list[FlagColumnUpdate]] = {}
+        for name, flag_value, expr, action in updates:
+            updates_by_column.setdefault(name, []).append((flag_value, expr, action))
+        flag_columns = {name: self.get_flag_column(name) for name in updates_by_column}
+
+        # Flag updates operate on the encoded form of the flag columns
+        decoded = [flag_column for flag_column in flag_columns.values() if flag_column.is_decoded]
+        for flag_column in decoded:
+            df = flag_column.encode(df)
+        schema = df.collect_schema()
+
+        df = (
+            df.lazy()
+            .with_columns(
+                [
+                    flag_columns[name].updates_expr(column_updates).cast(schema[name]).alias(name)
+                    for name, column_updates in updates_by_column.items()
+                ]
+            )
+            .collect()
+        )
+
+        for flag_column in decoded:
+            df = flag_column.decode(df)
+
+        return df
+
     def decode_flag_column(self, flag_column_name: str) -> TimeFrame:
         """Decode a flag column from raw values to human-readable flag names.
 
@@ -635,7 +947,7 @@ class TimeFrame:
         flag_column = self.get_flag_column(flag_column_name)
         if flag_column.is_decoded:
             raise ColumnTypeError(f"Flag column '{flag_column_name}' is already in decoded form.")
-        tf = self.with_df(flag_column.decode(self.df))
+        tf = self.with_df(flag_column.decode(self.df), trust_time=True)
         tf._flag_manager.flag_columns[flag_column_name].is_decoded = True
         return tf
 
@@ -666,7 +978,7 @@ class TimeFrame:
         flag_column = self.get_flag_column(flag_column_name)
         if not flag_column.is_decoded:
             raise ColumnTypeError(f"Flag column '{flag_column_name}' is not in decoded form.")
-        tf = self.with_df(flag_column.encode(self.df))
+        tf = self.with_df(flag_column.encode(self.df), trust_time=True)
         tf._flag_manager.flag_columns[flag_column_name].is_decoded = False
         return tf
 
@@ -702,10 +1014,48 @@ class TimeFrame:
         tf._column_metadata.sync()
         return tf
 
+    def flag_summary(self, flag_column_name: str, period: Period | str | None = None) -> pl.DataFrame:
+        """Count the rows that carry each flag of a flag column, in total or per period.
+
+        A row is counted for a flag if the flag is set in a bitwise column, is the value of a categorical column, or
+        is in the list of a categorical list column. The counts are worked out from the encoded column in a single
+        pass, whatever the number of flags: the rows are first counted per distinct value (and period), and each flag
+        is then counted from that small table of distinct values.
+
+        Args:
+            flag_column_name: The name of the flag column.
+            period: Optional period to count the flags per, e.g. ``"P1D"`` or ``"P1M"``. The periods are formed in the
+                same way as by :meth:`aggregate`, and the TimeFrame periodicity must be a subperiod of ``period``.
+
+        Returns:
+            A DataFrame with one column of counts per flag, named after the flag, in flag system order. Without a
+            period, it has a single row of total counts. With a period, it has a row per period that holds data,
+            labelled in the time column according to the time anchor of this TimeFrame.
+
+        Raises:
+            AggregationPeriodError: If ``period`` is not compatible with the periodicity of the TimeFrame.
+        """
+        flag_column = self.get_flag_column(flag_column_name)
+        df = self.df.select(self.time_name, flag_column_name)
+        if flag_column.is_decoded:
+            df = flag_column.encode(df)
+
+        count_exprs = flag_column.count_exprs(pl.col("__count"))
+        if period is None:
+            counts = df.lazy().group_by(flag_column_name).agg(pl.len().alias("__count"))
+            return counts.select(count_exprs).collect()
+
+        period = configure_period_object(period)
+        validate_aggregation_period(period, self.periodicity)
+        counts = group_by_period(
+            df.lazy(), self.time_name, period, self.time_anchor, self.time_anchor, group_by=flag_column_name
+        ).agg(pl.len().alias("__count"))
+        return counts.group_by(self.time_name).agg(count_exprs).sort(self.time_name).collect()
+
     def aggregate(
         self,
         aggregation_period: Period | str,
-        aggregation_function: str | Type[AggregationFunction] | AggregationFunction,
+        aggregation_function: MultiAggregationSpec,
         columns: str | list[str] | None = None,
         missing_criteria: tuple[MissingCriteria, float | int] | None = None,
         aggregation_time_anchor: TimeAnchor | None = None,
@@ -717,7 +1067,15 @@ class TimeFrame:
 
         Args:
             aggregation_period: The period over which to aggregate the data
-            aggregation_function: The aggregation function to apply
+            aggregation_function: The aggregation function to apply. Several functions can be applied in one pass of
+                the data, sharing the count and validity columns, by giving:
+
+                - a list of functions, each applied to all of ``columns``, e.g. ``["mean", "min", "max"]``
+                - a dict of column name to the function(s) applied to that column, e.g.
+                  ``{"temperature": ["min", "max"], "rainfall": "sum"}``. ``columns`` is ignored in this case.
+
+                Functions given by name or class are initialised with ``**kwargs``; give instances (e.g.
+                ``Percentile(p=95)``) to configure functions separately.
             columns: The column(s) containing the data to be aggregated. If omitted, will use all data columns.
             missing_criteria: How the aggregation handles missing data
             aggregation_time_anchor: The time anchor for the aggregation result.
@@ -739,13 +1097,10 @@ class TimeFrame:
         # Normalise time_window tuple to a TimeWindow instance
         normalised_time_window = TimeWindow.from_tuple(time_window) if isinstance(time_window, tuple) else time_window
 
-        agg_func = AggregationFunction.get(aggregation_function, **kwargs)
+        agg_func, columns = MultiAggregation.resolve(aggregation_function, columns or self.data_columns, **kwargs)
         aggregation_period = configure_period_object(aggregation_period)
         aggregation_time_anchor = aggregation_time_anchor if aggregation_time_anchor is not None else self.time_anchor
 
-        if not columns:
-            columns = self.data_columns
-
         ctx = AggregationCtx(
             df=self.df,
             time_name=self.time_name,
@@ -768,21 +1123,278 @@ class TimeFrame:
         new_resolution = aggregation_period.without_offset()
         new_offset = aggregation_period.offset
 
-        tf = TimeFrame(
-            df=agg_df,
+        # The aggregation pipeline produces one row per aggregation period, in time order, so the result does not
+        # need to go through the validation of the public constructor.
+        time_manager = TimeManager(
             time_name=self.time_name,
             resolution=new_resolution,
             offset=new_offset,
             periodicity=aggregation_period,
             time_anchor=aggregation_time_anchor,
         )
+        tf = TimeFrame._from_validated(agg_df, time_manager)
         tf.metadata = deepcopy(self.metadata)
         return tf
 
+    def aggregate_cascade(
+        self,
+        aggregation_periods: Sequence[Period | str],
+        aggregation_function: MultiAggregationSpec,
+        columns: str | list[str] | None = None,
+        missing_criteria: tuple[MissingCriteria, float | int] | None = None,
+        aggregation_time_anchor: TimeAnchor | None = None,
+        **kwargs,
+    ) -> list[TimeFrame]:
+        """Aggregate this TimeFrame into several aggregation periods at once, e.g. hourly, daily, monthly and annual.
+
+        Where possible, each period is built from the partial aggregates of a finer period, rather than from the data
+        of this TimeFrame. For example, annual aggregates are built from 12 monthly aggregates, which are built from
+        the daily aggregates, which in turn are built from the hourly aggregates. This is possible when the finer
+        period is a subperiod of the coarser period, and the aggregation function(s) can be built up from partial
+        aggregates (``sum``, ``mean``, ``mean_sum``, ``min``, ``max`` and ``stdev``). Otherwise, the period is
+        aggregated from the data of this TimeFrame.
+
+        The results are the same as calling :meth:`aggregate` for each period, including the expected counts and the
+        missing data checks.
+
+        Args:
+            aggregation_periods: The periods over which to aggregate the data.
+            aggregation_function: The aggregation function(s) to apply. See :meth:`aggregate`.
+            columns: The column(s) containing the data to be aggregated. If omitted, will use all data columns.
+            missing_criteria: How the aggregation handles missing data
+            aggregation_time_anchor: The time anchor for the aggregation results.
+            **kwargs: Parameters specific to the aggregation function.
+
+        Returns:
+            A TimeFrame containing the aggregated data for each aggregation period, in the order of
+            ``aggregation_periods``.
+        """
+        agg_func, columns = MultiAggregation.resolve(aggregation_function, columns or self.data_columns, **kwargs)
+        periods = [configure_period_object(period) for period in aggregation_periods]
+        aggregation_time_anchor = aggregation_time_anchor if aggregation_time_anchor is not None else self.time_anchor
+
+        ctx = AggregationCtx(
+            df=self.df,
+            time_name=self.time_name,
+            time_anchor=self.time_anchor,
+            periodicity=self.periodicity,
+        )
+
+        agg_dfs = AggregationCascade(
+            agg_func,
+            ctx,
+            periods,
+            columns,
+            missing_criteria=missing_criteria,
+            aggregation_time_anchor=aggregation_time_anchor,
+        ).execute()
+
+        results = []
+        for aggregation_period, agg_df in zip(periods, agg_dfs):
+            time_manager = TimeManager(
+                time_name=self.time_name,
+                resolution=aggregation_period.without_offset(),
+                offset=aggregation_period.offset,
+                periodicity=aggregation_period,
+                time_anchor=aggregation_time_anchor,
+            )
+            tf = TimeFrame._from_validated(agg_df, time_manager)
+            tf.metadata = deepcopy(self.metadata)
+            results.append(tf)
+        return results
+
+    def reaggregate(
+        self,
+        previous: TimeFrame,
+        start: datetime,
+        end: datetime,
+        aggregation_function: MultiAggregationSpec,
+        columns: str | list[str] | None = None,
+        missing_criteria: tuple[MissingCriteria, float | int] | None = None,
+        time_window: tuple[time, time] | tuple[time, time, ClosedInterval] | TimeWindow | None = None,
+        **kwargs,
+    ) -> TimeFrame:
+        """Update a previous aggregation of this TimeFrame after the data within a time range has changed, e.g. when
+        late data has been appended or a few hours of data have been edited.
+
+        Only the aggregation periods that the time range touches are aggregated again, and these replace the same
+        periods in the previous aggregation. The result is the same as calling :meth:`aggregate` on the whole of this
+        TimeFrame, as long as the data outside of the time range has not changed since the previous aggregation.
+
+        The aggregation period and time anchor are taken from the previous aggregation. The other arguments must be
+        the same as those the previous aggregation was made with.
+
+        Args:
+            previous: The previous result of :meth:`aggregate`.
+            start: The start of the time range of the changed data (inclusive).
+            end: The end of the time range of the changed data (inclusive).
+            aggregation_function: The aggregation function(s) to apply. See :meth:`aggregate`.
+            columns: The column(s) containing the data to be aggregated. If omitted, will use all data columns.
+            missing_criteria: How the aggregation handles missing data
+            time_window: Optional restriction of which time-of-day observations are included in each
+                aggregation period. See :meth:`aggregate`.
+            **kwargs: Parameters specific to the aggregation function.
+
+        Returns:
+            A TimeFrame containing the updated aggregated data.
+
+        Raises:
+            AggregationError: If the previous aggregation does not have the same time column as this TimeFrame, its
+                columns do not match those of the aggregation function(s) and columns, or the end of the time range is
+                before the start.
+        """
+        if previous.time_name != self.time_name:
+            raise AggregationError(
+                f"Previous aggregation time column '{previous.time_name}' does not match '{self.time_name}'."
+            )
+
+        normalised_time_window = TimeWindow.from_tuple(time_window) if isinstance(time_window, tuple) else time_window
+        agg_func, columns = MultiAggregation.resolve(aggregation_function, columns or self.data_columns, **kwargs)
+        aggregation_period = previous.periodicity
+
+        ctx = AggregationCtx(
+            df=self.df,
+            time_name=self.time_name,
+            time_anchor=self.time_anchor,
+            periodicity=self.periodicity,
+            aggregation_period=aggregation_period,
+        )
+
+        agg_df = StandardAggregationPipeline(
+            agg_func,
+            ctx,
+            aggregation_period,
+            columns,
+            missing_criteria=missing_criteria,
+            aggregation_time_anchor=previous.time_anchor,
+            time_window=normalised_time_window,
+        ).execute_update(previous.df, start, end)
+
+        # The touched periods are spliced into the previous result in time order, so the time values are unique,
+        #   sorted and aligned to the aggregation period. They may add or drop periods, though, so the result is built
+        #   in the same way as a new aggregation rather than as the previous result with new data.
+        tf = TimeFrame._from_validated(agg_df, copy(previous._time_manager))
+        tf.metadata = deepcopy(previous.metadata)
+        tf.column_metadata = deepcopy(dict(previous.column_metadata))
+        return tf
+
+    @classmethod
+    def aggregate_chunked(
+        cls,
+        source: Iterable[pl.DataFrame] | pl.LazyFrame,
+        time_name: str,
+        aggregation_period: Period | str,
+        aggregation_function: MultiAggregationSpec,
+        columns: str | list[str] | None = None,
+        resolution: Period | str | None = None,
+        offset: str | None = None,
+        periodicity: Period | str | None = None,
+        time_anchor: TimeAnchor = "start",
+        missing_criteria: tuple[MissingCriteria, float | int] | None = None,
+        aggregation_time_anchor: TimeAnchor | None = None,
+        time_window: tuple[time, time] | tuple[time, time, ClosedInterval] | TimeWindow | None = None,
+        **kwargs,
+    ) -> TimeFrame:
+        """Aggregate a time series that is too large to hold in memory, reading it in time-ordered chunks.
+
+        The source is aggregated chunk by chunk, with the rows of any aggregation period that spans the border of two
+        chunks carried over to the next chunk. The result is the same as building a TimeFrame from the whole series
+        and calling :meth:`aggregate`, but only one chunk of the source is held in memory at a time.
+
+        Each chunk is validated against the time properties, but duplicate or misaligned rows are not resolved.
+
+        Args:
+            source: An iterable of DataFrames, or a LazyFrame (e.g. from :func:`polars.scan_parquet`) that is read in
+                batches by the Polars streaming engine. The rows must be in time order, within and across chunks.
+            time_name: The name of the time column.
+            aggregation_period: The period over which to aggregate the data
+            aggregation_function: The aggregation function(s) to apply. See :meth:`aggregate`.
+            columns: The column(s) containing the data to be aggregated. If omitted, will use all columns other than
+                the time column.
+            resolution: The resolution of the source time series. See :class:`TimeFrame`.
+            offset: The offset of the source time series. See :class:`TimeFrame`.
+            periodicity: The periodicity of the source time series. See :class:`TimeFrame`.
+            time_anchor: The time anchor of the source time series. See :class:`TimeFrame`.
+            missing_criteria: How the aggregation handles missing data
+            aggregation_time_anchor: The time anchor for the aggregation result.
+            time_window: Optional restriction of which time-of-day observations are included in each
+                aggregation period. See :meth:`aggregate`.
+            **kwargs: Parameters specific to the aggregation function.
+
+        Returns:
+            A TimeFrame containing the aggregated data.
+
+        Raises:
+            AggregationError: If the source is empty, or its chunks are not in time order.
+        """
+        time_manager = TimeManager(
+            time_name=time_name,
+            resolution=resolution,
+            offset=offset,
+            periodicity=periodicity,
+            time_anchor=time_anchor,
+        )
+
+        # The pipeline is validated against the schema of the source, as the chunks may be empty
+        if isinstance(source, pl.LazyFrame):
+            schema_lf = source
+            chunks: Iterator[pl.DataFrame] = source.collect_batches(maintain_order=True)
+        else:
+            chunks = iter(source)
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                raise AggregationError("Cannot aggregate an empty DataFrame.")
+            schema_lf = first_chunk.lazy()
+            chunks = chain([first_chunk], chunks)
+
+        def _validated(chunks: Iterator[pl.DataFrame]) -> Iterator[pl.DataFrame]:
+            for chunk in chunks:
+                if not chunk.is_empty():
+                    time_manager.validate(chunk)
+                yield chunk
+
+        normalised_time_window = TimeWindow.from_tuple(time_window) if isinstance(time_window, tuple) else time_window
+        if not columns:
+            columns = [name for name in schema_lf.collect_schema().names() if name != time_name]
+        agg_func, columns = MultiAggregation.resolve(aggregation_function, columns, **kwargs)
+        aggregation_period = configure_period_object(aggregation_period)
+        aggregation_time_anchor = aggregation_time_anchor if aggregation_time_anchor is not None else time_anchor
+
+        ctx = AggregationCtx(
+            df=schema_lf,
+            time_name=time_name,
+            time_anchor=time_anchor,
+            periodicity=time_manager.periodicity,
+            aggregation_period=aggregation_period,
+        )
+
+        agg_dfs = list(
+            StandardAggregationPipeline(
+                agg_func,
+                ctx,
+                aggregation_period,
+                columns,
+                missing_criteria=missing_criteria,
+                aggregation_time_anchor=aggregation_time_anchor,
+                time_window=normalised_time_window,
+            ).execute_chunked(_validated(chunks))
+        )
+        if not agg_dfs:
+            raise AggregationError("Cannot aggregate an empty DataFrame.")
+
+        agg_time_manager = TimeManager(
+            time_name=time_name,
+            resolution=aggregation_period.without_offset(),
+            offset=aggregation_period.offset,
+            periodicity=aggregation_period,
+            time_anchor=aggregation_time_anchor,
+        )
+        return cls._from_validated(pl.concat(agg_dfs), agg_time_manager)
+
     def rolling_aggregate(
         self,
         window_size: Period | str,
-        aggregation_function: str | Type[AggregationFunction] | AggregationFunction,
+        aggregation_function: MultiAggregationSpec,
         columns: str | list[str] | None = None,
         missing_criteria: tuple[MissingCriteria, float | int] | None = None,
         alignment: RollingAlignment = "trailing",
@@ -797,7 +1409,8 @@ class TimeFrame:
 
         Args:
             window_size: The size of the rolling window.
-            aggregation_function: The aggregation function to apply.
+            aggregation_function: The aggregation function(s) to apply. See :meth:`aggregate` for applying several
+                functions in one pass.
             columns: The column(s) containing the data to be aggregated. If omitted, will use all data columns.
             missing_criteria: How the aggregation handles missing data. When the actual number of values in
                 a window is below the threshold the result is flagged as invalid via a ``valid_<column>`` column.
@@ -817,12 +1430,9 @@ class TimeFrame:
             A TimeFrame with the same resolution, periodicity, and time anchor as this TimeFrame,
             containing the rolling aggregation results.
         """
-        agg_func = AggregationFunction.get(aggregation_function, **kwargs)
+        agg_func, columns = MultiAggregation.resolve(aggregation_function, columns or self.data_columns, **kwargs)
         window_size = configure_period_object(window_size)
 
-        if not columns:
-            columns = self.data_columns
-
         ctx = AggregationCtx(
             df=self.df,
             time_name=self.time_name,
@@ -840,14 +1450,15 @@ class TimeFrame:
             alignment=alignment,
         ).execute()
 
-        tf = TimeFrame(
-            df=agg_df,
+        # Rolling aggregation keeps the (already validated) time values of this TimeFrame
+        time_manager = TimeManager(
             time_name=self.time_name,
             resolution=self.resolution,
             offset=self.offset,
             periodicity=self.periodicity,
             time_anchor=self.time_anchor,
         )
+        tf = TimeFrame._from_validated(agg_df, time_manager)
         tf.metadata = deepcopy(self.metadata)
         return tf
 
@@ -910,55 +1521,198 @@ class TimeFrame:
             tf_result.add_flag(flag_column_name, flag_value, qc_result)
             return tf_result
 
+    def qc_suite(self, checks: Sequence[QcCheckSpec]) -> TimeFrame:
+        """Apply many quality control checks to the TimeFrame at once, adding their results to flag columns.
+
+        The flag updates of all the checks are OR-ed into one expression per flag column, and the expressions of all
+        the flag columns, which embed the expressions of the checks, are evaluated together in a single
+        ``with_columns`` call. The data is therefore copied once, rather than once per check, and Polars can share any
+        sub-expressions that are common to several checks (e.g. the shifted values used by both the spike and flat
+        line checks).
+
+        All checks are evaluated against the data of this TimeFrame, so the result is the same as chaining
+        :meth:`qc_check` calls with ``flag_params``.
+
+        Args:
+            checks: The QC checks to apply, each given as a tuple of ``(check, column_name, kwargs, flag_params,
+                observation_interval)``. ``kwargs`` holds the parameters specific to the check type (or None), and
+                ``flag_params`` is the (flag column name, flag value) to add where the check returns ``True``.
+
+        Returns:
+            A new TimeFrame with the results of all the QC checks added to the flag columns.
+
+        Raises:
+            QcError: If no checks are given, or a check is not given as a five-element tuple with ``flag_params``.
+
+        Examples:
+            >>> tf_flagged = tf.qc_suite(
+            ...     [
+            ...         ("range", "flow", {"min_value": 0, "max_value": 500}, ("qc_flags", "OUT_OF_RANGE"), None),
+            ...         ("spike", "flow", {"threshold": 50}, ("qc_flags", "SPIKE"), None),
+            ...         ("flat_line", "flow", {"min_count": 6}, ("qc_flags", "FLAT_LINE"), None),
+            ...     ]
+            ... )
+        """
+        updates = QcSuitePipeline(checks, QcCtx(self.df, self.time_name)).flag_updates()
+        df = self._with_flag_updates(self.df, [(name, value, expr, "add") for expr, name, value in updates])
+        return self.with_df(df, trust_time=True)
+
     def infill(
         self,
-        infill_method: str | Type[InfillMethod] | InfillMethod,
-        column_name: str,
+        infill_method: MultiInfillSpec,
+        column_name: str | Sequence[str] | None = None,
         max_gap_size: int | None = None,
         observation_interval: tuple[datetime, datetime | None] | None = None,
-        flag_params: tuple[str, str | int] | None = None,
+        flag_params: tuple[str, str | int] | Mapping[str, tuple[str, str | int]] | None = None,
         **kwargs,
     ) -> TimeFrame:
-        """Apply an infilling method to a column in the TimeFrame to fill in missing data.
+        """Apply an infilling method to one or more columns in the TimeFrame to fill in missing data.
+
+        Several columns are infilled in a single call by passing a list of columns, or a mapping of column name to
+        the infill method to use for that column. The data is padded once, and the gaps of all the columns are found
+        from the padded data before any column is infilled. The columns are then infilled in turn, so the result is
+        the same as chaining calls for each column, but the new TimeFrame and the flag columns are only built once.
 
         Args:
-            infill_method: The method to use for infilling
-            column_name: The column to infill
+            infill_method: The method to use for infilling, or a mapping of column name to the method to use for that
+                           column. The methods of a mapping can be given as ``(method, kwargs)`` tuples, to
+                           initialise each method with its own parameters.
+            column_name: The column, or list of columns, to infill. Not used if ``infill_method`` is a mapping.
             max_gap_size: The maximum size of consecutive null gaps that should be filled. Any gap larger than this
                           will not be infilled and will remain as null.
             observation_interval: Optional time interval to limit the check to.
             flag_params: Tuple of (flag column name [str], flag value [str | int].
                             If provided, add given flag value to the flag column on rows that were infilled.
-                            If not provided, no flags added.
-            **kwargs: Parameters specific to the infill method.
+                            Can also be a mapping of column name to flag parameters, to flag the infilled rows of
+                            each column separately. If not provided, no flags added.
+            **kwargs: Parameters specific to the infill method. Not used if ``infill_method`` is a mapping; give the
+                      parameters of each method in the mapping instead.
 
         Returns:
-            A TimeFrame containing the aggregated data.
+            A TimeFrame containing the infilled data.
+
+        Raises:
+            InfillError: If no columns to infill are given, columns are given both by ``column_name`` and in an
+                ``infill_method`` mapping, or method parameters are given as ``**kwargs`` with a mapping.
+
+        Examples:
+            >>> tf_filled = tf.infill("linear", ["temperature", "humidity"], max_gap_size=3)
+            >>> tf_filled = tf.infill({"temperature": "pchip", "rainfall": "linear"}, max_gap_size=3)
+            >>> tf_filled = tf.infill({"flow": ("alt_data", {"alt_df": alt_df}), "stage": "linear"})
         """
-        # Get the infill method instance and run the apply method
-        infill_instance = InfillMethod.get(infill_method, **kwargs)
-        infill_result = infill_instance.apply(
-            self.df, self.time_name, self.periodicity, column_name, observation_interval, max_gap_size
-        )
+        if isinstance(infill_method, Mapping):
+            if column_name is not None:
+                raise InfillError("column_name cannot be given when infill_method is a mapping of column to method.")
+            if kwargs:
+                raise InfillError(
+                    f"Infill method parameters {sorted(kwargs)} cannot be given as keyword arguments when "
+                    "infill_method is a mapping of column to method; give each method as a (method, kwargs) tuple."
+                )
+            methods = {}
+            for column, method_spec in infill_method.items():
+                method, method_kwargs = method_spec if isinstance(method_spec, tuple) else (method_spec, {})
+                methods[column] = InfillMethod.get(method, **method_kwargs)
+        else:
+            columns = [column_name] if isinstance(column_name, str) else list(column_name or [])
+            methods = {column: InfillMethod.get(infill_method, **kwargs) for column in columns}
+        if not methods:
+            raise InfillError("No columns given to infill.")
+
+        # Pad the data once, and find the gaps of all the columns in the padded data, reusing any that are already
+        #   known. Infilling a column does not change the gaps of the others, so the later columns can use them too.
+        check_columns_in_dataframe(self.df, list(methods))
+        padded = self.df if self.df.is_empty() else pad_time(self.df, self.time_name, self.periodicity)
+        gaps = {}
+        for column in methods:
+            gaps[column] = self._cached_gaps(column)
+            if gaps[column] is None and not padded.is_empty():
+                gaps[column] = gap_index(padded, self.time_name, column)
+                self._cache_gaps(column, gaps[column])
+
+        df = padded
+        for column, infill_instance in methods.items():
+            ctx = InfillCtx(df, self.time_name, self.periodicity, gaps[column], padded=True)
+            df = InfillMethodPipeline(infill_instance, ctx, column, observation_interval, max_gap_size).execute()
+
+        # If no column had anything to infill, the data is left as it was, without the padding
+        if df is padded:
+            df = self.df
 
         # Create a copy of the current TimeFrame, and update the dataframe with the infilled data
-        tf_result = self.with_df(infill_result)
+        tf_result = self.with_df(df)
 
         if flag_params:
-            # Add flag where we have infilled data
-            flag_column_name, flag_value = flag_params
+            # Add flag where we have infilled data, updating the flag columns once for all the infilled columns
+            updates: list[FlagUpdateSpec] = []
+            for column in methods:
+                column_flag_params = flag_params.get(column) if isinstance(flag_params, Mapping) else flag_params
+                if column_flag_params is None:
+                    continue
+                flag_column_name, flag_value = column_flag_params
 
-            before = self.df[column_name]
-            after = tf_result.df[column_name]
+                before = self.df[column]
+                after = tf_result.df[column]
 
-            before_is_null = before.is_null() | before.is_nan()
-            after_is_null = after.is_null() | after.is_nan()
+                before_is_null = before.is_null() | before.is_nan()
+                after_is_null = after.is_null() | after.is_nan()
 
-            mask = before_is_null.ne(after_is_null)
-            tf_result.add_flag(flag_column_name, flag_value, mask)
+                updates.append((flag_column_name, flag_value, before_is_null.ne(after_is_null), "add"))
+
+            tf_result._df = tf_result._with_flag_updates(tf_result.df, updates)
 
         return tf_result
 
+    def gaps(self, column_name: str) -> pl.DataFrame:
+        """Find the gaps in a column of the TimeFrame: groups of consecutive time steps with missing data.
+
+        Missing data is either a NULL value, or a time step of the periodicity of the TimeFrame that has no row. The
+        gaps are found in a single pass of the column, and are cached on the TimeFrame for as long as its data is
+        unchanged, so they are only found once for reporting and any number of infills of the column.
+
+        Args:
+            column_name: The column to find gaps within.
+
+        Returns:
+            A DataFrame with one row per gap, in time order, with the first (``start``) and last (``end``) missing
+            time step of the gap, and the number of missing time steps in the gap (``length``).
+        """
+        check_columns_in_dataframe(self.df, [column_name])
+        gaps = self._cached_gaps(column_name)
+        if gaps is None:
+            df = self.df
+            if df.height > 1:
+                df = pad_time(df, self.time_name, self.periodicity)
+            gaps = gap_index(df, self.time_name, column_name)
+            self._cache_gaps(column_name, gaps)
+        return gaps.select("start", "end", "length")
+
+    def _cached_gaps(self, column_name: str) -> pl.DataFrame | None:
+        """The cached gap index of a column of the padded data of this TimeFrame, if it is still valid.
+
+        Args:
+            column_name: The column name.
+
+        Returns:
+            The gap index, or None if it has not been built for the current data.
+        """
+        cached = self._gap_cache.get(column_name)
+        if cached is None:
+            return None
+        df_ref, gaps = cached
+        return gaps if df_ref() is self._df else None
+
+    def _cache_gaps(self, column_name: str, gaps: pl.DataFrame) -> None:
+        """Cache the gap index of a column of the padded data of this TimeFrame.
+
+        The cache holds a weak reference to the DataFrame it was built from, so it is invalidated whenever the data is
+        replaced, without keeping old data alive.
+
+        Args:
+            column_name: The column name.
+            gaps: The gap index.
+        """
+        self._gap_cache[column_name] = (weakref.ref(self._df), gaps)
+
     def select(
         self,
         column_names: str | list[str],
@@ -992,8 +1746,8 @@ class TimeFrame:
         # Build new frame
         new_df = self.df.select(column_names)
 
-        # New TimeFrame
-        tf = self.with_df(new_df)
+        # New TimeFrame - selecting columns leaves the time values untouched
+        tf = self.with_df(new_df, trust_time=True)
 
         # Prune column level metadata to kept columns
         kept_metadata = {col: self.column_metadata[col] for col in column_names}
@@ -1009,7 +1763,9 @@ class TimeFrame:
         # keep only flag columns that survived
         for flag_name, flag_column in self._flag_manager.flag_columns.items():
             if flag_name in column_names:
-                new_flag_manager.register_flag_column(flag_name, flag_column.flag_system.system_name())
+                new_flag_manager.register_flag_column(
+                    flag_name, flag_column.flag_system.system_name(), flag_column.storage
+                )
 
         tf._flag_manager = new_flag_manager
         tf._column_metadata.sync()
@@ -1050,7 +1806,7 @@ class TimeFrame:
             raise ValueError("new_time_name cannot be empty string")
 
         if new_time_name == self.time_name:
-            return self.copy()
+            return self.copy(share_df=False)
 
         if new_time_name in self.data_columns:
             raise DuplicateColumnError(
@@ -1065,6 +1821,146 @@ class TimeFrame:
 
         return tf
 
+    def write_parquet(self, file: str | Path, **kwargs) -> None:
+        """Write this TimeFrame to a Parquet file.
+
+        The time series data is written as normal Parquet columns. The time properties, flag systems, flag columns
+        and metadata of the TimeFrame are stored in the file's key-value metadata, so the TimeFrame can be restored
+        with :meth:`read_parquet`. Metadata must be JSON serialisable.
+
+        Args:
+            file: Path of the file to write to.
+            **kwargs: Additional keyword arguments passed to :meth:`polars.DataFrame.write_parquet`
+                (e.g. ``compression``, ``row_group_size``).
+        """
+        persistence.write_parquet(self.df, TimeFrameState.from_timeframe(self), file, **kwargs)
+
+    def write_ipc(self, file: str | Path, compression: IpcCompression = "uncompressed") -> None:
+        """Write this TimeFrame to an Arrow IPC (Feather v2) file.
+
+        The time properties, flag systems, flag columns and metadata of the TimeFrame are stored in the file's schema
+        metadata, so the TimeFrame can be restored with :meth:`read_ipc`. Metadata must be JSON serialisable.
+
+        Args:
+            file: Path of the file to write to.
+            compression: Compression of the data: ``"uncompressed"`` (default), ``"lz4"`` or ``"zstd"``.
+        """
+        persistence.write_ipc(self.df, TimeFrameState.from_timeframe(self), file, compression=compression)
+
+    @classmethod
+    def read_parquet(cls, source: str | Path, columns: list[str] | None = None, verify: bool = False) -> TimeFrame:
+        """Read a TimeFrame from a Parquet file written by :meth:`write_parquet`.
+
+        The time values were validated when the TimeFrame was written, so by default they are not validated again.
+
+        Args:
+            source: Path to the Parquet file.
+            columns: Optional list of columns to read. The time column is always read. Flag columns and column
+                metadata are only restored for the columns that are read.
+            verify: If True, run the full time validation of the TimeFrame constructor on the data that is read.
+
+        Returns:
+            The restored TimeFrame.
+        """
+        state = persistence.read_parquet_state(source)
+        df = pl.read_parquet(source, columns=cls._columns_to_read(state, columns))
+        return cls._from_state(df, state, verify)
+
+    @classmethod
+    def read_ipc(cls, source: str | Path, columns: list[str] | None = None, verify: bool = False) -> TimeFrame:
+        """Read a TimeFrame from an Arrow IPC file written by :meth:`write_ipc`.
+
+        The time values were validated when the TimeFrame was written, so by default they are not validated again.
+
+        Args:
+            source: Path to the Arrow IPC file.
+            columns: Optional list of columns to read. The time column is always read. Flag columns and column
+                metadata are only restored for the columns that are read.
+            verify: If True, run the full time validation of the TimeFrame constructor on the data that is read.
+
+        Returns:
+            The restored TimeFrame.
+        """
+        state = persistence.read_ipc_state(source)
+        df = pl.read_ipc(source, columns=cls._columns_to_read(state, columns))
+        return cls._from_state(df, state, verify)
+
+    @classmethod
+    def scan_ipc(
+        cls, source: str | Path, columns: list[str] | None = None, memory_map: bool = True, verify: bool = False
+    ) -> TimeFrame:
+        """Open a TimeFrame from an Arrow IPC file written by :meth:`write_ipc`, memory-mapping the file.
+
+        With ``memory_map=True``, the columns of the TimeFrame are views onto the memory-mapped file rather than
+        copies of it. The data is then paged in from disk as it is used, and the same file opened by many processes
+        shares one copy of the data in the operating system's page cache. The file must be written uncompressed
+        (the default of :meth:`write_ipc`) for the data to be used without copying.
+
+        The time properties are read from the file metadata, rather than recomputed from the time values.
+
+        Args:
+            source: Path to the Arrow IPC file.
+            columns: Optional list of columns to read. The time column is always read. Flag columns and column
+                metadata are only restored for the columns that are read.
+            memory_map: If True, memory-map the file. If False, read the data into memory (as :meth:`read_ipc`).
+            verify: If True, run the full time validation of the TimeFrame constructor on the data that is read.
+
+        Returns:
+            The restored TimeFrame.
+        """
+        if not memory_map:
+            return cls.read_ipc(source, columns=columns, verify=verify)
+
+        state = persistence.read_ipc_state(source)
+        df = persistence.map_ipc(source, columns=cls._columns_to_read(state, columns))
+        return cls._from_state(df, state, verify)
+
+    @staticmethod
+    def _columns_to_read(state: TimeFrameState, columns: list[str] | None) -> list[str] | None:
+        """Make sure the time column is part of a column projection.
+
+        Args:
+            state: The stored TimeFrame state.
+            columns: The requested columns, or None for all columns.
+
+        Returns:
+            The columns to read from file.
+        """
+        if columns is None:
+            return None
+        return [state.time_name] + [col for col in columns if col != state.time_name]
+
+    @classmethod
+    def _from_state(cls, df: pl.DataFrame, state: TimeFrameState, verify: bool) -> TimeFrame:
+        """Build a TimeFrame from data and state read from file.
+
+        Args:
+            df: The data read from file.
+            state: The stored TimeFrame state.
+            verify: If True, validate the time values through the public constructor. Otherwise, trust them.
+
+        Returns:
+            The restored TimeFrame.
+        """
+        if verify:
+            tf = cls(
+                df,
+                time_name=state.time_name,
+                resolution=state.resolution,
+                offset=state.offset,
+                periodicity=state.periodicity,
+                time_anchor=state.time_anchor,
+            )
+        else:
+            # The time values were sorted when written, so let Polars know
+            df = df.with_columns(pl.col(state.time_name).set_sorted())
+            tf = cls._from_validated(df, state.time_manager())
+
+        tf._metadata = state.metadata
+        tf._column_metadata.update({col: meta for col, meta in state.column_metadata.items() if col in df.columns})
+        tf._flag_manager = state.flag_manager(df.columns)
+        return tf
+
     def __getitem__(self, key: str | list[str]) -> TimeFrame:
         """Access columns using indexing syntax.
 
@@ -1114,8 +2010,8 @@ class TimeFrame:
             and self.periodicity == other.periodicity
             and self.time_anchor == other.time_anchor
             and self._flag_manager == other._flag_manager
-            and self.metadata == other.metadata
-            and self.column_metadata == other.column_metadata
+            and self._metadata == other._metadata
+            and self._column_metadata == other._column_metadata
         )
 
     # Make class instances unhashable
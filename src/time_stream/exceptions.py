@@ -53,6 +53,10 @@ class ResolutionError(TimeStreamError):
     """Raised when datetime values are not aligned to the specified resolution."""
 
 
+class TimeOrderError(TimeStreamError):
+    """Raised when appended time values are earlier than the existing time values."""
+
+
 class TimeMutatedError(TimeStreamError):
     """Raised when the time values have been detected as being mutated."""
 
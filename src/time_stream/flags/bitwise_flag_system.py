@@ -129,13 +129,14 @@ class BitwiseFlag(FlagSystemBase, int, Flag, metaclass=BitwiseMeta):
         return int
 
     @classmethod
-    def validate_column(cls, series: pl.Series) -> None:
+    def validate_column(cls, series: pl.Series, storage: str = "values") -> None:
         """Validate that all non-null values in ``series`` are valid bitwise combinations.
 
         A value is valid if all of its set bits correspond to flags defined in this system.
 
         Args:
             series: The Polars Series to validate.
+            storage: The storage that the column is registered with. Bitwise flag columns always hold the raw values.
 
         Raises:
             BitwiseFlagUnknownError: If the series contains values with bits not in this flag system.
@@ -147,16 +147,22 @@ class CategoricalSingleFlag(FlagSystemBase, Enum, metaclass=CategoricalSingleMet
         return type(first.value)
 
     @classmethod
-    def validate_column(cls, series: pl.Series) -> None:
+    def validate_column(cls, series: pl.Series, storage: str = "values") -> None:
         """Validate that all non-null values in ``series`` are valid for this flag system.
 
         Args:
-            series: The Polars Series to validate. Expected to contain scalar values.
+            series: The Polars Series to validate. Expected to contain scalar values, or an ``Enum`` of the flag
+                values as strings when ``storage`` is ``"enum"``.
+            storage: The storage that the column is registered with.
 
         Raises:
+            CategoricalFlagTypeError: If the series is an ``Enum`` and ``storage`` is ``"values"``.
             CategoricalFlagUnknownError: If the series contains values not in this flag system.
         """
         valid_values = set(cls.to_dict().values())
+        if isinstance(series.dtype, pl.Enum):
+            cls._check_enum_storage(series, storage)
+            valid_values = {str(value) for value in valid_values}
         unknown = set(series.drop_nulls().unique().to_list()) - valid_values
 
         if unknown:
@@ -164,6 +170,25 @@ class CategoricalSingleFlag(FlagSystemBase, Enum, metaclass=CategoricalSingleMet
                 f"Column '{series.name}' contains values not in flag system '{cls.system_name()}': {sorted(unknown)}."
             )
 
+    @classmethod
+    def _check_enum_storage(cls, series: pl.Series, storage: str) -> None:
+        """Check that a column of ``Enum`` flag values is not registered with ``"values"`` storage.
+
+        ``"values"`` storage holds the raw flag values, which an ``Enum`` column is not converted back to.
+
+        Args:
+            series: The Polars Series to check.
+            storage: The storage that the column is registered with.
+
+        Raises:
+            CategoricalFlagTypeError: If ``storage`` is ``"values"``.
+        """
+        if storage == "values":
+            raise CategoricalFlagTypeError(
+                f"Column '{series.name}' of type {series.dtype} cannot be registered to flag system "
+                f"'{cls.system_name()}' with 'values' storage. Use 'enum' storage instead."
+            )
+
 
 class CategoricalListFlag(CategoricalSingleFlag, metaclass=CategoricalListMeta):
     """A categorical flag enum where each row holds a list of flag values.
@@ -173,17 +198,33 @@ class CategoricalListFlag(CategoricalSingleFlag, metaclass=CategoricalListMeta):
     """
 
     @classmethod
-    def validate_column(cls, series: pl.Series) -> None:
+    def validate_column(cls, series: pl.Series, storage: str = "values") -> None:
         """Validate that all non-null values in ``series`` are valid for this flag system.
 
         Args:
-            series: The Polars Series to validate. Expected to contain lists of values; the series
-                is exploded before validation.
+            series: The Polars Series to validate. Expected to contain lists of values (or of an ``Enum`` of the
+                flag values as strings, unless ``storage`` is ``"values"``); the series is exploded before validation.
+                When ``storage`` is ``"bitset"``, a ``UInt64`` series is taken to hold packed bitsets, where each flag
+                is the bit at its position in the flag system.
+            storage: The storage that the column is registered with.
 
         Raises:
+            CategoricalFlagTypeError: If the series holds ``Enum`` values and ``storage`` is ``"values"``.
             CategoricalFlagUnknownError: If the series contains values not in this flag system.
         """
+        if series.dtype == pl.UInt64 and storage == "bitset":
+            n_flags = len(cls.__members__)
+            if n_flags < 64 and (series.drop_nulls() >= 1 << n_flags).any():
+                raise CategoricalFlagUnknownError(
+                    f"Column '{series.name}' contains bits beyond the {n_flags} flags of flag system "
+                    f"'{cls.system_name()}'."
+                )
+            return
+
         valid_values = set(cls.to_dict().values())
+        if isinstance(series.dtype, pl.List) and isinstance(series.dtype.inner, pl.Enum):
+            cls._check_enum_storage(series, storage)
+            valid_values = {str(value) for value in valid_values}
         unknown = set(series.explode(empty_as_null=True).drop_nulls().unique().to_list()) - valid_values
 
         if unknown:
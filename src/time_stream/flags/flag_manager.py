@@ -15,9 +15,13 @@ Typical use from within the ``TimeFrame`` class:
     3) Use ``add_flag`` / ``remove_flag`` on the flag column, with Polars expressions to modify the flag values.
 """
 
+import copy
+import operator
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
+from functools import reduce
+from typing import Literal
 
 import polars as pl
 
@@ -36,6 +40,109 @@ from time_stream.flags.flag_system import FlagSystemBase, FlagSystemLiteral
 
 FlagSystemType = Mapping[str, int | str] | list[str] | None
 
+#: Specification of one update in a batch of flag updates: ``(flag column name, flag value, expr, action)``, where
+#: ``expr`` defines the rows to update and ``action`` is ``"add"`` or ``"remove"``.
+FlagUpdateSpec = tuple[str, int | str, pl.Expr | pl.Series, Literal["add", "remove"]]
+
+#: One update of a single flag column in a batch of flag updates: ``(flag value, expr, action)``.
+FlagColumnUpdate = tuple[int | str, pl.Expr | pl.Series, Literal["add", "remove"]]
+
+#: How the values of a categorical flag column are held in the DataFrame: ``"values"`` holds the raw flag values
+#: (``Int32`` or ``Utf8``), ``"enum"`` holds a ``pl.Enum`` whose categories are the flag values of the flag system,
+#: and ``"bitset"`` (list flag systems only) packs each list into a ``UInt64`` bitmask of the flag positions.
+FlagStorageLiteral = Literal["values", "enum", "bitset"]
+
+#: The largest number of flags that a ``"bitset"`` flag column can hold, one per bit of a ``UInt64``.
+MAX_BITSET_FLAGS = 64
+
+
+def _enum_dtype(flag_system: type[CategoricalSingleFlag], decoded: bool = False) -> pl.Enum:
+    """The ``pl.Enum`` dtype of a categorical flag column with ``"enum"`` storage.
+
+    The encoded and decoded dtypes list the flag values and flag names in the same order, so both share the same
+    physical codes and converting between them does not touch the data.
+
+    Args:
+        flag_system: The categorical flag system.
+        decoded: Whether to return the dtype of the decoded (flag-name) form, rather than the encoded form.
+
+    Returns:
+        The ``pl.Enum`` dtype. The categories of the encoded form are the flag values as strings.
+    """
+    flag_map = flag_system.to_dict()
+    return pl.Enum(list(flag_map.keys()) if decoded else [str(value) for value in flag_map.values()])
+
+
+def _recode_enum(expr: pl.Expr, dtype: pl.Enum) -> pl.Expr:
+    """Reinterpret the physical codes of an ``Enum`` expression as another ``Enum`` dtype of the same length.
+
+    Args:
+        expr: The ``Enum`` expression.
+        dtype: The ``Enum`` dtype to reinterpret the codes as.
+
+    Returns:
+        The expression, with the new dtype.
+    """
+    return expr.cat.physical().cat.to(dtype)
+
+
+def _first_match(cases: Sequence[tuple[pl.Expr | pl.Series, pl.Expr]], default: pl.Expr) -> pl.Expr:
+    """The value of the first case whose condition is true, or ``default`` where none is.
+
+    The cases are chained in a single ``when``/``then`` expression, rather than nested, so the size of the expression
+    only grows linearly with the number of cases.
+
+    Args:
+        cases: The ``(condition, value)`` cases, in order of precedence.
+        default: The value where no condition is true.
+
+    Returns:
+        A Polars expression.
+    """
+    if not cases:
+        return default
+    (condition, value), *rest = cases
+    chain = pl.when(condition).then(value)
+    for condition, value in rest:
+        chain = chain.when(condition).then(value)
+    return chain.otherwise(default)
+
+
+def _bits_updates_expr(
+    base: pl.Expr, updates: Sequence[tuple[int, pl.Expr | pl.Series, str]], bits_lit: Callable[[int], pl.Expr]
+) -> pl.Expr:
+    """Expression for an integer bitmask column with many bits set and cleared in order.
+
+    The last update to touch a bit in a row decides whether the bit is set or cleared there. The bits to set are then
+    OR-ed into the column, and the bits to clear are cleared with a single AND NOT.
+
+    Args:
+        base: Expression for the current bitmask column.
+        updates: The updates, each given as ``(bit, rows to update, action)``, in the order they are applied.
+        bits_lit: Function returning a literal expression of a bitmask, in the dtype of the column.
+
+    Returns:
+        A Polars expression for the updated bitmask column.
+    """
+    updates_by_bit: dict[int, list[tuple[pl.Expr | pl.Series, pl.Expr]]] = {}
+    removed_bits = set()
+    for bit, expr, action in updates:
+        updates_by_bit.setdefault(bit, []).append((expr, pl.lit(action == "add")))
+        if action == "remove":
+            removed_bits.add(bit)
+
+    set_bits, clear_bits = [], []
+    for bit, bit_updates in updates_by_bit.items():
+        # True where the bit ends up set, False where it ends up cleared, and null where it is not touched
+        is_set = _first_match(bit_updates[::-1], pl.lit(None, dtype=pl.Boolean))
+        set_bits.append(pl.when(is_set).then(bits_lit(bit)).otherwise(bits_lit(0)))
+        if bit in removed_bits:
+            clear_bits.append(pl.when(~is_set).then(bits_lit(bit)).otherwise(bits_lit(0)))
+
+    # Bits that are only ever added never need clearing, so a batch of adds is a single OR
+    updated = base | reduce(operator.or_, set_bits)
+    return updated & ~reduce(operator.or_, clear_bits) if clear_bits else updated
+
 
 class FlagColumn(ABC):
     """Abstract base class for flag columns in a TimeFrame.
@@ -51,11 +158,13 @@ class FlagColumn(ABC):
         name: Name of the flag column in the DataFrame.
         flag_system: The flag system enum class governing this column.
         is_decoded: Whether the column is currently in decoded (human-readable) form.
+        storage: How the column values are held in the DataFrame.
     """
 
     name: str
     flag_system: type[FlagSystemBase]
     is_decoded: bool
+    storage: FlagStorageLiteral
 
     @abstractmethod
     def decode(self, df: pl.DataFrame) -> pl.DataFrame:
@@ -109,6 +218,87 @@ class FlagColumn(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def add_flag_expr(
+        self, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True), base: pl.Expr | None = None
+    ) -> pl.Expr:
+        """Return an expression for the encoded flag column with a flag value added to rows where ``expr`` is true.
+
+        Operating on expressions rather than DataFrames allows flag updates to be embedded in a larger Polars
+        query, such as a lazy query plan or a single ``with_columns`` call.
+
+        Args:
+            flag: The flag name or value to add.
+            expr: A Polars expression defining which rows to update.
+            base: Expression for the current (encoded) column values. Defaults to the flag column itself.
+
+        Returns:
+            A Polars expression for the updated, encoded flag column.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_flag_expr(
+        self, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True), base: pl.Expr | None = None
+    ) -> pl.Expr:
+        """Return an expression for the encoded flag column with a flag value removed from rows where ``expr`` is true.
+
+        Args:
+            flag: The flag name or value to remove.
+            expr: A Polars expression defining which rows to update.
+            base: Expression for the current (encoded) column values. Defaults to the flag column itself.
+
+        Returns:
+            A Polars expression for the updated, encoded flag column.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def updates_expr(self, updates: Sequence[FlagColumnUpdate]) -> pl.Expr:
+        """Return an expression for the encoded flag column with many flag values added and removed in order.
+
+        The result is the same as applying ``add_flag_expr`` and ``remove_flag_expr`` for each update in turn, but the
+        updates are folded into a single expression, whose size grows linearly with the number of updates. The flag
+        column is therefore only rewritten once, however many updates there are.
+
+        Args:
+            updates: The updates, each given as ``(flag value, rows to update, action)``, where ``action`` is ``"add"``
+                or ``"remove"``.
+
+        Returns:
+            A Polars expression for the updated, encoded flag column.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_exprs(self, count: pl.Expr) -> list[pl.Expr]:
+        """Return expressions for the number of rows that carry each flag, from the distinct values of the column.
+
+        The expressions are evaluated over a table of the distinct (encoded) values of the flag column, alongside
+        ``count``, the number of rows holding each value. The flag column itself therefore only needs to be read once,
+        however many flags there are.
+
+        Args:
+            count: Expression for the number of rows holding each distinct value.
+
+        Returns:
+            One aggregation expression per flag, named after the flag, in flag system order.
+        """
+        raise NotImplementedError
+
+    def to_storage(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Convert a column of raw flag values into the storage of this flag column.
+
+        A column that is already held in the storage of this flag column is left as it is.
+
+        Args:
+            df: The DataFrame containing the raw-value flag column.
+
+        Returns:
+            A new DataFrame with the flag column held in the storage of this flag column.
+        """
+        return df
+
     @abstractmethod
     def filter_expr(self, flags: list[int | str]) -> pl.Expr:
         """Return a boolean Polars expression that is True for rows where any of the given flags are set.
@@ -134,11 +324,13 @@ class BitwiseFlagColumn(FlagColumn):
         name: Name of the flag column in the DataFrame.
         flag_system: The ``BitwiseFlag`` enum class that defines the available flags and their bit values.
         is_decoded: Whether the column is currently in decoded ``List(String)`` form rather than integer form.
+        storage: How the column values are held. Bitwise flag columns always hold the raw integer ``"values"``.
     """
 
     name: str
     flag_system: type[BitwiseFlag]  # type: ignore[override]
     is_decoded: bool = False
+    storage: FlagStorageLiteral = "values"
 
     def decode(self, df: pl.DataFrame) -> pl.DataFrame:
         """Replace the integer flag column with a ``List(String)`` column of active flag names.
@@ -146,6 +338,9 @@ class BitwiseFlagColumn(FlagColumn):
         Each row contains the names of flags that are set, sorted by ascending 'bit' value. A value of 0 produces an
         empty list.
 
+        A flag column usually only holds a few distinct combinations of flags, so each distinct value is decoded once
+        into a small lookup table, which is then mapped back onto the rows of the column.
+
         Args:
             df: The DataFrame containing the integer flag column.
 
@@ -155,18 +350,26 @@ class BitwiseFlagColumn(FlagColumn):
         # Sort the flag system mapping into ascending bit value order
         flag_map = sorted(self.flag_system.to_dict().items(), key=lambda kv: kv[1])
 
-        # Build expressions for decoding each flag value
+        # Build expressions for decoding each flag value, and use them to decode the distinct values of the column
         exprs = [
             pl.when((pl.col(self.name) & pl.lit(val)) != 0).then(pl.lit(name)).otherwise(pl.lit(None))
             for name, val in flag_map
         ]
-        return df.with_columns(pl.concat_list(exprs).list.drop_nulls().alias(self.name))
+        lookup = df.select(pl.col(self.name).unique().drop_nulls()).with_columns(
+            pl.concat_list(exprs).list.drop_nulls().alias("__names")
+        )
+
+        decoded = df.select(self.name).join(lookup, on=self.name, how="left", maintain_order="left")["__names"]
+        return df.with_columns(decoded.fill_null(pl.lit([], dtype=pl.List(pl.String))).alias(self.name))
 
     def encode(self, df: pl.DataFrame) -> pl.DataFrame:
         """Replace a ``List(String)`` flag column with a bitwise integer column.
 
         Each flag name in the list contributes its bit value. An empty list produces 0.
 
+        As with :meth:`decode`, each distinct list of flag names is only encoded once, into a small lookup table that
+        is mapped back onto the rows of the column.
+
         Args:
             df: The DataFrame containing the decoded ``List(String)`` flag column.
 
@@ -177,18 +380,19 @@ class BitwiseFlagColumn(FlagColumn):
             BitwiseFlagUnknownError: If any flag name in the column is not in the flag system.
         """
         flag_map = self.flag_system.to_dict()
-        present = set(df[self.name].explode(empty_as_null=True).drop_nulls().unique().to_list())
+        lookup = df.select(pl.col(self.name).unique().drop_nulls())
+
+        present = set(lookup[self.name].explode(empty_as_null=True).drop_nulls().unique().to_list())
         unknown = present - flag_map.keys()
         if unknown:
             raise BitwiseFlagUnknownError(f"Unknown flag names in column '{self.name}': {sorted(unknown)}.")
 
-        exprs = [
-            pl.when(pl.col(self.name).list.contains(pl.lit(name)))
-            .then(pl.lit(val, dtype=pl.Int64))
-            .otherwise(pl.lit(0, dtype=pl.Int64))
-            for name, val in flag_map.items()
-        ]
-        return df.with_columns(pl.sum_horizontal(exprs).alias(self.name))
+        # Combine the bit values of the names in each list with a bitwise OR, so repeated names only count once
+        bits = pl.element().replace_strict(flag_map, return_dtype=pl.Int64).bitwise_or()
+        lookup = lookup.with_columns(pl.col(self.name).list.eval(bits).list.first().fill_null(0).alias("__value"))
+
+        encoded = df.select(self.name).join(lookup, on=self.name, how="left", maintain_order="left")["__value"]
+        return df.with_columns(encoded.fill_null(0).alias(self.name))
 
     def add_flag(self, df: pl.DataFrame, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True)) -> pl.DataFrame:
         """Add a flag value to this ``BitwiseFlagColumn`` using a bitwise OR operation.
@@ -204,16 +408,31 @@ class BitwiseFlagColumn(FlagColumn):
         Returns:
             A new DataFrame with the flag column updated.
         """
-        flag_value = self.flag_system.get_flag(flag)
+        flag_expr = self.add_flag_expr(flag, expr)
         if self.is_decoded:
             df = self.encode(df)
-        df = df.with_columns(
-            pl.when(expr).then(pl.col(self.name) | pl.lit(flag_value)).otherwise(pl.col(self.name)).alias(self.name)
-        )
+        df = df.with_columns(flag_expr.alias(self.name))
         if self.is_decoded:
             df = self.decode(df)
         return df
 
+    def add_flag_expr(
+        self, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True), base: pl.Expr | None = None
+    ) -> pl.Expr:
+        """Return an expression that applies a bitwise OR of the flag value where ``expr`` is true.
+
+        Args:
+            flag: The flag name or value to add.
+            expr: A Polars expression defining the condition for applying the flag.
+            base: Expression for the current integer column values. Defaults to the flag column itself.
+
+        Returns:
+            A Polars expression for the updated integer flag column.
+        """
+        flag_value = self.flag_system.get_flag(flag)
+        base = pl.col(self.name) if base is None else base
+        return pl.when(expr).then(base | pl.lit(flag_value)).otherwise(base)
+
     def remove_flag(self, df: pl.DataFrame, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True)) -> pl.DataFrame:
         """Remove a flag value from this ``BitwiseFlagColumn`` using a bitwise AND NOT operation.
 
@@ -228,16 +447,46 @@ class BitwiseFlagColumn(FlagColumn):
         Returns:
             A new DataFrame with the flag column updated.
         """
-        flag_value = self.flag_system.get_flag(flag)
+        flag_expr = self.remove_flag_expr(flag, expr)
         if self.is_decoded:
             df = self.encode(df)
-        df = df.with_columns(
-            pl.when(expr).then(pl.col(self.name) & ~pl.lit(flag_value)).otherwise(pl.col(self.name)).alias(self.name)
-        )
+        df = df.with_columns(flag_expr.alias(self.name))
         if self.is_decoded:
             df = self.decode(df)
         return df
 
+    def remove_flag_expr(
+        self, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True), base: pl.Expr | None = None
+    ) -> pl.Expr:
+        """Return an expression that clears the flag bit using a bitwise AND NOT where ``expr`` is true.
+
+        Args:
+            flag: The flag name or value to remove.
+            expr: A Polars expression defining which rows to update.
+            base: Expression for the current integer column values. Defaults to the flag column itself.
+
+        Returns:
+            A Polars expression for the updated integer flag column.
+        """
+        flag_value = self.flag_system.get_flag(flag)
+        base = pl.col(self.name) if base is None else base
+        return pl.when(expr).then(base & ~pl.lit(flag_value)).otherwise(base)
+
+    def updates_expr(self, updates: Sequence[FlagColumnUpdate]) -> pl.Expr:
+        """Return an expression that sets and clears the bits of many flag values in order.
+
+        The last update of each flag in a row decides whether its bit is set or cleared there. The bits to set are
+        OR-ed into the column, and the bits to clear are removed with a single AND NOT.
+
+        Args:
+            updates: The updates, each given as ``(flag value, rows to update, action)``.
+
+        Returns:
+            A Polars expression for the updated integer flag column.
+        """
+        bit_updates = [(self.flag_system.get_flag(flag).value, expr, action) for flag, expr, action in updates]
+        return _bits_updates_expr(pl.col(self.name), bit_updates, pl.lit)
+
     def filter_expr(self, flags: list[int | str]) -> pl.Expr:
         """Return a boolean expression that is True for rows where any of the given flags are set.
 
@@ -265,6 +514,20 @@ class BitwiseFlagColumn(FlagColumn):
             combined |= int(f)
         return (pl.col(self.name) & pl.lit(combined)) != 0
 
+    def count_exprs(self, count: pl.Expr) -> list[pl.Expr]:
+        """Return expressions for the number of rows that have each flag bit set, from the distinct integer values.
+
+        Args:
+            count: Expression for the number of rows holding each distinct value.
+
+        Returns:
+            One aggregation expression per flag, named after the flag, in flag system order.
+        """
+        return [
+            count.filter((pl.col(self.name) & pl.lit(flag.value)) != 0).sum().alias(name)
+            for name, flag in self.flag_system.__members__.items()
+        ]
+
     def __eq__(self, other: object) -> bool:
         """Check if two ``BitwiseFlagColumn`` instances are equal.
 
@@ -297,23 +560,30 @@ class CategoricalSingleFlagColumn(FlagColumn):
         name: Name of the flag column in the DataFrame.
         flag_system: The ``CategoricalSingleFlag`` enum class that defines the available flag values.
         is_decoded: Whether the column is currently in decoded (flag-name) form rather than raw-value form.
+        storage: How the column values are held. ``"values"`` holds the raw flag values; ``"enum"`` holds a
+            ``pl.Enum`` of the flag values (decoded: of the flag names), so each row is a small physical code.
     """
 
     name: str
     flag_system: type[CategoricalSingleFlag]  # type: ignore[override]
     is_decoded: bool = False
+    storage: FlagStorageLiteral = "values"
 
     def decode(self, df: pl.DataFrame) -> pl.DataFrame:
         """Replace raw flag values with their flag names.
 
-        Each value is replaced by its name (e.g. ``123 -> "good"``).
+        Each value is replaced by its name (e.g. ``123 -> "good"``). With ``"enum"`` storage, the physical codes are
+        kept and only reinterpreted as an ``Enum`` of the flag names.
 
         Args:
             df: The DataFrame containing the raw-value flag column.
 
         Returns:
-            A new DataFrame with the flag column replaced by a ``Utf8`` column of flag names.
+            A new DataFrame with the flag column replaced by a ``Utf8`` (or ``Enum``) column of flag names.
         """
+        if self.storage == "enum":
+            return df.with_columns(_recode_enum(pl.col(self.name), _enum_dtype(self.flag_system, decoded=True)))
+
         flag_map = self.flag_system.to_dict()
         old = list(flag_map.values())
         new = list(flag_map.keys())
@@ -339,10 +609,16 @@ class CategoricalSingleFlagColumn(FlagColumn):
         vtype = self.flag_system.value_type()
         return_dtype = pl.Int32 if vtype is int else pl.Utf8
 
-        present = set(df[self.name].drop_nulls().unique().to_list())
-        unknown = present - flag_map.keys()
-        if unknown:
-            raise CategoricalFlagUnknownError(f"Unknown flag names in column '{self.name}': {sorted(unknown)}.")
+        if self.storage == "enum":
+            names_dtype = _enum_dtype(self.flag_system, decoded=True)
+            column = pl.col(self.name)
+            if df.schema[self.name] != names_dtype:
+                # The names can only be outside the flag system if the column has been replaced with plain strings
+                self._check_names(df[self.name].drop_nulls().unique().to_list())
+                column = column.cast(names_dtype)
+            return df.with_columns(_recode_enum(column, _enum_dtype(self.flag_system)))
+
+        self._check_names(df[self.name].drop_nulls().unique().to_list())
 
         old = list(flag_map.keys())
         new = list(flag_map.values())
@@ -375,18 +651,38 @@ class CategoricalSingleFlagColumn(FlagColumn):
         Returns:
             A new DataFrame with the flag column updated.
         """
-        value = self.flag_system.get_flag(flag)
+        flag_expr = self.add_flag_expr(flag, expr, overwrite=overwrite)
         if self.is_decoded:
             df = self.encode(df)
-        col_dtype = df[self.name].dtype
-        condition = expr if overwrite else (expr & pl.col(self.name).is_null())
-        df = df.with_columns(
-            pl.when(condition).then(pl.lit(value, dtype=col_dtype)).otherwise(pl.col(self.name)).alias(self.name)
-        )
+        df = df.with_columns(flag_expr.cast(df.collect_schema()[self.name]).alias(self.name))
         if self.is_decoded:
             df = self.decode(df)
         return df
 
+    def add_flag_expr(
+        self,
+        flag: int | str,
+        expr: pl.Expr | pl.Series = pl.lit(True),
+        base: pl.Expr | None = None,
+        overwrite: bool = True,
+    ) -> pl.Expr:
+        """Return an expression that sets the flag value on rows where ``expr`` is true.
+
+        Args:
+            flag: The flag name or value to set.
+            expr: A Polars expression defining which rows to update.
+            base: Expression for the current raw-value column. Defaults to the flag column itself.
+            overwrite: If ``True`` (default), replaces any existing value. If ``False``,
+                only updates rows whose current value is null.
+
+        Returns:
+            A Polars expression for the updated raw-value flag column.
+        """
+        flag_value = self._flag_lit(self.flag_system.get_flag(flag))
+        base = pl.col(self.name) if base is None else base
+        condition = expr if overwrite else (expr & base.is_null())
+        return pl.when(condition).then(flag_value).otherwise(base)
+
     def remove_flag(self, df: pl.DataFrame, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True)) -> pl.DataFrame:
         """Set the column value to null on rows where ``expr`` is true.
 
@@ -402,17 +698,77 @@ class CategoricalSingleFlagColumn(FlagColumn):
         Returns:
             A new DataFrame with the flag column updated.
         """
-        self.flag_system.get_flag(flag)
+        flag_expr = self.remove_flag_expr(flag, expr)
         if self.is_decoded:
             df = self.encode(df)
-        col_dtype = df[self.name].dtype
-        df = df.with_columns(
-            pl.when(expr).then(pl.lit(None, dtype=col_dtype)).otherwise(pl.col(self.name)).alias(self.name)
-        )
+        df = df.with_columns(flag_expr.cast(df.collect_schema()[self.name]).alias(self.name))
         if self.is_decoded:
             df = self.decode(df)
         return df
 
+    def remove_flag_expr(
+        self, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True), base: pl.Expr | None = None
+    ) -> pl.Expr:
+        """Return an expression that sets the column value to null on rows where ``expr`` is true.
+
+        Args:
+            flag: The flag name or value to remove.
+            expr: A Polars expression defining which rows to update.
+            base: Expression for the current raw-value column. Defaults to the flag column itself.
+
+        Returns:
+            A Polars expression for the updated raw-value flag column.
+        """
+        self.flag_system.get_flag(flag)
+        base = pl.col(self.name) if base is None else base
+        return pl.when(expr).then(pl.lit(None)).otherwise(base)
+
+    def updates_expr(self, updates: Sequence[FlagColumnUpdate]) -> pl.Expr:
+        """Return an expression that sets and clears the column value of many updates in order.
+
+        Each row takes the value of the last update that applies to it: the flag value for an add, or null for a
+        removal. Rows that no update applies to are unchanged.
+
+        Args:
+            updates: The updates, each given as ``(flag value, rows to update, action)``.
+
+        Returns:
+            A Polars expression for the updated raw-value flag column.
+        """
+        cases = []
+        for flag, expr, action in updates:
+            flag_value = self._flag_lit(self.flag_system.get_flag(flag))
+            cases.append((expr, flag_value if action == "add" else pl.lit(None)))
+        return _first_match(cases[::-1], pl.col(self.name))
+
+    def count_exprs(self, count: pl.Expr) -> list[pl.Expr]:
+        """Return expressions for the number of rows that hold each flag value, from the distinct values.
+
+        Args:
+            count: Expression for the number of rows holding each distinct value.
+
+        Returns:
+            One aggregation expression per flag, named after the flag, in flag system order.
+        """
+        return [
+            count.filter(pl.col(self.name) == self._flag_lit(flag)).sum().alias(flag.name) for flag in self.flag_system
+        ]
+
+    def to_storage(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Convert a column of raw flag values into the storage of this flag column.
+
+        With ``"enum"`` storage, the values are cast to the ``pl.Enum`` of the flag values.
+
+        Args:
+            df: The DataFrame containing the raw-value flag column.
+
+        Returns:
+            A new DataFrame with the flag column held in the storage of this flag column.
+        """
+        if self.storage == "enum" and df.schema[self.name] != _enum_dtype(self.flag_system):
+            return df.with_columns(pl.col(self.name).cast(pl.Utf8).cast(_enum_dtype(self.flag_system)))
+        return df
+
     def filter_expr(self, flags: list[int | str]) -> pl.Expr:
         """Return a boolean expression that is True for rows where the column value matches any of the given flags.
 
@@ -426,24 +782,54 @@ class CategoricalSingleFlagColumn(FlagColumn):
             CategoricalFlagUnknownError: If any flag is not in the flag system.
         """
         flag_members = [self.flag_system.get_flag(f) for f in flags]
+        if self.storage == "enum":
+            return pl.any_horizontal([pl.col(self.name) == self._flag_lit(f, self.is_decoded) for f in flag_members])
         values = [f.name if self.is_decoded else f.value for f in flag_members]
         return pl.col(self.name).is_in(values)
 
+    def _check_names(self, names: list[str]) -> None:
+        """Check that flag names are all in the flag system.
+
+        Args:
+            names: The distinct flag names in the column.
+
+        Raises:
+            CategoricalFlagUnknownError: If any flag name is not in the flag system.
+        """
+        unknown = set(names) - self.flag_system.to_dict().keys()
+        if unknown:
+            raise CategoricalFlagUnknownError(f"Unknown flag names in column '{self.name}': {sorted(unknown)}.")
+
+    def _flag_lit(self, flag: CategoricalSingleFlag, decoded: bool = False) -> pl.Expr:
+        """Literal expression of a flag, in the dtype that the column values are held in.
+
+        Args:
+            flag: The flag.
+            decoded: Whether to return the flag name (for the decoded column), rather than the flag value.
+
+        Returns:
+            A Polars literal expression.
+        """
+        value = flag.name if decoded else flag.value
+        if self.storage == "enum":
+            return pl.lit(str(value), dtype=_enum_dtype(self.flag_system, decoded))
+        return pl.lit(value)
+
     def __eq__(self, other: object) -> bool:
         """Check if two ``CategoricalSingleFlagColumn`` instances are equal.
 
-        Compares ``name`` and ``flag_system`` only. ``is_decoded`` is runtime state and is excluded
+        Compares ``name``, ``flag_system`` and ``storage``. ``is_decoded`` is runtime state and is excluded
         from the comparison.
 
         Args:
             other: The object to compare.
 
         Returns:
-            True if both instances have the same name and flag system, False otherwise.
+            True if both instances have the same name, flag system and storage, False otherwise.
         """
         if not isinstance(other, CategoricalSingleFlagColumn):
             return False
-        return self.name == other.name and self.flag_system == other.flag_system
+        return self.name == other.name and self.flag_system == other.flag_system and self.storage == other.storage
 
     # Make class instances unhashable
     __hash__ = None  # type: ignore[assignment]
@@ -460,23 +846,47 @@ class CategoricalListFlagColumn(FlagColumn):
         name: Name of the flag column in the DataFrame.
         flag_system: The ``CategoricalListFlag`` enum class that defines the available flag values.
         is_decoded: Whether the column is currently in decoded (flag-name) form rather than raw-value form.
+        storage: How the list elements are held. ``"values"`` holds the raw flag values; ``"enum"`` holds a
+            ``pl.Enum`` of the flag values (decoded: of the flag names), so each element is a small physical code;
+            ``"bitset"`` packs each list into a ``UInt64`` bitmask, where each flag is the bit at its position in the
+            flag system. A bitset column is decoded to a ``List(Utf8)`` of flag names, in flag system order.
     """
 
     name: str
     flag_system: type[CategoricalListFlag]  # type: ignore[override]
     is_decoded: bool = False
+    storage: FlagStorageLiteral = "values"
 
     def decode(self, df: pl.DataFrame) -> pl.DataFrame:
         """Replace raw flag values in each list with their flag names.
 
-        Each element of each list is replaced by its name.
+        Each element of each list is replaced by its name. With ``"enum"`` storage, the physical codes are kept and
+        only reinterpreted as an ``Enum`` of the flag names. With ``"bitset"`` storage, each bitmask is unpacked into
+        a list of the names of the flags that are set, in flag system order.
 
         Args:
             df: The DataFrame containing the raw-value flag column.
 
         Returns:
-            A new DataFrame with the flag column replaced by a ``List(Utf8)`` column of flag names.
+            A new DataFrame with the flag column replaced by a ``List(Utf8)`` (or ``List(Enum)``) column of flag names.
         """
+        if self.storage == "enum":
+            names_dtype = _enum_dtype(self.flag_system, decoded=True)
+            return df.with_columns(pl.col(self.name).list.eval(_recode_enum(pl.element(), names_dtype)))
+
+        if self.storage == "bitset":
+            # A bitset column usually only holds a few distinct combinations of flags, so each distinct bitmask is
+            # unpacked once into a small lookup table, which is then mapped back onto the rows of the column
+            exprs = [
+                pl.when((pl.col(self.name) & self._bits_lit(self._flag_bit(flag))) != 0).then(pl.lit(flag.name))
+                for flag in self.flag_system
+            ]
+            lookup = df.select(pl.col(self.name).unique().drop_nulls()).with_columns(
+                pl.concat_list(exprs).list.drop_nulls().alias("__names")
+            )
+            decoded = df.select(self.name).join(lookup, on=self.name, how="left", maintain_order="left")["__names"]
+            return df.with_columns(decoded.alias(self.name))
+
         flag_map = self.flag_system.to_dict()
         old = list(flag_map.values())
         new = list(flag_map.keys())
@@ -489,7 +899,8 @@ class CategoricalListFlagColumn(FlagColumn):
     def encode(self, df: pl.DataFrame) -> pl.DataFrame:
         """Replace flag names in each list back to their raw values.
 
-        Each element of each list is replaced by its value.
+        Each element of each list is replaced by its value. With ``"bitset"`` storage, each list is packed back into
+        a bitmask.
 
         Args:
             df: The DataFrame containing the decoded (flag-name) flag column.
@@ -504,10 +915,19 @@ class CategoricalListFlagColumn(FlagColumn):
         vtype = self.flag_system.value_type()
         return_dtype = pl.Int32 if vtype is int else pl.Utf8
 
-        present = set(df[self.name].explode(empty_as_null=True).drop_nulls().unique().to_list())
-        unknown = present - flag_map.keys()
-        if unknown:
-            raise CategoricalFlagUnknownError(f"Unknown flag names in column '{self.name}': {sorted(unknown)}.")
+        if self.storage == "enum":
+            names_dtype = _enum_dtype(self.flag_system, decoded=True)
+            column = pl.col(self.name)
+            if df.schema[self.name] != pl.List(names_dtype):
+                # The names can only be outside the flag system if the column has been replaced with plain strings
+                self._check_names(df[self.name].explode(empty_as_null=True).drop_nulls().unique().to_list())
+                column = column.cast(pl.List(names_dtype))
+            return df.with_columns(column.list.eval(_recode_enum(pl.element(), _enum_dtype(self.flag_system))))
+
+        self._check_names(df[self.name].explode(empty_as_null=True).drop_nulls().unique().to_list())
+
+        if self.storage == "bitset":
+            return self._pack_bits(df, {flag.name: self._flag_bit(flag) for flag in self.flag_system})
 
         old = list(flag_map.keys())
         new = list(flag_map.values())
@@ -534,19 +954,39 @@ class CategoricalListFlagColumn(FlagColumn):
         Returns:
             A new DataFrame with the flag column updated.
         """
-        value = self.flag_system.get_flag(flag)
+        flag_expr = self.add_flag_expr(flag, expr)
         if self.is_decoded:
             df = self.encode(df)
-        df = df.with_columns(
-            pl.when(expr & ~pl.col(self.name).list.contains(pl.lit(value)))
-            .then(pl.concat_list([pl.col(self.name), pl.lit(value).implode()]))
-            .otherwise(pl.col(self.name))
-            .alias(self.name)
-        )
+        df = df.with_columns(flag_expr.alias(self.name))
         if self.is_decoded:
             df = self.decode(df)
         return df
 
+    def add_flag_expr(
+        self, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True), base: pl.Expr | None = None
+    ) -> pl.Expr:
+        """Return an expression that appends the flag value to the list on rows where ``expr`` is true.
+
+        Args:
+            flag: The flag name or value to append.
+            expr: A Polars expression defining which rows to update.
+            base: Expression for the current raw-value list column. Defaults to the flag column itself.
+
+        Returns:
+            A Polars expression for the updated raw-value list column.
+        """
+        base = pl.col(self.name) if base is None else base
+        if self.storage == "bitset":
+            bit = self._flag_bit(self.flag_system.get_flag(flag))
+            return pl.when(expr).then(base | self._bits_lit(bit)).otherwise(base)
+
+        flag_value = self._flag_lit(self.flag_system.get_flag(flag))
+        return (
+            pl.when(expr & ~base.list.contains(flag_value))
+            .then(pl.concat_list([base, flag_value.implode()]))
+            .otherwise(base)
+        )
+
     def remove_flag(self, df: pl.DataFrame, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True)) -> pl.DataFrame:
         """Remove all occurrences of a flag value from the list on rows where ``expr`` is true.
 
@@ -564,19 +1004,100 @@ class CategoricalListFlagColumn(FlagColumn):
         Returns:
             A new DataFrame with the flag column updated.
         """
-        value = self.flag_system.get_flag(flag)
+        flag_expr = self.remove_flag_expr(flag, expr)
         if self.is_decoded:
             df = self.encode(df)
-        df = df.with_columns(
-            pl.when(expr)
-            .then(pl.col(self.name).list.eval(pl.element().filter(pl.element() != pl.lit(value))))
-            .otherwise(pl.col(self.name))
-            .alias(self.name)
-        )
+        df = df.with_columns(flag_expr.alias(self.name))
         if self.is_decoded:
             df = self.decode(df)
         return df
 
+    def remove_flag_expr(
+        self, flag: int | str, expr: pl.Expr | pl.Series = pl.lit(True), base: pl.Expr | None = None
+    ) -> pl.Expr:
+        """Return an expression that removes all occurrences of the flag value on rows where ``expr`` is true.
+
+        Args:
+            flag: The flag name or value to remove.
+            expr: A Polars expression defining which rows to update.
+            base: Expression for the current raw-value list column. Defaults to the flag column itself.
+
+        Returns:
+            A Polars expression for the updated raw-value list column.
+        """
+        base = pl.col(self.name) if base is None else base
+        if self.storage == "bitset":
+            # Clear the bit by AND-ing with the complement within 64 bits, as the column is unsigned
+            bit = self._flag_bit(self.flag_system.get_flag(flag))
+            return pl.when(expr).then(base & self._bits_lit(~bit & (2**MAX_BITSET_FLAGS - 1))).otherwise(base)
+
+        flag_value = self._flag_lit(self.flag_system.get_flag(flag))
+        return pl.when(expr).then(base.list.eval(pl.element().filter(pl.element() != flag_value))).otherwise(base)
+
+    def updates_expr(self, updates: Sequence[FlagColumnUpdate]) -> pl.Expr:
+        """Return an expression that appends and removes many flag values in order.
+
+        With ``"bitset"`` storage, the last update of each flag in a row decides whether its bit is set or cleared.
+
+        Otherwise, a flag is removed from a row's list if any removal of it applies to the row. It is then appended
+        by the first add that applies after its last removal, or by the first add that applies if it was neither
+        removed nor already in the list. Appended flags are kept in the order of the adds that appended them, so the
+        lists are the same as applying each update in turn.
+
+        Args:
+            updates: The updates, each given as ``(flag value, rows to update, action)``.
+
+        Returns:
+            A Polars expression for the updated raw-value list column (or bitmask).
+        """
+        base = pl.col(self.name)
+        if self.storage == "bitset":
+            bit_updates = [
+                (self._flag_bit(self.flag_system.get_flag(flag)), expr, action) for flag, expr, action in updates
+            ]
+            return _bits_updates_expr(base, bit_updates, self._bits_lit)
+
+        updates_by_flag: dict[CategoricalSingleFlag, list[tuple[int, pl.Expr | pl.Series, str]]] = {}
+        for position, (flag, expr, action) in enumerate(updates):
+            updates_by_flag.setdefault(self.flag_system.get_flag(flag), []).append((position, expr, action))
+
+        removed_counts, appended = [], []
+        for flag, flag_updates in updates_by_flag.items():
+            flag_value = self._flag_lit(flag)
+            removals = [(expr, pl.lit(position)) for position, expr, action in flag_updates if action == "remove"]
+            adds = [(position, expr) for position, expr, action in flag_updates if action == "add"]
+
+            # Position of the last removal that applies to each row, or -1 where none does
+            last_removal = _first_match(removals[::-1], pl.lit(-1))
+            if removals:
+                is_flag = base.list.eval((pl.element() == flag_value).cast(pl.UInt32))
+                removed_counts.append(is_flag * (last_removal >= 0).cast(pl.UInt32))
+            if adds:
+                first_add = _first_match(
+                    [(expr & (last_removal < position), pl.lit(position)) for position, expr in adds],
+                    pl.lit(None, dtype=pl.Int64),
+                )
+                already_in_list = (last_removal < 0) & base.list.contains(flag_value)
+                appended_at = pl.when(already_in_list).then(None).otherwise(first_add)
+                appended.append(pl.struct(appended_at.alias("position"), flag_value.alias("flag")))
+
+        # Keep the elements of each list that are not removed, in their original order
+        kept = base
+        if removed_counts:
+            keep_indices = reduce(operator.add, removed_counts).list.eval((pl.element() == 0).arg_true())
+            kept = base.list.gather(keep_indices)
+        if not appended:
+            return kept
+
+        # Then append the flags that are added, in the order of the adds that appended them
+        position = pl.element().struct.field("position")
+        appended_flags = (
+            pl.concat_list(appended)
+            .list.eval(pl.element().filter(position.is_not_null()))
+            .list.eval(pl.element().sort_by(position).struct.field("flag"))
+        )
+        return pl.concat_list([kept, appended_flags])
+
     def filter_expr(self, flags: list[int | str]) -> pl.Expr:
         """Return a boolean expression that is True for rows where any of the given flags are set.
 
@@ -594,25 +1115,140 @@ class CategoricalListFlagColumn(FlagColumn):
         """
         # Fetch the actual flag enum members based on the flag values provided
         flag_members = [self.flag_system.get_flag(f) for f in flags]
-        values = [f.name if self.is_decoded else f.value for f in flag_members]
-        exprs = [pl.col(self.name).list.contains(pl.lit(v)) for v in values]
+
+        if self.storage == "bitset" and not self.is_decoded:
+            combined = 0
+            for f in flag_members:
+                combined |= self._flag_bit(f)
+            return (pl.col(self.name) & self._bits_lit(combined)) != 0
+
+        exprs = [pl.col(self.name).list.contains(self._flag_lit(f, self.is_decoded)) for f in flag_members]
         return pl.any_horizontal(exprs)
 
+    def count_exprs(self, count: pl.Expr) -> list[pl.Expr]:
+        """Return expressions for the number of rows whose list contains each flag value, from the distinct lists.
+
+        A flag that appears more than once in a list is only counted once for that row. With ``"bitset"`` storage,
+        the distinct bitmasks are tested for the bit of each flag instead.
+
+        Args:
+            count: Expression for the number of rows holding each distinct list (or bitmask).
+
+        Returns:
+            One aggregation expression per flag, named after the flag, in flag system order.
+        """
+        if self.storage == "bitset":
+            has_flag = [(pl.col(self.name) & self._bits_lit(self._flag_bit(flag))) != 0 for flag in self.flag_system]
+        else:
+            has_flag = [pl.col(self.name).list.contains(self._flag_lit(flag)) for flag in self.flag_system]
+        return [count.filter(expr).sum().alias(flag.name) for expr, flag in zip(has_flag, self.flag_system)]
+
+    def to_storage(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Convert a column of raw flag values into the storage of this flag column.
+
+        With ``"enum"`` storage, the list elements are cast to the ``pl.Enum`` of the flag values. With ``"bitset"``
+        storage, each list is packed into a ``UInt64`` bitmask.
+
+        Args:
+            df: The DataFrame containing the raw-value flag column.
+
+        Returns:
+            A new DataFrame with the flag column held in the storage of this flag column.
+        """
+        dtype = df.schema[self.name]
+        if self.storage == "enum" and dtype != pl.List(_enum_dtype(self.flag_system)):
+            enum_dtype = pl.List(_enum_dtype(self.flag_system))
+            return df.with_columns(pl.col(self.name).cast(pl.List(pl.Utf8)).cast(enum_dtype))
+        if self.storage == "bitset" and dtype != pl.UInt64:
+            return self._pack_bits(df, {flag.value: self._flag_bit(flag) for flag in self.flag_system})
+        return df
+
+    def _check_names(self, names: list[str]) -> None:
+        """Check that flag names are all in the flag system.
+
+        Args:
+            names: The distinct flag names in the column.
+
+        Raises:
+            CategoricalFlagUnknownError: If any flag name is not in the flag system.
+        """
+        unknown = set(names) - self.flag_system.to_dict().keys()
+        if unknown:
+            raise CategoricalFlagUnknownError(f"Unknown flag names in column '{self.name}': {sorted(unknown)}.")
+
+    def _flag_lit(self, flag: CategoricalSingleFlag, decoded: bool = False) -> pl.Expr:
+        """Literal expression of a flag, in the dtype that the column values are held in.
+
+        Args:
+            flag: The flag.
+            decoded: Whether to return the flag name (for the decoded column), rather than the flag value.
+
+        Returns:
+            A Polars literal expression.
+        """
+        value = flag.name if decoded else flag.value
+        if self.storage == "enum":
+            return pl.lit(str(value), dtype=_enum_dtype(self.flag_system, decoded))
+        return pl.lit(value)
+
+    def _flag_bit(self, flag: CategoricalSingleFlag) -> int:
+        """The bit of a flag in a ``"bitset"`` flag column, from the position of the flag in the flag system.
+
+        Args:
+            flag: The flag.
+
+        Returns:
+            The bit value of the flag.
+        """
+        return 1 << list(self.flag_system.__members__).index(flag.name)
+
+    @staticmethod
+    def _bits_lit(bits: int) -> pl.Expr:
+        """Literal ``UInt64`` expression of a bitmask, matching the dtype of a ``"bitset"`` flag column.
+
+        Args:
+            bits: The bitmask.
+
+        Returns:
+            A Polars literal expression.
+        """
+        return pl.lit(bits, dtype=pl.UInt64)
+
+    def _pack_bits(self, df: pl.DataFrame, bits: dict[int | str, int]) -> pl.DataFrame:
+        """Pack each list of the flag column into a ``UInt64`` bitmask.
+
+        Each distinct list is packed once, into a small lookup table that is mapped back onto the rows of the column.
+        Null lists are kept as null.
+
+        Args:
+            df: The DataFrame containing the list flag column.
+            bits: Mapping of each list element (flag name or value) to its bit.
+
+        Returns:
+            A new DataFrame with the flag column replaced by a ``UInt64`` column.
+        """
+        packed = pl.element().replace_strict(bits, return_dtype=pl.UInt64).bitwise_or()
+        lookup = df.select(pl.col(self.name).unique().drop_nulls()).with_columns(
+            pl.col(self.name).list.eval(packed).list.first().fill_null(0).alias("__bits")
+        )
+        encoded = df.select(self.name).join(lookup, on=self.name, how="left", maintain_order="left")["__bits"]
+        return df.with_columns(encoded.alias(self.name))
+
     def __eq__(self, other: object) -> bool:
         """Check if two ``CategoricalListFlagColumn`` instances are equal.
 
-        Compares ``name`` and ``flag_system`` only. ``is_decoded`` is runtime state and is excluded
+        Compares ``name``, ``flag_system`` and ``storage``. ``is_decoded`` is runtime state and is excluded
         from the comparison.
 
         Args:
             other: The object to compare.
 
         Returns:
-            True if both instances have the same name and flag system, False otherwise.
+            True if both instances have the same name, flag system and storage, False otherwise.
         """
         if not isinstance(other, CategoricalListFlagColumn):
             return False
-        return self.name == other.name and self.flag_system == other.flag_system
+        return self.name == other.name and self.flag_system == other.flag_system and self.storage == other.storage
 
     # Make class instances unhashable
     __hash__ = None  # type: ignore[assignment]
@@ -740,7 +1376,7 @@ class FlagManager:
         except KeyError:
             raise FlagSystemNotFoundError(f"No such flag system: '{flag_system_name}'")
 
-    def register_flag_column(self, name: str, flag_system_name: str) -> None:
+    def register_flag_column(self, name: str, flag_system_name: str, storage: FlagStorageLiteral = "values") -> None:
         """Mark the specified existing column as a flag column.
 
         The column type (``BitwiseFlagColumn``, ``CategoricalSingleFlagColumn``, or
@@ -749,19 +1385,32 @@ class FlagManager:
         Args:
             name: A column name to mark as a flag column.
             flag_system_name: The name of the flag system.
+            storage: How the values of a categorical flag column are held - ``"values"`` (default), ``"enum"``, or
+                ``"bitset"`` (categorical list systems of up to ``MAX_BITSET_FLAGS`` flags).
 
         Raises:
             FlagSystemError: If a flag column with ``name`` is already registered.
             FlagSystemNotFoundError: If ``flag_system_name`` is not a registered flag system.
+            FlagSystemTypeError: If ``storage`` is not valid for the flag system type.
         """
         if name in self._flag_columns:
             raise FlagSystemError(f"Flag column '{name}' already registered. System: '{flag_system_name}'.")
 
         flag_system = self.get_flag_system(flag_system_name)
+        supported = {
+            "values": True,
+            "enum": flag_system.flag_type != "bitwise",
+            "bitset": flag_system.flag_type == "categorical_list" and len(flag_system.to_dict()) <= MAX_BITSET_FLAGS,
+        }
+        if not supported.get(storage, False):
+            raise FlagSystemTypeError(
+                f"Storage '{storage}' is not supported for {flag_system.flag_type} flag system '{flag_system_name}'."
+            )
+
         if flag_system.flag_type == "categorical_list":
-            self._flag_columns[name] = CategoricalListFlagColumn(name, flag_system)  # type: ignore[arg-type]
+            self._flag_columns[name] = CategoricalListFlagColumn(name, flag_system, storage=storage)  # type: ignore[arg-type]
         elif flag_system.flag_type == "categorical":
-            self._flag_columns[name] = CategoricalSingleFlagColumn(name, flag_system)  # type: ignore[arg-type]
+            self._flag_columns[name] = CategoricalSingleFlagColumn(name, flag_system, storage=storage)  # type: ignore[arg-type]
         else:
             self._flag_columns[name] = BitwiseFlagColumn(name, flag_system)  # type: ignore[arg-type]
 
@@ -784,20 +1433,18 @@ class FlagManager:
             raise ColumnNotFoundError(f"No such flag column: '{name}'.")
 
     def copy(self) -> "FlagManager":
-        """Create a deep copy of this ``FlagManager``, duplicating all registered systems and columns.
+        """Create an independent copy of this ``FlagManager``.
+
+        Flag system classes are immutable, so are shared by reference with the copy. The registries and the flag
+        column objects (which hold the mutable ``is_decoded`` state) are duplicated, so registering or updating
+        entries on either manager does not affect the other.
 
         Returns:
             A new ``FlagManager`` with the same flag systems, flag columns, and ``is_decoded`` state.
         """
         out = FlagManager()
-
-        for name, flag_system in self._flag_systems.items():
-            out.register_flag_system(name, flag_system.to_dict(), flag_type=flag_system.flag_type)
-
-        for name, flag_column in self._flag_columns.items():
-            out.register_flag_column(name, flag_column.flag_system.system_name())
-            out.flag_columns[name].is_decoded = flag_column.is_decoded
-
+        out._flag_systems = dict(self._flag_systems)
+        out._flag_columns = {name: copy.copy(flag_column) for name, flag_column in self._flag_columns.items()}
         return out
 
     def __copy__(self) -> "FlagManager":
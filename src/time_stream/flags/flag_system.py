@@ -113,13 +113,14 @@ class FlagSystemBase:
         raise NotImplementedError
 
     @classmethod
-    def validate_column(cls, series: "pl.Series") -> None:
+    def validate_column(cls, series: "pl.Series", storage: str = "values") -> None:
         """Validate that all non-null values in ``series`` are valid for this flag system.
 
         Subclasses must override this method.
 
         Args:
             series: The Polars Series to validate.
+            storage: The storage that the column is registered with.
 
         Raises:
             NotImplementedError: If the subclass does not implement this method.
@@ -16,7 +16,9 @@ The infill pipeline handles:
 import logging
 import math
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import Any, Literal
 
@@ -27,18 +29,25 @@ from scipy.interpolate import Akima1DInterpolator, PchipInterpolator, make_inter
 from time_stream import Period
 from time_stream.exceptions import InfillError, InfillInsufficientValuesError
 from time_stream.operation import Operation
-from time_stream.utils import check_columns_in_dataframe, gap_size_count, get_date_filter, pad_time
+from time_stream.utils import check_columns_in_dataframe, expand_gaps, gap_index, get_date_filter, pad_time
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
 class InfillCtx:
-    """Immutable context passed to infill methods."""
+    """Immutable context passed to infill methods.
+
+    ``gaps`` is the gap index (see :func:`~time_stream.utils.gap_index`) of the infill column in the padded DataFrame
+    that is being infilled, if it has already been built. ``padded`` is True if ``df`` has already been padded (see
+    :func:`~time_stream.utils.pad_time`), so that several columns of the same data can share the padding.
+    """
 
     df: pl.DataFrame
     time_name: str
     periodicity: Period
+    gaps: pl.DataFrame | None = None
+    padded: bool = False
 
 
 class InfillMethod(Operation, ABC):
@@ -89,6 +98,12 @@ class InfillMethod(Operation, ABC):
         return pipeline.execute()
 
 
+InfillMethodSpec = str | type[InfillMethod] | InfillMethod
+#: The infill method(s) to apply: a single method, or a mapping of column name to the method for that column, given
+#: either on its own or as a ``(method, kwargs)`` tuple with the parameters to initialise it with.
+MultiInfillSpec = InfillMethodSpec | Mapping[str, InfillMethodSpec | tuple[InfillMethodSpec, dict[str, Any]]]
+
+
 class InfillMethodPipeline:
     """Encapsulates the logic for the infill pipeline steps."""
 
@@ -105,16 +120,23 @@ class InfillMethodPipeline:
         self.column = column
         self.observation_interval = observation_interval
         self.max_gap_size = max_gap_size
+        self.gaps = ctx.gaps
 
     def execute(self) -> pl.DataFrame:
-        """Execute the infill pipeline"""
+        """Execute the infill pipeline.
+
+        After execution, ``gaps`` holds the gap index of the infill column in the padded DataFrame, so that it can be
+        reused by later infills of the same data.
+        """
         self._validate()
 
         # We need to make sure the data is padded so that missing time steps are filled with nulls
-        df = pad_time(self.ctx.df, self.ctx.time_name, self.ctx.periodicity)
+        df = self.ctx.df if self.ctx.padded else pad_time(self.ctx.df, self.ctx.time_name, self.ctx.periodicity)
 
-        # Calculate sizes of each gap in the time series
-        df = gap_size_count(df, self.column)
+        # Find the gaps in the time series, in a single pass of the column, unless they are already known
+        if self.gaps is None:
+            self.gaps = gap_index(df, self.ctx.time_name, self.column)
+        df = df.with_columns(expand_gaps(self.gaps, df.height, "length").fill_null(0).alias("gap_size"))
 
         # Create a mask determining which values get infilled
         infill_mask = self._infill_mask()
@@ -125,7 +147,7 @@ class InfillMethodPipeline:
             return self.ctx.df
 
         # Apply the specific infill logic from the child class
-        df_infilled = self.infill_method._fill(df, self.column, self.ctx)
+        df_infilled = self.infill_method._fill(df, self.column, replace(self.ctx, gaps=self.gaps))
         infilled_column = self.infill_method._infilled_column_name(self.column)
 
         # Limit the infilled data to where the infill mask is True
@@ -184,12 +206,27 @@ class InfillMethodPipeline:
 class ScipyInterpolation(InfillMethod, ABC):
     """Base class for scipy-based interpolation methods."""
 
-    def __init__(self, **kwargs):
+    def __init__(self, neighbourhood: int | None = None, max_workers: int | None = None, **kwargs):
         """Initialize a scipy interpolation method.
 
         Args:
+            neighbourhood: If set, fit a separate interpolator for each gap, using only this many valid points either
+                side of the gap, and evaluate it only within the gap. If None, a single interpolator is fitted to all
+                the valid points in the series.
+            max_workers: Number of threads used to interpolate the gaps when ``neighbourhood`` is set. If None, the
+                gaps are interpolated in turn.
             **kwargs: Additional parameters passed to scipy interpolator method.
+
+        Raises:
+            ValueError: If ``neighbourhood`` or ``max_workers`` is less than 1.
         """
+        if neighbourhood is not None and neighbourhood < 1:
+            raise ValueError(f"neighbourhood must be at least 1, got {neighbourhood}.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+
+        self.neighbourhood = neighbourhood
+        self.max_workers = max_workers
         self.scipy_kwargs = kwargs
 
     @abstractmethod
@@ -228,7 +265,8 @@ class ScipyInterpolation(InfillMethod, ABC):
         1. Converts data to numpy arrays for scipy compatibility
         2. Identifies valid (non-null) data points for interpolation
         3. Validates that sufficient data points exist for interpolation method
-        4. Creates and applies the specific scipy interpolator
+        4. Creates and applies the specific scipy interpolator, either over the whole series or, if a
+           ``neighbourhood`` is set, locally around each gap
         5. Handles edge cases like infinite values in the interpolated result
         6. Returns the DataFrame with a new column containing interpolated values
 
@@ -258,17 +296,81 @@ class ScipyInterpolation(InfillMethod, ABC):
         x_valid = x[mask]
         y_valid = values[mask]
 
-        # Create the specific interpolator
-        interpolator = self._create_interpolator(x_valid, y_valid)
+        if self.neighbourhood is None:
+            # Create the specific interpolator
+            interpolator = self._create_interpolator(x_valid, y_valid)
 
-        # Apply interpolation
-        interpolated = interpolator(x)
+            # Apply interpolation
+            interpolated = interpolator(x)
+        else:
+            interpolated = self._interpolate_gaps(values, x_valid, y_valid, ctx.gaps, self.neighbourhood)
 
         # Handle any remaining NaNs or infinities
         interpolated = np.where(np.isfinite(interpolated), interpolated, np.nan)
 
         return df.with_columns(pl.Series(self._infilled_column_name(infill_column), interpolated))
 
+    def _interpolate_gaps(
+        self,
+        values: np.ndarray,
+        x_valid: np.ndarray,
+        y_valid: np.ndarray,
+        gaps: pl.DataFrame | None,
+        neighbourhood: int,
+    ) -> np.ndarray:
+        """Interpolate each gap with an interpolator fitted only to the valid points in its neighbourhood.
+
+        Gaps at the start or end of the series are left as they are, as there is nothing to interpolate between.
+
+        Args:
+            values: The values of the column to infill, with NaN for missing values.
+            x_valid: Array of row indices of the valid data points.
+            y_valid: Array of the values at those row indices.
+            gaps: The gap index of the column, if known. If None, the gaps are found from the valid row indices.
+            neighbourhood: The number of valid points either side of a gap used to fit its interpolator.
+
+        Returns:
+            Copy of ``values`` with the gaps interpolated.
+        """
+        interpolated = values.astype(np.float64)
+
+        if gaps is None:
+            # The gaps are the runs of rows between consecutive valid points
+            is_gap = np.diff(x_valid) > 1
+            starts = x_valid[:-1][is_gap] + 1
+            ends = x_valid[1:][is_gap] - 1
+        else:
+            # Only the gaps with valid data either side of them can be interpolated
+            gaps = gaps.filter(pl.col("start_row") > x_valid[0], pl.col("end_row") < x_valid[-1])
+            starts = gaps["start_row"].to_numpy()
+            ends = gaps["end_row"].to_numpy()
+
+        if len(starts) == 0:
+            return interpolated
+
+        # Position of each gap within the valid points, and the window of valid points used to fit it. Near the ends
+        #   of the series, the window is shifted so that it still holds enough points for the interpolation method.
+        positions = np.searchsorted(x_valid, starts)
+        window = min(max(2 * neighbourhood, self.min_points_required), len(x_valid))
+        lower = np.clip(positions - neighbourhood, 0, len(x_valid) - window)
+        upper = lower + window
+
+        def fill_chunk(chunk: range) -> None:
+            for i in chunk:
+                interpolator = self._create_interpolator(x_valid[lower[i] : upper[i]], y_valid[lower[i] : upper[i]])
+                interpolated[starts[i] : ends[i] + 1] = interpolator(np.arange(starts[i], ends[i] + 1))
+
+        if self.max_workers is None or self.max_workers == 1:
+            fill_chunk(range(len(starts)))
+        else:
+            # Each chunk of gaps writes to its own rows of the result, so the chunks can be filled concurrently
+            chunk_size = math.ceil(len(starts) / (self.max_workers * 4))
+            chunks = [range(i, min(i + chunk_size, len(starts))) for i in range(0, len(starts), chunk_size)]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(fill_chunk, chunks))
+
+        return interpolated
+
 
 @InfillMethod.register
 class BSplineInterpolation(ScipyInterpolation):
@@ -503,6 +605,17 @@ class AltDataDynamic(InfillMethod):
         time_column_name = ctx.time_name
         window_duration = self._window_duration(ctx)
 
+        # Identify gaps in original dataset, using the gap index from the infill pipeline if there is one. Each gap is
+        # identified by its first row.
+        gaps = ctx.gaps if ctx.gaps is not None else gap_index(df, time_column_name, infill_column)
+        gap_id_column_name = f"__GAP_ID__{infill_column}"
+        df = df.with_columns(expand_gaps(gaps, df.height, "start_row").alias(gap_id_column_name))
+        gap_bounds = gaps.select(
+            pl.col("start_row").alias(gap_id_column_name),
+            pl.col("start").alias("__GAP_START__"),
+            pl.col("end").alias("__GAP_END__"),
+        )
+
         # Join original and alternative dataframes if the latter exists
         if self.alt_df is None:
             check_columns_in_dataframe(df, [self.alt_data_column])
@@ -521,22 +634,6 @@ class AltDataDynamic(InfillMethod):
                 suffix="_alt",
             )
 
-        # Identify gaps in original dataset
-        null_mask = pl.col(infill_column).is_null()
-        gap_id = (null_mask != null_mask.shift(1, fill_value=False)).cum_sum()
-        gap_id_column_name = f"__GAP_ID__{infill_column}"
-        df = df.with_columns(gap_id.alias(gap_id_column_name))
-
-        # Find start and end times of gaps
-        gap_bounds = (
-            df.filter(null_mask)
-            .group_by(gap_id_column_name)
-            .agg(
-                pl.min(time_column_name).alias("__GAP_START__"),
-                pl.max(time_column_name).alias("__GAP_END__"),
-            )
-        )
-
         # Filter out all null values from both the original and alternative dataset.
         filtered_df = df.filter(pl.col(infill_column).is_not_null() & pl.col(alt_data_column_name).is_not_null())
 
@@ -0,0 +1,523 @@
+"""
+Lazy TimeFrame Module.
+
+This module defines the :class:`LazyTimeFrame` class, a deferred counterpart to :class:`~time_stream.TimeFrame`.
+A :class:`LazyTimeFrame` holds a Polars ``LazyFrame`` query plan rather than a materialised DataFrame. Operations
+such as quality control checks, infilling and aggregation are added to the plan as nodes, and nothing is computed
+until :meth:`LazyTimeFrame.collect` is called.
+
+This allows Polars to optimise the whole chain of operations in one go (e.g. projection pushdown and common
+sub-expression elimination), and to run it on the streaming engine. The time properties of the result are
+validated once, when the plan is collected into a :class:`~time_stream.TimeFrame`.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from datetime import datetime, time
+from typing import TYPE_CHECKING, Any, Type
+
+import polars as pl
+
+from time_stream.aggregation import AggregationCtx, MultiAggregation, MultiAggregationSpec, StandardAggregationPipeline
+from time_stream.exceptions import ColumnNotFoundError, ColumnTypeError, QcError
+from time_stream.flags.flag_manager import CategoricalSingleFlagColumn, FlagManager
+from time_stream.flags.flag_system import FlagSystemBase
+from time_stream.infill import InfillMethod
+from time_stream.period import Period
+from time_stream.qc import QCCheck, QcCheckPipeline, QcCtx
+from time_stream.time_manager import TimeManager
+from time_stream.types import ClosedInterval, MissingCriteria, TimeAnchor
+from time_stream.utils import TimeWindow, check_columns_in_dataframe, configure_period_object, pad_time
+
+if TYPE_CHECKING:
+    from polars._typing import EngineType
+
+    from time_stream.base import TimeFrame
+
+
+class LazyTimeFrame:
+    """A time series data model backed by a deferred Polars ``LazyFrame`` query plan.
+
+    A ``LazyTimeFrame`` is usually created from an existing TimeFrame with :meth:`TimeFrame.lazy`. Each operation
+    returns a new ``LazyTimeFrame`` with the operation appended to the query plan. Call :meth:`collect` to execute
+    the plan and return a validated :class:`~time_stream.TimeFrame`.
+
+    The source plan is expected to hold time values that are already sorted, unique and aligned (such as those of
+    a TimeFrame, or a file written from one). The time values of the final result are validated once, on collect.
+
+    Args:
+        lf: The Polars ``LazyFrame`` (or ``DataFrame``) containing the time-series data.
+        time_name: The name of the time column in ``lf``.
+        resolution: Sampling interval for the timeseries. See :class:`~time_stream.TimeFrame`.
+        offset: Offset applied from the natural boundary of ``resolution``. See :class:`~time_stream.TimeFrame`.
+        periodicity: The allowed "frequency" of datetimes in the timeseries. See :class:`~time_stream.TimeFrame`.
+        time_anchor: Defines the window of time over which a given timestamp refers to.
+            See :class:`~time_stream.TimeFrame`.
+
+    Examples:
+        >>> tf_daily = (
+        >>>     tf.lazy()
+        >>>     .qc_check("range", "temperature", min_value=-50, max_value=50, flag_params=("flags", "RANGE"))
+        >>>     .infill("linear", "temperature", max_gap_size=3)
+        >>>     .aggregate("P1D", "mean", "temperature")
+        >>>     .collect(engine="streaming")
+        >>> )
+    """
+
+    _lf: pl.LazyFrame
+    _time_manager: TimeManager
+    _flag_manager: FlagManager
+    _metadata: dict[str, Any]
+    _column_metadata: dict[str, dict[str, Any]]
+
+    def __init__(
+        self,
+        lf: pl.LazyFrame | pl.DataFrame,
+        time_name: str,
+        resolution: Period | str | None = None,
+        offset: str | None = None,
+        periodicity: Period | str | None = None,
+        time_anchor: TimeAnchor = "start",
+    ) -> None:
+        self._lf = lf.lazy()
+        self._time_manager = TimeManager(
+            time_name=time_name,
+            resolution=resolution,
+            offset=offset,
+            periodicity=periodicity,
+            time_anchor=time_anchor,
+        )
+        self._flag_manager = FlagManager()
+        self._metadata = {}
+        self._column_metadata = {}
+
+    @classmethod
+    def from_timeframe(cls, tf: TimeFrame) -> LazyTimeFrame:
+        """Create a ``LazyTimeFrame`` whose query plan starts from the data of an existing TimeFrame.
+
+        Args:
+            tf: The TimeFrame to start the query plan from.
+
+        Returns:
+            A ``LazyTimeFrame`` with the same time properties, flags and metadata as the TimeFrame.
+        """
+        ltf = cls(
+            tf.df.lazy(),
+            time_name=tf.time_name,
+            resolution=tf.resolution,
+            offset=tf.offset,
+            periodicity=tf.periodicity,
+            time_anchor=tf.time_anchor,
+        )
+        ltf._flag_manager = tf._flag_manager.copy()
+        ltf._metadata = deepcopy(tf.metadata)
+        ltf._column_metadata = deepcopy(dict(tf.column_metadata))
+        return ltf
+
+    def _with_lf(self, lf: pl.LazyFrame) -> LazyTimeFrame:
+        """Return a new ``LazyTimeFrame`` with an updated query plan, carrying over all other properties.
+
+        Args:
+            lf: The new query plan.
+
+        Returns:
+            A new ``LazyTimeFrame``.
+        """
+        ltf = LazyTimeFrame.__new__(LazyTimeFrame)
+        ltf._lf = lf
+        ltf._time_manager = self._time_manager
+        ltf._flag_manager = self._flag_manager.copy()
+        ltf._metadata = deepcopy(self._metadata)
+        ltf._column_metadata = deepcopy(self._column_metadata)
+        return ltf
+
+    @property
+    def lf(self) -> pl.LazyFrame:
+        """The underlying ``Polars`` LazyFrame query plan."""
+        return self._lf
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """TimeFrame-level metadata, carried over to the collected TimeFrame."""
+        return self._metadata
+
+    @property
+    def column_metadata(self) -> dict[str, dict[str, Any]]:
+        """Per-column metadata, carried over to the collected TimeFrame."""
+        return self._column_metadata
+
+    @property
+    def time_name(self) -> str:
+        """The name of the primary datetime column."""
+        return self._time_manager.time_name
+
+    @property
+    def resolution(self) -> Period:
+        """The resolution of the timeseries data."""
+        return self._time_manager.resolution
+
+    @property
+    def offset(self) -> str | None:
+        """The offset of the time steps."""
+        return self._time_manager.offset
+
+    @property
+    def alignment(self) -> Period:
+        """The alignment of the time steps."""
+        return self._time_manager.alignment
+
+    @property
+    def periodicity(self) -> Period:
+        """The periodicity of the timeseries data."""
+        return self._time_manager.periodicity
+
+    @property
+    def time_anchor(self) -> TimeAnchor:
+        """The time anchor of the timeseries data."""
+        return self._time_manager.time_anchor
+
+    @property
+    def schema(self) -> pl.Schema:
+        """The schema of the result of the query plan. Resolving the schema does not execute the plan."""
+        return self._lf.collect_schema()
+
+    @property
+    def columns(self) -> list[str]:
+        """All column labels of the query plan result, excluding the time column."""
+        return [c for c in self.schema.names() if c != self.time_name]
+
+    @property
+    def flag_columns(self) -> list[str]:
+        """Only the labels for any flag columns."""
+        return list(self._flag_manager.flag_columns.keys())
+
+    @property
+    def flag_systems(self) -> dict[str, type[FlagSystemBase]]:
+        """The registered flag systems."""
+        return self._flag_manager.flag_systems
+
+    @property
+    def data_columns(self) -> list[str]:
+        """Only the labels for the data columns."""
+        return [c for c in self.columns if c not in self.flag_columns]
+
+    def _encoded_flag_column(self, flag_column_name: str) -> Any:
+        """Look up a flag column that can be updated within the query plan.
+
+        Args:
+            flag_column_name: The name of the flag column.
+
+        Returns:
+            The flag column object.
+
+        Raises:
+            ColumnTypeError: If the flag column is in decoded form.
+        """
+        flag_column = self._flag_manager.get_flag_column(flag_column_name)
+        if flag_column.is_decoded:
+            raise ColumnTypeError(
+                f"Flag column '{flag_column_name}' is in decoded form. Encode it before adding it to a lazy query plan."
+            )
+        return flag_column
+
+    def add_flag(
+        self,
+        flag_column_name: str,
+        flag_value: int | str,
+        expr: pl.Expr = pl.lit(True),
+        overwrite: bool = True,
+    ) -> LazyTimeFrame:
+        """Return a new ``LazyTimeFrame`` with a flag value added to a flag column, where expression is True.
+
+        See :meth:`TimeFrame.add_flag <time_stream.TimeFrame.add_flag>` for the semantics of each flag column type.
+
+        Args:
+            flag_column_name: The name of the flag column.
+            flag_value: The flag value to add.
+            expr: Polars expression for which rows to add flag to.
+            overwrite: Categorical scalar mode only. If ``False``, only updates rows whose current value is null.
+
+        Returns:
+            A new ``LazyTimeFrame`` with the flag update added to the query plan.
+        """
+        flag_column = self._encoded_flag_column(flag_column_name)
+        if isinstance(flag_column, CategoricalSingleFlagColumn):
+            flag_expr = flag_column.add_flag_expr(flag_value, expr, overwrite=overwrite)
+        else:
+            flag_expr = flag_column.add_flag_expr(flag_value, expr)
+        dtype = self.schema[flag_column_name]
+        return self._with_lf(self._lf.with_columns(flag_expr.cast(dtype).alias(flag_column_name)))
+
+    def remove_flag(self, column_name: str, flag_value: int | str, expr: pl.Expr = pl.lit(True)) -> LazyTimeFrame:
+        """Return a new ``LazyTimeFrame`` with a flag value removed from a flag column, where expression is True.
+
+        Args:
+            column_name: The name of the flag column.
+            flag_value: The flag value to remove.
+            expr: Polars expression for which rows to remove the flag from.
+
+        Returns:
+            A new ``LazyTimeFrame`` with the flag update added to the query plan.
+        """
+        flag_column = self._encoded_flag_column(column_name)
+        flag_expr = flag_column.remove_flag_expr(flag_value, expr)
+        dtype = self.schema[column_name]
+        return self._with_lf(self._lf.with_columns(flag_expr.cast(dtype).alias(column_name)))
+
+    def filter_by_flag(
+        self,
+        flag_column_name: str,
+        flag: int | str | list[int | str],
+        include: bool = True,
+    ) -> LazyTimeFrame:
+        """Return a new ``LazyTimeFrame`` filtered to rows that have (or lack) specific flags set.
+
+        Args:
+            flag_column_name: The name of the registered flag column to filter on.
+            flag: One or more flag names or values to filter against.
+            include: Whether to keep only rows that have the flag(s) (``True``) or keep only rows that do not have
+                        the flag(s) (``False``)
+
+        Returns:
+            A new ``LazyTimeFrame`` with the filter added to the query plan.
+        """
+        flags = flag if isinstance(flag, list) else [flag]
+        expr = self._flag_manager.get_flag_column(flag_column_name).filter_expr(flags)
+        if not include:
+            # Fill null ensures that rows that don't have any flag values (null) are kept
+            expr = ~expr.fill_null(False)
+        return self._with_lf(self._lf.filter(expr))
+
+    def select(self, column_names: str | list[str]) -> LazyTimeFrame:
+        """Return a new ``LazyTimeFrame`` including only the specified columns.
+
+        Column-level metadata and flag columns are pruned to the kept columns. Flag columns are not automatically
+        included; name them explicitly if you want them retained.
+
+        Args:
+            column_names: Column name(s) to retain.
+
+        Returns:
+            A new ``LazyTimeFrame`` with the projection added to the query plan.
+        """
+        if not column_names:
+            raise ColumnNotFoundError("No columns specified.")
+
+        column_names = [column_names] if isinstance(column_names, str) else list(column_names)
+        check_columns_in_dataframe(self._lf, column_names)
+
+        # Include primary time column (if not already included)
+        if self.time_name not in column_names:
+            column_names.insert(0, self.time_name)
+
+        ltf = self._with_lf(self._lf.select(column_names))
+        ltf._column_metadata = {col: meta for col, meta in ltf._column_metadata.items() if col in column_names}
+        for flag_name in self.flag_columns:
+            if flag_name not in column_names:
+                del ltf._flag_manager.flag_columns[flag_name]
+        return ltf
+
+    def pad(self, start: datetime | None = None, end: datetime | None = None) -> LazyTimeFrame:
+        """Return a new ``LazyTimeFrame`` with the time series padded with missing datetime rows.
+
+        Padding requires the full extent of the time column, so is added to the query plan as a single batch node.
+
+        Args:
+            start: The starting datetime value to pad time values from (inclusive).
+            end: The final datetime value to pad time values to (inclusive).
+
+        Returns:
+            A new ``LazyTimeFrame`` with the padding added to the query plan.
+        """
+        time_name, periodicity, time_anchor = self.time_name, self.periodicity, self.time_anchor
+
+        def _pad(df: pl.DataFrame) -> pl.DataFrame:
+            return pad_time(df, time_name, periodicity, time_anchor, start=start, end=end)
+
+        # The padding depends on all of the rows and columns, so no filters, projections or slices are pushed into it
+        return self._with_lf(
+            self._lf.map_batches(_pad, predicate_pushdown=False, projection_pushdown=False, slice_pushdown=False)
+        )
+
+    def qc_check(
+        self,
+        check: str | Type[QCCheck] | QCCheck,
+        column_name: str,
+        observation_interval: tuple[datetime, datetime | None] | None = None,
+        flag_params: tuple[str, str | int] | None = None,
+        **kwargs,
+    ) -> LazyTimeFrame:
+        """Add a quality control check to the query plan, flagging the rows that fail the check.
+
+        Unlike :meth:`TimeFrame.qc_check <time_stream.TimeFrame.qc_check>`, the result of a lazy QC check can only be
+        recorded in a flag column, so ``flag_params`` is required.
+
+        Args:
+            check: The QC check to apply.
+            column_name: The column to perform the check on.
+            observation_interval: Optional time interval to limit the check to.
+            flag_params: Tuple of (flag column name [str], flag value [str | int]). The flag value is added to the
+                flag column where the QC check returns ``True``.
+            **kwargs: Parameters specific to the check type.
+
+        Returns:
+            A new ``LazyTimeFrame`` with the QC check and flag update added to the query plan.
+
+        Raises:
+            QcError: If ``flag_params`` is not provided.
+        """
+        if not flag_params:
+            raise QcError("A lazy QC check must add its result to a flag column; 'flag_params' is required.")
+
+        check_instance = QCCheck.get(check, **kwargs)
+
+        # Checks only need the schema of the data to build their expressions
+        ctx = QcCtx(pl.DataFrame(schema=self.schema), self.time_name)
+        check_expr = QcCheckPipeline(check_instance, ctx, column_name, observation_interval).check_expr()
+
+        flag_column_name, flag_value = flag_params
+        return self.add_flag(flag_column_name, flag_value, check_expr)
+
+    def infill(
+        self,
+        infill_method: str | Type[InfillMethod] | InfillMethod,
+        column_name: str,
+        max_gap_size: int | None = None,
+        observation_interval: tuple[datetime, datetime | None] | None = None,
+        flag_params: tuple[str, str | int] | None = None,
+        **kwargs,
+    ) -> LazyTimeFrame:
+        """Add an infilling method to the query plan, to fill in missing data in a column.
+
+        Infill methods need to see the whole of the column to identify gaps, so the infill is added to the query plan
+        as a single batch node.
+
+        Args:
+            infill_method: The method to use for infilling
+            column_name: The column to infill
+            max_gap_size: The maximum size of consecutive null gaps that should be filled.
+            observation_interval: Optional time interval to limit the infilling to.
+            flag_params: Tuple of (flag column name [str], flag value [str | int]).
+                If provided, add given flag value to the flag column on rows that were infilled.
+            **kwargs: Parameters specific to the infill method.
+
+        Returns:
+            A new ``LazyTimeFrame`` with the infill added to the query plan.
+        """
+        infill_instance = InfillMethod.get(infill_method, **kwargs)
+        check_columns_in_dataframe(self._lf, [column_name])
+        flag_column = self._encoded_flag_column(flag_params[0]) if flag_params else None
+        time_name, periodicity, time_manager = self.time_name, self.periodicity, self._time_manager
+
+        def _infill(df: pl.DataFrame) -> pl.DataFrame:
+            result = infill_instance.apply(df, time_name, periodicity, column_name, observation_interval, max_gap_size)
+            time_manager._check_time_integrity(df, result)
+            if flag_column is not None and flag_params is not None:
+                before_is_null = df[column_name].is_null() | df[column_name].is_nan()
+                after_is_null = result[column_name].is_null() | result[column_name].is_nan()
+                result = flag_column.add_flag(result, flag_params[1], before_is_null.ne(after_is_null))
+            return result
+
+        # The infilled values depend on the neighbouring rows, so no filters, projections or slices are pushed into it
+        return self._with_lf(
+            self._lf.map_batches(_infill, predicate_pushdown=False, projection_pushdown=False, slice_pushdown=False)
+        )
+
+    def aggregate(
+        self,
+        aggregation_period: Period | str,
+        aggregation_function: MultiAggregationSpec,
+        columns: str | list[str] | None = None,
+        missing_criteria: tuple[MissingCriteria, float | int] | None = None,
+        aggregation_time_anchor: TimeAnchor | None = None,
+        time_window: tuple[time, time] | tuple[time, time, ClosedInterval] | TimeWindow | None = None,
+        **kwargs,
+    ) -> LazyTimeFrame:
+        """Add an aggregation to the query plan.
+
+        The aggregation is expressed as a Polars ``group_by_dynamic`` node, so it can be fused with the preceding
+        operations and run on the streaming engine. See :meth:`TimeFrame.aggregate <time_stream.TimeFrame.aggregate>`
+        for a description of the arguments.
+
+        Args:
+            aggregation_period: The period over which to aggregate the data
+            aggregation_function: The aggregation function(s) to apply
+            columns: The column(s) containing the data to be aggregated. If omitted, will use all data columns.
+            missing_criteria: How the aggregation handles missing data
+            aggregation_time_anchor: The time anchor for the aggregation result.
+            time_window: Optional restriction of which time-of-day observations are included in each
+                aggregation period.
+            **kwargs: Parameters specific to the aggregation function.
+
+        Returns:
+            A new ``LazyTimeFrame`` with the aggregation added to the query plan, and time properties set by the
+            aggregation period.
+        """
+        normalised_time_window = TimeWindow.from_tuple(time_window) if isinstance(time_window, tuple) else time_window
+
+        agg_func, columns = MultiAggregation.resolve(aggregation_function, columns or self.data_columns, **kwargs)
+        aggregation_period = configure_period_object(aggregation_period)
+        aggregation_time_anchor = aggregation_time_anchor if aggregation_time_anchor is not None else self.time_anchor
+
+        ctx = AggregationCtx(
+            df=self._lf,
+            time_name=self.time_name,
+            time_anchor=self.time_anchor,
+            periodicity=self.periodicity,
+            aggregation_period=aggregation_period,
+        )
+
+        agg_lf = StandardAggregationPipeline(
+            agg_func,
+            ctx,
+            aggregation_period,
+            columns,
+            missing_criteria=missing_criteria,
+            aggregation_time_anchor=aggregation_time_anchor,
+            time_window=normalised_time_window,
+        ).execute_lazy()
+
+        ltf = LazyTimeFrame(
+            agg_lf,
+            time_name=self.time_name,
+            resolution=aggregation_period.without_offset(),
+            offset=aggregation_period.offset,
+            periodicity=aggregation_period,
+            time_anchor=aggregation_time_anchor,
+        )
+        ltf._metadata = deepcopy(self._metadata)
+        return ltf
+
+    def collect(self, engine: EngineType = "auto") -> TimeFrame:
+        """Execute the query plan and return the result as a validated TimeFrame.
+
+        Args:
+            engine: The Polars engine used to run the query plan, e.g. ``"auto"``, ``"in-memory"`` or
+                ``"streaming"``.
+
+        Returns:
+            A TimeFrame containing the result of the query plan.
+        """
+        from time_stream.base import TimeFrame  # noqa: PLC0415 - avoid circular import
+
+        df = self._lf.collect(engine=engine)
+        tf = TimeFrame(
+            df,
+            time_name=self.time_name,
+            resolution=self.resolution,
+            offset=self.offset,
+            periodicity=self.periodicity,
+            time_anchor=self.time_anchor,
+        )
+        tf.metadata = deepcopy(self._metadata)
+        tf.column_metadata.update({col: meta for col, meta in self._column_metadata.items() if col in df.columns})
+        tf._flag_manager = self._flag_manager.copy()
+        return tf
+
+    def __repr__(self) -> str:
+        """Returns the representation of the LazyTimeFrame"""
+        return (
+            f"LazyTimeFrame(time_name={self.time_name!r}, resolution={self.resolution}, offset={self.offset!r}, "
+            f"periodicity={self.periodicity}, time_anchor={self.time_anchor!r})\n{self._lf.explain()}"
+        )
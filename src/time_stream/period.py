@@ -22,6 +22,12 @@ datetime objects where:
     datetime >= period.datetime( n ) and
     datetime < period.datetime( n+1 )
 
+The ordinals() and datetimes() methods are vectorised forms of
+these two methods, operating on whole Polars Series or NumPy arrays
+with integer arithmetic rather than a Python loop. The
+ordinal_expr() and datetime_expr() methods return the same
+calculations as Polars expressions.
+
 The Period abstract class is the public face of this module. Ideally
 all external code will only ever use this class and the methods and
 properties that it exposes.  Everything else in this module should
@@ -59,9 +65,14 @@ from dataclasses import (
 )
 from typing import (
     Any,
+    overload,
     override,
 )
 
+import numpy as np
+import polars as pl
+from polars._typing import TimeUnit
+
 from time_stream.exceptions import PeriodConfigError, PeriodParsingError, PeriodValidationError
 
 
@@ -396,6 +407,9 @@ _STEP_SECONDS = 2
 _STEP_MONTHS = 3
 _VALID_STEPS = frozenset([_STEP_MICROSECONDS, _STEP_SECONDS, _STEP_MONTHS])
 
+# Microseconds between the "day epoch" (see _gregorian_seconds) and the Unix epoch
+_UNIX_EPOCH_GREGORIAN_MICROSECONDS = dt.date(1970, 1, 1).toordinal() * 86_400_000_000
+
 
 def _fmt_naive_microsecond(obj: dt.datetime, separator: str) -> str:
     """Convert a naive datetime to an ISO 8601 format string
@@ -2259,6 +2273,148 @@ class Period(ABC):
         datetime_obj2 = self.datetime(ordinal)
         return _naive(datetime_obj) == _naive(datetime_obj2)
 
+    def _step_microseconds(self) -> int:
+        """The length of this period in microseconds, for a period
+        with a seconds or microseconds step
+
+        Returns:
+            The number of microseconds in one interval
+        """
+        if self._properties.step == _STEP_SECONDS:
+            return self._properties.multiplier * 1_000_000
+        return self._properties.multiplier
+
+    def ordinal_expr(self, expr: pl.Expr) -> pl.Expr:
+        """Return a Polars expression of the ordinals of a
+        datetime expression
+
+        This is the vectorised form of the ordinal() method, using
+        integer arithmetic on the epoch microseconds (or on the
+        month count for calendar periods) rather than calling
+        ordinal() for each value.  As with the ordinal() method, the
+        time zone of the datetimes is ignored, and the local date
+        and time fields are used.  Any sub-microsecond precision
+        is ignored.
+
+        Args:
+            expr: A Polars expression of Datetime values
+
+        Returns:
+            A Polars expression of Int64 ordinal values
+        """
+        properties = self._properties
+        local = expr.dt.replace_time_zone(None)
+        if properties.microsecond_offset != 0:
+            local = local - pl.duration(microseconds=properties.microsecond_offset)
+
+        if properties.step == _STEP_MONTHS:
+            months = local.dt.year().cast(pl.Int64) * 12 + local.dt.month().cast(pl.Int64) - 1
+            ordinal = (months - properties.month_offset) // properties.multiplier
+        else:
+            microseconds = local.dt.epoch("us") + _UNIX_EPOCH_GREGORIAN_MICROSECONDS
+            ordinal = microseconds // self._step_microseconds()
+
+        return ordinal + properties.ordinal_shift
+
+    def datetime_expr(self, expr: pl.Expr, time_unit: TimeUnit = "us", time_zone: str | None = None) -> pl.Expr:
+        """Return a Polars expression of the start datetimes of
+        the intervals identified by an ordinal expression
+
+        This is the vectorised form of the datetime() method.
+
+        Args:
+            expr: A Polars expression of integer ordinals
+            time_unit: The time unit of the returned Datetime values
+            time_zone: Optional time zone to attach to the returned
+                       Datetime values.  The tzinfo of this Period is
+                       not attached, as Polars time zones are named.
+
+        Returns:
+            A Polars expression of Datetime values
+        """
+        properties = self._properties
+        ordinal = expr.cast(pl.Int64) - properties.ordinal_shift
+
+        if properties.step == _STEP_MONTHS:
+            months = ordinal * properties.multiplier + properties.month_offset
+            result = pl.datetime(months // 12, months % 12 + 1, 1, time_unit=time_unit)
+        else:
+            microseconds = ordinal * self._step_microseconds() - _UNIX_EPOCH_GREGORIAN_MICROSECONDS
+            result = microseconds.cast(pl.Datetime("us")).dt.cast_time_unit(time_unit)
+
+        if properties.microsecond_offset != 0:
+            result = result + pl.duration(microseconds=properties.microsecond_offset)
+        if time_zone is not None:
+            result = result.dt.replace_time_zone(time_zone)
+        return result
+
+    @overload
+    def ordinals(self, values: pl.Series) -> pl.Series: ...
+
+    @overload
+    def ordinals(self, values: np.ndarray) -> np.ndarray: ...
+
+    def ordinals(self, values: pl.Series | np.ndarray) -> pl.Series | np.ndarray:
+        """Return the ordinals of many datetimes at once
+
+        This is the vectorised form of the ordinal() method; see
+        ordinal_expr() for details.
+
+        Args:
+            values: A Polars Series of Date or Datetime values, or a
+                    NumPy array of datetime64 values
+
+        Returns:
+            The Int64 ordinals, as a Series if a Series was given,
+            otherwise as a NumPy array
+
+        Raises:
+            PeriodValidationError: If the values are not dates or datetimes
+        """
+        series = values if isinstance(values, pl.Series) else pl.Series(values)
+        if series.dtype == pl.Date:
+            series = series.cast(pl.Datetime("us"))
+        if not isinstance(series.dtype, pl.Datetime):
+            raise PeriodValidationError(f"Illegal dtype: {series.dtype}. Must be a date or datetime type.")
+
+        result = series.to_frame().select(self.ordinal_expr(pl.col(series.name))).to_series()
+        return result if isinstance(values, pl.Series) else result.to_numpy()
+
+    @overload
+    def datetimes(self, ordinals: pl.Series, time_unit: TimeUnit = ..., time_zone: str | None = ...) -> pl.Series: ...
+
+    @overload
+    def datetimes(self, ordinals: np.ndarray, time_unit: TimeUnit = ..., time_zone: str | None = ...) -> np.ndarray: ...
+
+    def datetimes(
+        self, ordinals: pl.Series | np.ndarray, time_unit: TimeUnit = "us", time_zone: str | None = None
+    ) -> pl.Series | np.ndarray:
+        """Return the start datetimes of many ordinals at once
+
+        This is the vectorised form of the datetime() method; see
+        datetime_expr() for details.
+
+        Args:
+            ordinals: A Polars Series or NumPy array of integer ordinals
+            time_unit: The time unit of the returned datetimes
+            time_zone: Optional time zone to attach to the returned
+                       datetimes (Series only)
+
+        Returns:
+            The datetimes, as a Series if a Series was given,
+            otherwise as a NumPy array of datetime64 values
+
+        Raises:
+            PeriodValidationError: If the ordinals are not integers
+        """
+        series = ordinals if isinstance(ordinals, pl.Series) else pl.Series(ordinals)
+        if not series.dtype.is_integer():
+            raise PeriodValidationError(f"Illegal dtype: {series.dtype}. Must be an integer type.")
+
+        if isinstance(ordinals, pl.Series):
+            return series.to_frame().select(self.datetime_expr(pl.col(series.name), time_unit, time_zone)).to_series()
+        return series.to_frame().select(self.datetime_expr(pl.col(series.name), time_unit)).to_series().to_numpy()
+
     def base_period(self) -> "Period":
         """Return an equivalent Period with no date offset or
         ordinal shift
@@ -0,0 +1,311 @@
+"""
+TimeFrame Persistence Module.
+
+This module provides the helpers used to save a :class:`~time_stream.TimeFrame` to, and load it back from, Parquet
+and Arrow IPC files.
+
+The time series data is written as normal file columns, so the files can be read by any Parquet / Arrow reader. The
+rest of the state of the TimeFrame (time properties, flag systems, flag columns and metadata) is stored as a JSON
+document under the ``time_stream`` key of the file's key-value schema metadata.
+
+Because the state is only ever written from a TimeFrame whose time values have already been validated, the time
+values do not need to be validated again when the file is read back (unless explicitly requested).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from time_stream.exceptions import MetadataError
+from time_stream.flags.flag_manager import FlagManager, FlagStorageLiteral
+from time_stream.flags.flag_system import FlagSystemLiteral
+from time_stream.period import Period
+from time_stream.time_manager import TimeManager
+from time_stream.types import TimeAnchor
+
+if TYPE_CHECKING:
+    from time_stream.base import TimeFrame
+
+#: The key of the file schema metadata that holds the TimeFrame state.
+STATE_METADATA_KEY = "time_stream"
+
+#: The version of the layout of the stored state. Bump if the layout changes in a non-backwards compatible way.
+STATE_FORMAT_VERSION = 1
+
+IpcCompression = Literal["uncompressed", "lz4", "zstd"]
+
+
+@dataclass(frozen=True)
+class TimeFrameState:
+    """The state of a TimeFrame, other than its data, that is stored alongside the data in a file.
+
+    Args:
+        time_name: The name of the time column.
+        resolution: The resolution of the time series.
+        offset: The offset of the time steps.
+        periodicity: The periodicity of the time series.
+        time_anchor: The time anchor of the time series.
+        flag_systems: Mapping of flag system name to its flag type and flag name/value pairs.
+        flag_columns: Mapping of flag column name to its flag system name, whether it is in decoded form, and how its
+            values are stored.
+        metadata: TimeFrame-level metadata.
+        column_metadata: Per-column metadata.
+    """
+
+    time_name: str
+    resolution: Period
+    offset: str | None
+    periodicity: Period
+    time_anchor: TimeAnchor
+    flag_systems: dict[str, tuple[FlagSystemLiteral, dict[str, int | str]]] = field(default_factory=dict)
+    flag_columns: dict[str, tuple[str, bool, FlagStorageLiteral]] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    column_metadata: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_timeframe(cls, tf: TimeFrame) -> TimeFrameState:
+        """Capture the state of a TimeFrame.
+
+        Args:
+            tf: The TimeFrame to capture the state of.
+
+        Returns:
+            The state of the TimeFrame.
+        """
+        flag_columns = {}
+        for name in tf.flag_columns:
+            flag_column = tf.get_flag_column(name)
+            flag_columns[name] = (flag_column.flag_system.system_name(), flag_column.is_decoded, flag_column.storage)
+
+        return cls(
+            time_name=tf.time_name,
+            resolution=tf.resolution,
+            offset=tf.offset,
+            periodicity=tf.periodicity,
+            time_anchor=tf.time_anchor,
+            flag_systems={name: (system.flag_type, system.to_dict()) for name, system in tf.flag_systems.items()},
+            flag_columns=flag_columns,
+            metadata=tf.metadata,
+            column_metadata=dict(tf.column_metadata),
+        )
+
+    def to_json(self) -> str:
+        """Serialise the state to a JSON string.
+
+        Returns:
+            The JSON string.
+
+        Raises:
+            MetadataError: If the TimeFrame-level or column-level metadata is not JSON serialisable.
+        """
+        state = {
+            "version": STATE_FORMAT_VERSION,
+            "time_name": self.time_name,
+            # Use the repr of the periods, as this preserves any timezone / shift of the period
+            "resolution": repr(self.resolution),
+            "offset": self.offset,
+            "periodicity": repr(self.periodicity),
+            "time_anchor": self.time_anchor,
+            "flag_systems": {
+                name: {"flag_type": flag_type, "flags": flags} for name, (flag_type, flags) in self.flag_systems.items()
+            },
+            "flag_columns": {
+                name: {"flag_system": system_name, "is_decoded": is_decoded, "storage": storage}
+                for name, (system_name, is_decoded, storage) in self.flag_columns.items()
+            },
+            "metadata": self.metadata,
+            "column_metadata": self.column_metadata,
+        }
+        try:
+            return json.dumps(state)
+        except TypeError as e:
+            raise MetadataError(f"TimeFrame metadata must be JSON serialisable to be written to file: {e}") from e
+
+    @classmethod
+    def from_json(cls, value: str | bytes) -> TimeFrameState:
+        """Deserialise the state from a JSON string.
+
+        Args:
+            value: The JSON string, as created by :meth:`to_json`.
+
+        Returns:
+            The state.
+
+        Raises:
+            MetadataError: If the JSON string is not a valid TimeFrame state.
+        """
+        try:
+            state = json.loads(value)
+            version = state["version"]
+            if version > STATE_FORMAT_VERSION:
+                raise MetadataError(
+                    f"TimeFrame state version {version} is newer than the supported version {STATE_FORMAT_VERSION}."
+                )
+            return cls(
+                time_name=state["time_name"],
+                resolution=Period.of_repr(state["resolution"]),
+                offset=state["offset"],
+                periodicity=Period.of_repr(state["periodicity"]),
+                time_anchor=state["time_anchor"],
+                flag_systems={
+                    name: (system["flag_type"], system["flags"]) for name, system in state["flag_systems"].items()
+                },
+                flag_columns={
+                    # Files written before flag column storage was recorded always hold the raw values
+                    name: (column["flag_system"], column["is_decoded"], column.get("storage", "values"))
+                    for name, column in state["flag_columns"].items()
+                },
+                metadata=state["metadata"],
+                column_metadata=state["column_metadata"],
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            raise MetadataError(f"Invalid TimeFrame state in file metadata: {e}") from e
+
+    def time_manager(self) -> TimeManager:
+        """Build the time manager described by the state.
+
+        Returns:
+            A new ``TimeManager``.
+        """
+        return TimeManager(
+            time_name=self.time_name,
+            resolution=self.resolution,
+            offset=self.offset,
+            periodicity=self.periodicity,
+            time_anchor=self.time_anchor,
+        )
+
+    def flag_manager(self, columns: list[str]) -> FlagManager:
+        """Build the flag manager described by the state.
+
+        Args:
+            columns: The columns that have been read from file. Flag columns that were not read are not registered.
+
+        Returns:
+            A new ``FlagManager``.
+        """
+        flag_manager = FlagManager()
+        for name, (flag_type, flags) in self.flag_systems.items():
+            flag_manager.register_flag_system(name, flags, flag_type=flag_type)
+
+        for name, (system_name, is_decoded, storage) in self.flag_columns.items():
+            if name in columns:
+                flag_manager.register_flag_column(name, system_name, storage)
+                flag_manager.flag_columns[name].is_decoded = is_decoded
+
+        return flag_manager
+
+
+def _state_from_schema_metadata(schema_metadata: dict[str, str] | dict[bytes, bytes] | None) -> TimeFrameState:
+    """Extract the TimeFrame state from the key-value schema metadata of a file.
+
+    Args:
+        schema_metadata: The key-value schema metadata.
+
+    Returns:
+        The TimeFrame state.
+
+    Raises:
+        MetadataError: If the metadata does not contain a TimeFrame state.
+    """
+    # Parquet metadata (via Polars) has str keys, Arrow schema metadata has bytes keys
+    entries = {key.decode() if isinstance(key, bytes) else key: value for key, value in (schema_metadata or {}).items()}
+    value = entries.get(STATE_METADATA_KEY)
+    if value is None:
+        raise MetadataError(
+            f"File does not contain TimeFrame state metadata (key '{STATE_METADATA_KEY}'). "
+            "Was it written with TimeFrame.write_parquet / TimeFrame.write_ipc?"
+        )
+    return TimeFrameState.from_json(value)
+
+
+def read_parquet_state(source: str | Path) -> TimeFrameState:
+    """Read the TimeFrame state from the metadata of a Parquet file, without reading any of the data.
+
+    Args:
+        source: Path to the Parquet file.
+
+    Returns:
+        The TimeFrame state.
+    """
+    return _state_from_schema_metadata(pl.read_parquet_metadata(source))
+
+
+def read_ipc_state(source: str | Path) -> TimeFrameState:
+    """Read the TimeFrame state from the metadata of an Arrow IPC file, without reading any of the data.
+
+    Args:
+        source: Path to the Arrow IPC file.
+
+    Returns:
+        The TimeFrame state.
+    """
+    with pa.memory_map(str(source)) as mmap:
+        schema = ipc.open_file(mmap).schema
+    return _state_from_schema_metadata(schema.metadata)
+
+
+def map_ipc(source: str | Path, columns: list[str] | None = None) -> pl.DataFrame:
+    """Memory-map an Arrow IPC file, and wrap its data in a DataFrame without copying the column buffers.
+
+    The DataFrame columns are views onto the memory-mapped file, so the data is backed by the operating system's
+    page cache (and shared between processes that map the same file) rather than held in private memory. This is
+    only zero-copy for uncompressed files; compressed record batches are decompressed into memory.
+
+    The file handle is closed before returning. The mapped region itself is owned by the Arrow buffers that the
+    DataFrame columns wrap, so it stays valid for as long as any of the columns (or DataFrames derived from them
+    without copying) are alive, and is unmapped once the last of them is released.
+
+    Args:
+        source: Path to the Arrow IPC file.
+        columns: Optional list of columns to include.
+
+    Returns:
+        The DataFrame backed by the memory-mapped file.
+    """
+    with pa.memory_map(str(source)) as mmap:
+        table = ipc.open_file(mmap).read_all()
+    if columns is not None:
+        table = table.select(columns)
+
+    # Keep each record batch as a separate chunk, as rechunking would copy the data into memory
+    return cast(pl.DataFrame, pl.from_arrow(table, rechunk=False))
+
+
+def write_parquet(df: pl.DataFrame, state: TimeFrameState, file: str | Path, **kwargs) -> None:
+    """Write a DataFrame to a Parquet file, with the TimeFrame state stored in the file metadata.
+
+    Args:
+        df: The DataFrame to write.
+        state: The TimeFrame state.
+        file: Path of the file to write to.
+        **kwargs: Additional keyword arguments passed to :meth:`polars.DataFrame.write_parquet`.
+    """
+    metadata = dict(kwargs.pop("metadata", None) or {})
+    metadata[STATE_METADATA_KEY] = state.to_json()
+    df.write_parquet(file, metadata=metadata, **kwargs)
+
+
+def write_ipc(
+    df: pl.DataFrame, state: TimeFrameState, file: str | Path, compression: IpcCompression = "uncompressed"
+) -> None:
+    """Write a DataFrame to an Arrow IPC file, with the TimeFrame state stored in the file's schema metadata.
+
+    Args:
+        df: The DataFrame to write.
+        state: The TimeFrame state.
+        file: Path of the file to write to.
+        compression: Compression of the record batches. Only uncompressed files can be memory-mapped without copying.
+    """
+    table = df.to_arrow()
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), STATE_METADATA_KEY: state.to_json()})
+    options = ipc.IpcWriteOptions(compression=None if compression == "uncompressed" else compression)
+    with pa.OSFile(str(file), "wb") as sink, ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
@@ -16,6 +16,7 @@ It supports various QC checks including:
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date, datetime, time
+from typing import Any, Sequence, Type
 
 import polars as pl
 
@@ -64,6 +65,17 @@ class QCCheck(Operation, ABC):
         return pipeline.execute()
 
 
+#: Specification of one check in a QC suite:
+#: ``(check, column, check kwargs, (flag column name, flag value), observation interval)``.
+QcCheckSpec = tuple[
+    str | Type[QCCheck] | QCCheck,
+    str,
+    dict[str, Any] | None,
+    tuple[str, str | int],
+    tuple[datetime, datetime | None] | None,
+]
+
+
 class QcCheckPipeline:
     """Encapsulates the logic for the QC pipeline steps."""
 
@@ -87,6 +99,24 @@ class QcCheckPipeline:
         """
         self._validate()
 
+        # Evaluate and return the result of the QC check
+        #   Name as empty string to avoid accidental collisions.
+        #   Up to user if they want to name it and add on to the dataframe.
+        result = self.ctx.df.select(self.check_expr().alias("")).to_series()
+
+        return result
+
+    def check_expr(self) -> pl.Expr:
+        """Build the full boolean expression for the QC check, without evaluating it.
+
+        This allows the check to be embedded in a larger Polars query (e.g. a lazy query plan). Only the schema of
+        the context DataFrame is used, so the context may hold an empty DataFrame with the expected schema.
+
+        Returns:
+            Boolean Polars expression of the QC check, limited to the observation interval if one is specified.
+        """
+        check_columns_in_dataframe(self.ctx.df, [self.column, self.ctx.time_name])
+
         # Get the check expression
         check_expr = self.qc_check.expr(self.ctx, self.column)
 
@@ -95,12 +125,7 @@ class QcCheckPipeline:
             date_filter = get_date_filter(self.ctx.time_name, self.observation_interval)
             check_expr = check_expr & date_filter
 
-        # Evaluate and return the result of the QC check
-        #   Name as empty string to avoid accidental collisions.
-        #   Up to user if they want to name it and add on to the dataframe.
-        result = self.ctx.df.select(check_expr.alias("")).to_series()
-
-        return result
+        return check_expr
 
     def _validate(self) -> None:
         """Carry out validation that the QC check can actually be carried out."""
@@ -109,6 +134,44 @@ class QcCheckPipeline:
         check_columns_in_dataframe(self.ctx.df, [self.column, self.ctx.time_name])
 
 
+class QcSuitePipeline:
+    """Encapsulates the logic for building many QC checks, to be evaluated together in a single Polars query."""
+
+    def __init__(self, checks: Sequence[QcCheckSpec], ctx: QcCtx):
+        self.checks = checks
+        self.ctx = ctx
+
+    def flag_updates(self) -> list[tuple[pl.Expr, str, str | int]]:
+        """Validate the checks and build the boolean expression of each, without evaluating them.
+
+        Returns:
+            List of (check expression, flag column name, flag value) for each check, in the order given.
+
+        Raises:
+            QcError: If the suite is empty, a check specification is malformed, or the DataFrame is empty.
+        """
+        if not self.checks:
+            raise QcError("At least one QC check must be given.")
+
+        updates = []
+        for spec in self.checks:
+            if len(spec) != 5:
+                raise QcError(
+                    "QC suite checks must be given as (check, column, kwargs, flag_params, observation_interval); "
+                    f"got {spec!r}."
+                )
+            check, column, kwargs, flag_params, observation_interval = spec
+            if not flag_params:
+                raise QcError(f"QC suite check '{check}' on column '{column}' must give 'flag_params'.")
+
+            pipeline = QcCheckPipeline(QCCheck.get(check, **(kwargs or {})), self.ctx, column, observation_interval)
+            pipeline._validate()
+
+            flag_column_name, flag_value = flag_params
+            updates.append((pipeline.check_expr(), flag_column_name, flag_value))
+        return updates
+
+
 @QCCheck.register
 class ComparisonCheck(QCCheck):
     """Compares values against a given value using a comparison operator."""
@@ -0,0 +1,268 @@
+"""
+TimeFrame Store Module.
+
+This module defines the :class:`TimeFrameStore` class, for keeping many TimeFrames (e.g. one per station / variable
+series) in a single directory as a hive-partitioned Parquet dataset.
+
+Each series is partitioned by time, with the partition granularity chosen from the periodicity of the TimeFrame, so
+that a request for a time range only needs to read the relevant files. Within those files, the Parquet row group
+statistics on the time column are used to skip the row groups outside of the requested range.
+
+The layout of a store is::
+
+    <root>/
+        series=<series_id>/
+            _timeframe.parquet              # zero-row file holding the schema and TimeFrame state
+            year=<YYYY>/month=<MM>/data.parquet
+
+For series with a periodicity longer than one hour, the ``month`` level is omitted, and for series with a
+periodicity longer than one day, the data is held in a single ``data.parquet`` file.
+"""
+
+from __future__ import annotations
+
+import shutil
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import polars as pl
+
+from time_stream import persistence
+from time_stream.base import TimeFrame
+from time_stream.period import Period
+from time_stream.utils import get_date_filter
+
+PartitionKey = tuple[int, ...]
+
+
+class TimeFrameStore:
+    """A directory of many TimeFrames, stored as a hive-partitioned Parquet dataset keyed by series and time.
+
+    Args:
+        root: The root directory of the store. Created on the first write if it does not exist.
+
+    Examples:
+        >>> store = TimeFrameStore("/data/stations")
+        >>> store.write("station_1/rainfall", tf)
+        >>> tf_jan = store.read("station_1/rainfall", start=datetime(2024, 1, 1), end=datetime(2024, 1, 31))
+    """
+
+    STATE_FILE = "_timeframe.parquet"
+    DATA_FILE = "data.parquet"
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+
+    @property
+    def root(self) -> Path:
+        """The root directory of the store."""
+        return self._root
+
+    def series_ids(self) -> list[str]:
+        """The IDs of all series held in the store.
+
+        Returns:
+            Sorted list of series IDs.
+        """
+        if not self._root.exists():
+            return []
+        return sorted(
+            unquote(path.parent.name.removeprefix("series=")) for path in self._root.glob(f"series=*/{self.STATE_FILE}")
+        )
+
+    def write(self, series_id: str, tf: TimeFrame, **kwargs) -> None:
+        """Write a TimeFrame to the store, replacing any existing data for the series.
+
+        Args:
+            series_id: The ID of the series.
+            tf: The TimeFrame to write.
+            **kwargs: Additional keyword arguments passed to :meth:`polars.DataFrame.write_parquet` for each
+                partition file (e.g. ``compression``, ``row_group_size``).
+        """
+        series_dir = self._series_dir(series_id)
+        if series_dir.exists():
+            shutil.rmtree(series_dir)
+        series_dir.mkdir(parents=True)
+
+        # The zero-row state file keeps the schema of the series, even if no partitions are read back
+        state = persistence.TimeFrameState.from_timeframe(tf)
+        persistence.write_parquet(tf.df.head(0), state, series_dir / self.STATE_FILE)
+
+        keys = self._partition_keys(tf.periodicity)
+        if not keys:
+            tf.df.write_parquet(series_dir / self.DATA_FILE, **kwargs)
+            return
+
+        key_exprs = [getattr(pl.col(tf.time_name).dt, key)().alias(f"__{key}") for key in keys]
+        partitions = tf.df.with_columns(key_exprs).partition_by(
+            [f"__{key}" for key in keys], as_dict=True, include_key=False, maintain_order=True
+        )
+        for partition_key, partition_df in partitions.items():
+            partition_dir = series_dir.joinpath(*self._partition_dir_parts(keys, partition_key))
+            partition_dir.mkdir(parents=True)
+            partition_df.write_parquet(partition_dir / self.DATA_FILE, **kwargs)
+
+    def read(
+        self,
+        series_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        columns: list[str] | None = None,
+        verify: bool = False,
+    ) -> TimeFrame:
+        """Read a TimeFrame for a series from the store, limited to a time range.
+
+        Only the partition files that overlap the time range are scanned, and within those the row groups are
+        pruned using the statistics on the time column.
+
+        Args:
+            series_id: The ID of the series.
+            start: The start of the time range (inclusive). If None, read from the start of the series.
+            end: The end of the time range (inclusive). If None, read to the end of the series.
+            columns: Optional list of columns to read. The time column is always read.
+            verify: If True, run the full time validation of the TimeFrame constructor on the data that is read.
+
+        Returns:
+            A TimeFrame containing the data for the series within the time range.
+
+        Raises:
+            KeyError: If the series is not in the store.
+        """
+        series_dir = self._series_dir(series_id)
+        state_file = series_dir / self.STATE_FILE
+        if not state_file.exists():
+            raise KeyError(f"Series '{series_id}' not found in store '{self._root}'.")
+
+        state = persistence.read_parquet_state(state_file)
+        time_dtype = pl.read_parquet_schema(state_file)[state.time_name]
+
+        files = self._partition_files(series_dir, self._partition_keys(state.periodicity), start, end, time_dtype)
+        lf = pl.scan_parquet(files or [state_file], hive_partitioning=False)
+        if start is not None or end is not None:
+            lf = lf.filter(get_date_filter(state.time_name, (start, end)))
+
+        read_columns = TimeFrame._columns_to_read(state, columns)
+        if read_columns is not None:
+            lf = lf.select(read_columns)
+
+        return TimeFrame._from_state(lf.collect(), state, verify)
+
+    def delete(self, series_id: str) -> None:
+        """Delete a series from the store.
+
+        Args:
+            series_id: The ID of the series.
+
+        Raises:
+            KeyError: If the series is not in the store.
+        """
+        series_dir = self._series_dir(series_id)
+        if not series_dir.exists():
+            raise KeyError(f"Series '{series_id}' not found in store '{self._root}'.")
+        shutil.rmtree(series_dir)
+
+    def _series_dir(self, series_id: str) -> Path:
+        """The directory holding the data of a series.
+
+        Args:
+            series_id: The ID of the series.
+
+        Returns:
+            Path to the series directory.
+        """
+        if not series_id:
+            raise ValueError("Series ID must not be empty.")
+        # Percent-encode the ID, so that it is always a single directory name
+        return self._root / f"series={quote(series_id, safe='')}"
+
+    @staticmethod
+    def _partition_keys(periodicity: Period) -> list[str]:
+        """Choose the time partitioning of a series from its periodicity, keeping the partition files a useful size.
+
+        Args:
+            periodicity: The periodicity of the series.
+
+        Returns:
+            The names of the time partition keys, from coarsest to finest.
+        """
+        periodicity = periodicity.without_offset()
+        if periodicity.is_subperiod_of(Period.of_hours(1)):
+            return ["year", "month"]
+        if periodicity.is_subperiod_of(Period.of_days(1)):
+            return ["year"]
+        return []
+
+    @staticmethod
+    def _partition_dir_parts(keys: list[str], partition_key: PartitionKey) -> list[str]:
+        """Build the hive-style directory names of a partition, zero-padded so they sort in time order.
+
+        Args:
+            keys: The names of the time partition keys.
+            partition_key: The values of the time partition keys.
+
+        Returns:
+            The directory names of the partition.
+        """
+        return [
+            f"{key}={value:04d}" if key == "year" else f"{key}={value:02d}" for key, value in zip(keys, partition_key)
+        ]
+
+    @classmethod
+    def _partition_files(
+        cls,
+        series_dir: Path,
+        keys: list[str],
+        start: datetime | None,
+        end: datetime | None,
+        time_dtype: pl.DataType,
+    ) -> list[Path]:
+        """Find the partition files of a series that overlap a time range, in time order.
+
+        Args:
+            series_dir: The directory holding the data of the series.
+            keys: The names of the time partition keys.
+            start: The start of the time range (inclusive), or None.
+            end: The end of the time range (inclusive), or None.
+            time_dtype: The data type of the time column, used to derive the partition keys of the range.
+
+        Returns:
+            Paths of the partition files overlapping the time range.
+        """
+        if not keys:
+            data_file = series_dir / cls.DATA_FILE
+            return [data_file] if data_file.exists() else []
+
+        start_key = cls._partition_key(start, keys, time_dtype) if start is not None else None
+        end_key = cls._partition_key(end, keys, time_dtype) if end is not None else None
+
+        files = []
+        pattern = "/".join(f"{key}=*" for key in keys) + f"/{cls.DATA_FILE}"
+        for path in series_dir.glob(pattern):
+            partition_key = tuple(int(part.split("=", 1)[1]) for part in path.relative_to(series_dir).parts[:-1])
+            if start_key is not None and partition_key < start_key:
+                continue
+            if end_key is not None and partition_key > end_key:
+                continue
+            files.append((partition_key, path))
+
+        return [path for _, path in sorted(files)]
+
+    @staticmethod
+    def _partition_key(value: datetime, keys: list[str], time_dtype: pl.DataType) -> PartitionKey:
+        """The time partition key that a datetime falls into.
+
+        Args:
+            value: The datetime.
+            keys: The names of the time partition keys.
+            time_dtype: The data type of the time column.
+
+        Returns:
+            The values of the time partition keys.
+        """
+        series = pl.Series([value])
+        time_zone = getattr(time_dtype, "time_zone", None)
+        if time_zone is not None and value.tzinfo is not None:
+            # Derive the key in the same time zone as the time column was partitioned in
+            series = series.dt.convert_time_zone(time_zone)
+        return tuple(getattr(series.dt, key)().item() for key in keys)
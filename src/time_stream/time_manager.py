@@ -26,7 +26,14 @@ from time_stream.exceptions import (
     TimeMutatedError,
 )
 from time_stream.types import DuplicateOption, TimeAnchor, ValidationErrorOptions
-from time_stream.utils import check_alignment, check_periodicity, epoch_check, handle_duplicates, truncate_to_period
+from time_stream.utils import (
+    check_alignment,
+    check_periodicity,
+    epoch_check,
+    handle_duplicates,
+    sort_by_column,
+    truncate_to_period,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -242,6 +249,15 @@ class TimeManager:
     def _check_time_integrity(self, old_df: pl.DataFrame, new_df: pl.DataFrame) -> None:
         """Raise an error if the time values change between old and new DataFrames.
 
+        The time values are allowed to be reordered, but not changed. The check goes through a series of
+        increasingly expensive steps, only falling back to sorting and comparing the time values when the cheaper
+        steps are inconclusive:
+
+        1. The lengths and null counts of the time columns differ.
+        2. A direct comparison, which is conclusive when both columns are flagged as sorted.
+        3. The minimum and maximum time values differ.
+        4. A comparison of the sorted time columns.
+
         Args:
             old_df: The old `Polars` DataFrame to validate against.
             new_df: The new `Polars` DataFrame to validate from.
@@ -255,8 +271,22 @@ class TimeManager:
         new_ts = new_df[self._time_name]
         old_ts = old_df[self._time_name]
 
+        if old_ts.len() != new_ts.len() or old_ts.null_count() != new_ts.null_count():
+            raise TimeMutatedError(old_timestamps=old_ts, new_timestamps=new_ts)
+
+        both_sorted = old_ts.flags["SORTED_ASC"] and new_ts.flags["SORTED_ASC"]
+        if old_ts.equals(new_ts):
+            return
+        elif both_sorted:
+            raise TimeMutatedError(old_timestamps=old_ts, new_timestamps=new_ts)
+
+        if old_ts.min() != new_ts.min() or old_ts.max() != new_ts.max():
+            raise TimeMutatedError(old_timestamps=old_ts, new_timestamps=new_ts)
+
         # Compare sorted series
-        if not old_ts.sort().equals(new_ts.sort()):
+        old_sorted = old_ts if old_ts.flags["SORTED_ASC"] else old_ts.sort()
+        new_sorted = new_ts if new_ts.flags["SORTED_ASC"] else new_ts.sort()
+        if not old_sorted.equals(new_sorted):
             raise TimeMutatedError(old_timestamps=old_ts, new_timestamps=new_ts)
 
     def _handle_time_duplicates(self, df: pl.DataFrame) -> pl.DataFrame:
@@ -271,13 +301,16 @@ class TimeManager:
         Raises:
             DuplicateTimeError: If there are duplicate timestamps and the "error" strategy is being used.
         """
+        # Sort first (a linear check if the times are already in order), so that duplicates are found by comparing
+        # neighbouring times
+        df = sort_by_column(df, self._time_name)
         try:
             new_df = handle_duplicates(df, self._time_name, self._on_duplicates)
         except DuplicateValueError:
             raise DuplicateTimeError()
 
         # Polars aggregate methods can change the order due to how it optimises the functionality, so sort times after
-        new_df = new_df.sort(self._time_name)
+        new_df = sort_by_column(new_df, self._time_name)
         return new_df
 
     def _handle_misaligned_rows(self, df: pl.DataFrame) -> pl.DataFrame:
@@ -20,6 +20,13 @@ from time_stream.exceptions import (
 )
 from time_stream.types import ClosedInterval, DuplicateOption, TimeAnchor
 
+# Number of rows checked at a time by the integer alignment and periodicity checks, so that a violation near the start
+# of a long time series is found without checking the rest of it.
+_CHECK_SLICE_LENGTH = 1_000_000
+
+# Length of one physical unit of each datetime time unit, in nanoseconds
+_TIME_UNIT_NANOSECONDS = {"ns": 1, "us": 1_000, "ms": 1_000_000}
+
 
 @dataclass(frozen=True)
 class TimeWindow:
@@ -92,13 +99,22 @@ class TimeWindow:
         Returns:
             Filtered DataFrame containing only rows within the time window.
         """
+        return df.filter(self.filter_expr(time_name))
+
+    def filter_expr(self, time_name: str) -> pl.Expr:
+        """Return a boolean expression that is True for rows whose time-of-day falls within this window.
+
+        Args:
+            time_name: The name of the datetime column.
+
+        Returns:
+            Boolean Polars expression.
+        """
         time_col = pl.col(time_name).dt.time()
-        return df.filter(
-            time_col.is_between(
-                self.start,
-                self.end,
-                closed=self.closed,  # type: ignore[arg-type] - Polars Literal is a string
-            )
+        return time_col.is_between(
+            self.start,
+            self.end,
+            closed=self.closed,  # type: ignore[arg-type] - Polars Literal is a string
         )
 
     def expected_count(self, periodicity: Period) -> int:
@@ -183,9 +199,11 @@ def truncate_to_period(date_times: pl.Series, period: Period, time_anchor: TimeA
     if time_anchor == "end":
         # In this case, the anchor point is at the END of the period.
         #   - Subtract a micro-second (to handle datetimes on 'boundary' points that are within their own period),
+        #     or a milli-second for millisecond datetimes, which cannot represent a micro-second,
         #   - Truncate to the start of the period,
         #   - Add on 1 period to get to the end point.
-        date_times = date_times.dt.offset_by("-1us")
+        nudge = "-1ms" if getattr(date_times.dtype, "time_unit", None) == "ms" else "-1us"
+        date_times = date_times.dt.offset_by(nudge)
         date_times = date_times.dt.truncate(period.pl_interval)
         date_times = date_times.dt.offset_by(period.pl_interval)
     else:
@@ -214,10 +232,13 @@ def pad_time(
 
     1. Truncates existing timestamps to align with the boundary of their periodicity interval
     2. Finds the minimum and maximum timestamps in the dataset
-    3. Generates a complete series of timestamps at the correct periodicity between min and max
-    4. Identifies which expected timestamps are missing from the actual data
-    5. Creates a DataFrame with these missing timestamps
-    6. Joins this with the original data to create a complete time series
+    3. Returns the data as it is if there is already one row per period between min and max (checked by counting,
+       for fixed-length periodicities)
+    4. Generates a complete series of timestamps at the correct periodicity between min and max
+    5. Identifies which expected timestamps are missing from the actual data, with a binary search of the sorted
+       expected timestamps
+    6. Creates a DataFrame with these missing timestamps
+    7. Merges this with the (sorted) original data to create a complete time series, in time order
 
     The resulting padded DataFrame maintains all original data and column types, with NULL values populated
     for all non-time columns in the added rows.
@@ -236,6 +257,10 @@ def pad_time(
         pl.DataFrame of padded data
 
     """
+    # Both sides of the merge must be in time order
+    df = sort_by_column(df, time_name)
+    columns = [time_name, *(column for column in df.columns if column != time_name)]
+
     # Extract the existing datetimes, truncated to the boundary of their periodicity period
     existing_datetimes = truncate_to_period(df[time_name], periodicity, time_anchor)
 
@@ -249,6 +274,9 @@ def pad_time(
     if min_datetime >= max_datetime:
         raise ValueError(f"Invalid datetime range to pad. Start: {min_datetime}. End: {max_datetime}")
 
+    if start is None and end is None and _is_complete(existing_datetimes, periodicity):
+        return df.select(columns)
+
     dtype = df[time_name].dtype
     time_unit = dtype.time_unit if isinstance(dtype, pl.Datetime) else "us"
 
@@ -261,17 +289,64 @@ def pad_time(
         time_unit=time_unit,
     )
 
-    # Find any missing datetimes between expected and existing
-    missing_datetimes = expected_datetimes.filter(~expected_datetimes.is_in(existing_datetimes.implode()))
-    missing_df = pl.DataFrame({time_name: missing_datetimes})
+    # Find any missing datetimes between expected and existing. An expected datetime is not missing if it matches
+    # either the truncated or the actual time of an existing row.
+    found = _found_in_sorted(expected_datetimes, existing_datetimes) | _found_in_sorted(
+        expected_datetimes, df[time_name]
+    )
+    missing_datetimes = expected_datetimes.filter(~found)
+    if missing_datetimes.is_empty():
+        return df.select(columns)
+
+    missing_df = pl.DataFrame({time_name: missing_datetimes.cast(dtype)}).with_columns(
+        pl.lit(None, dtype=df.schema[column]).alias(column) for column in columns[1:]
+    )
+
+    # Merge the two sorted DataFrames into a complete time series, which is then already in time order
+    padded_df = df.select(columns).merge_sorted(missing_df, key=time_name)
+    return padded_df.with_columns(padded_df[time_name].set_sorted())
+
+
+def _found_in_sorted(values: pl.Series, other: pl.Series) -> pl.Series:
+    """Find which values of a sorted Series are in another sorted Series.
+
+    As both Series are sorted, this is done with a single as-of join (a merge of the two sorted Series), rather than
+    hashing all of the values.
+
+    Args:
+        values: The sorted Series of values to look for.
+        other: The sorted Series of values to look in.
+
+    Returns:
+        Boolean Series, True where the value is in ``other``.
+    """
+    left = values.alias("value").set_sorted().to_frame()
+    right = other.cast(values.dtype).alias("value").set_sorted().to_frame().with_columns(pl.col("value").alias("match"))
+    matches = left.join_asof(right, on="value", strategy="backward")
+    return (matches["match"] == matches["value"]).fill_null(False)
+
 
-    # Perform a join to create a complete time series
-    padded_df = missing_df.join(df, on=time_name, how="full", coalesce=True)
+def _is_complete(date_times: pl.Series, period: Period) -> bool:
+    """Check, without generating the expected datetimes, whether a sorted Series of datetimes that have been truncated
+    to a fixed-length period has a value for every period between its first and last value.
 
-    # Sort on time column
-    padded_df = padded_df.sort(time_name)
+    Args:
+        date_times: A sorted Series of date/times, truncated to the period.
+        period: The period.
 
-    return padded_df
+    Returns:
+        True if the Series is known to be complete, False if it is not, or cannot be checked this way.
+    """
+    units = _fixed_period_units(date_times, period)
+    if units is None or date_times.null_count():
+        return False
+    step = units[0]
+    physical = date_times.to_physical()
+    first, last = physical[0], physical[-1]
+    # Truncated datetimes are all on the period boundaries, so if they are unique, one per period means no gaps
+    if (last - first) // step + 1 != date_times.len():
+        return False
+    return bool((physical.diff().drop_nulls() > 0).all())
 
 
 def gap_size_count(df: pl.DataFrame, column: str) -> pl.DataFrame:
@@ -284,23 +359,85 @@ def gap_size_count(df: pl.DataFrame, column: str) -> pl.DataFrame:
     Returns:
         pl.DataFrame with gap size counts.
     """
-    null_mask = pl.col(column).is_null()
-    df = df.with_columns(
-        [
-            pl.when(null_mask)
-            .then(pl.len().over((null_mask != null_mask.shift(1, fill_value=False)).cum_sum()))
-            .otherwise(0)
-            .alias("gap_size")
-        ]
+    gap_size = expand_gaps(_null_runs(df[column]), df.height, "length")
+    return df.with_columns(gap_size.fill_null(0).alias("gap_size"))
+
+
+def _null_runs(values: pl.Series) -> pl.DataFrame:
+    """Run-length encode the runs of consecutive NULL values in a Series, in a single pass of the data.
+
+    Args:
+        values: The Series to find NULL runs within.
+
+    Returns:
+        pl.DataFrame with the ``start_row``, ``end_row`` and ``length`` of each run of NULL values.
+    """
+    runs = values.is_null().rle().struct.unnest()
+    runs = runs.with_columns((pl.col("len").cum_sum() - pl.col("len")).alias("start_row")).filter(pl.col("value"))
+    return runs.select(
+        pl.col("start_row"),
+        (pl.col("start_row") + pl.col("len") - 1).alias("end_row"),
+        pl.col("len").alias("length"),
     )
-    return df
 
 
-def check_columns_in_dataframe(df: pl.DataFrame, columns: str | Iterable[str]) -> None:
+def gap_index(df: pl.DataFrame, time_name: str, column: str) -> pl.DataFrame:
+    """Build an index of the gaps (groups of consecutive NULL rows) in a DataFrame column.
+
+    The index is built with a single pass of the column, so that it can be computed once and then shared by the
+    steps that need to know where the gaps are (e.g. the infill mask, the maximum gap size check and the gap bounds of
+    the alternative data infill methods).
+
+    Missing time steps are only counted as gaps if they are present as NULL rows, so pad the DataFrame first (see
+    :func:`pad_time`) to find all the gaps in a time series.
+
+    Args:
+        df: DataFrame containing column data
+        time_name: The name of the time column
+        column: The column to find gaps within
+
+    Returns:
+        pl.DataFrame with one row per gap, in row order, with the columns:
+
+        - ``start_row`` / ``end_row``: the first and last row of the gap
+        - ``start`` / ``end``: the first and last time of the gap
+        - ``length``: the number of rows in the gap
+    """
+    runs = _null_runs(df[column])
+    times = df[time_name]
+    return runs.select(
+        pl.col("start_row"),
+        pl.col("end_row"),
+        times.gather(runs["start_row"]).alias("start"),
+        times.gather(runs["end_row"]).alias("end"),
+        pl.col("length"),
+    )
+
+
+def expand_gaps(gaps: pl.DataFrame, height: int, column: str) -> pl.Series:
+    """Expand a column of a gap index (see :func:`gap_index`) to the rows of the DataFrame that it indexes.
+
+    Args:
+        gaps: The gap index.
+        height: The number of rows in the indexed DataFrame.
+        column: The column of the gap index to expand.
+
+    Returns:
+        pl.Series with the value of the gap on each row within a gap, and NULL on all other rows.
+    """
+    rows = gaps.select(
+        pl.int_ranges("start_row", pl.col("end_row") + 1, dtype=pl.UInt32).alias("row"),
+        pl.col(column),
+    ).explode("row", empty_as_null=False)
+    values = pl.Series(column, dtype=gaps.schema[column]).extend_constant(None, height)
+    return values.scatter(rows["row"], rows[column])
+
+
+def check_columns_in_dataframe(df: pl.DataFrame | pl.LazyFrame, columns: str | Iterable[str]) -> None:
     """Checks that columns exist in the dataframe.
 
     Args:
-        df: DataFrame to check against
+        df: DataFrame (or LazyFrame) to check against
         columns: String or Iterable of column name(s) to check
 
     Raises:
@@ -309,7 +446,7 @@ def check_columns_in_dataframe(df: pl.DataFrame, columns: str | Iterable[str]) -
     if isinstance(columns, str):
         columns = [columns]
 
-    invalid_columns = sorted(set(columns) - set(df.columns))
+    invalid_columns = sorted(set(columns) - set(df.collect_schema().names()))
     if invalid_columns:
         raise ColumnNotFoundError(f"Columns not found in dataframe: {invalid_columns}")
 
@@ -372,6 +509,29 @@ def epoch_check(period: Period) -> None:
         raise NotImplementedError(f"Non-epoch agnostic  periods are not supported: {period}")
 
 
+def sort_by_column(df: pl.DataFrame, column: str) -> pl.DataFrame:
+    """Sort a DataFrame by a column, skipping the sort if the column is already in ascending order.
+
+    The column of the returned DataFrame carries the Polars sorted flag, which lets later operations on it (e.g.
+    finding duplicates, joins and filters) take their faster, sorted, code paths.
+
+    The sort is stable, so rows with equal values in the column keep their relative order.
+
+    Args:
+        df: The Polars DataFrame to sort.
+        column: The name of the column to sort by.
+
+    Returns:
+        The DataFrame sorted by the column.
+    """
+    values = df[column]
+    if not values.is_sorted():
+        return df.sort(column, maintain_order=True)
+    if values.flags["SORTED_ASC"]:
+        return df
+    return df.with_columns(values.set_sorted())
+
+
 def handle_duplicates(
     df: pl.DataFrame,
     column: str,
@@ -395,7 +555,13 @@ def handle_duplicates(
     Raises:
         DuplicateValueError: If on_duplicates is set to ERROR and duplicates exist.
     """
-    duplicate_mask = df[column].is_duplicated()
+    values = df[column]
+    if values.flags["SORTED_ASC"] and not values.has_nulls():
+        # Duplicates in a sorted column are adjacent, so compare neighbours rather than hashing every value
+        same_as_previous = (values == values.shift(1)).fill_null(False)
+        duplicate_mask = same_as_previous | same_as_previous.shift(-1).fill_null(False)
+    else:
+        duplicate_mask = values.is_duplicated()
 
     if not duplicate_mask.any():
         # Nothing to do!
@@ -424,12 +590,60 @@ def handle_duplicates(
     return new_df
 
 
+def _fixed_period_units(date_times: pl.Series, period: Period) -> tuple[int, int, int] | None:
+    """Express a fixed-length period in the physical (integer) units of a Series of datetimes.
+
+    This is only possible for epoch-agnostic periods of a fixed length (i.e. not months or years), on naive or UTC
+    datetimes - ``dt.truncate`` works in local time for other time zones - where the period and its offset are a
+    whole number of units.
+
+    Args:
+        date_times: A Series of date/times.
+        period: The period to express in the units of the Series.
+
+    Returns:
+        Tuple of (step, offset, nudge) in physical units, where nudge is the smaller of one microsecond and one unit,
+        or None if the period cannot be expressed in the units of the Series.
+    """
+    dtype = date_times.dtype
+    period_timedelta = period.timedelta
+    if not isinstance(dtype, pl.Datetime) or dtype.time_zone not in (None, "UTC"):
+        return None
+    if period_timedelta is None or not period.is_epoch_agnostic():
+        return None
+
+    unit = _TIME_UNIT_NANOSECONDS[dtype.time_unit]
+    step = (period_timedelta // timedelta(microseconds=1)) * 1_000
+    offset = period.microsecond_offset * 1_000
+    if step % unit or offset % unit:
+        return None
+    return step // unit, offset // unit, max(1_000 // unit, 1)
+
+
+def _slices(series: pl.Series, overlap: int = 0) -> Iterable[pl.Series]:
+    """Split a Series into zero-copy slices of ``_CHECK_SLICE_LENGTH`` rows.
+
+    Args:
+        series: The Series to split.
+        overlap: Number of rows at the start of each slice to repeat from the end of the previous slice.
+
+    Returns:
+        Iterable of the slices of the Series.
+    """
+    for offset in range(0, max(series.len() - overlap, 1), _CHECK_SLICE_LENGTH):
+        yield series.slice(offset, _CHECK_SLICE_LENGTH + overlap)
+
+
 def check_alignment(date_times: pl.Series, alignment: Period, time_anchor: TimeAnchor) -> bool:
     """Check that a Series of date/time values conforms to a given alignment period.
 
     Alignment defines how "precise" the datetimes are; in effect defining the set of allowed timestamps positions
     along the timeline.
 
+    For fixed-length periods, this is checked with integer arithmetic on the physical representation of the
+    date/times, stopping at the first slice of rows that is not aligned. Otherwise, the date/times are truncated to
+    the period and compared.
+
     Args:
        date_times: A Series of date/times to be tested.
        alignment: The alignment period that the date/times are checked against.
@@ -438,7 +652,13 @@ def check_alignment(date_times: pl.Series, alignment: Period, time_anchor: TimeA
     Returns:
        True if the Series conforms to the alignment period.
     """
-    return date_times.equals(truncate_to_period(date_times, alignment, time_anchor))
+    units = _fixed_period_units(date_times, alignment)
+    if units is None:
+        return date_times.equals(truncate_to_period(date_times, alignment, time_anchor))
+
+    # A date/time is on a period boundary whichever end of the period it is anchored to
+    step, offset, _ = units
+    return not any(((physical - offset) % step != 0).any() for physical in _slices(date_times.to_physical()))
 
 
 def check_periodicity(date_times: pl.Series, periodicity: Period, time_anchor: TimeAnchor) -> bool:
@@ -447,6 +667,10 @@ def check_periodicity(date_times: pl.Series, periodicity: Period, time_anchor: T
     Periodicity defines the allowed "frequency" of the datetimes, i.e., how many datetimes
      entries are allowed within a given period of time.
 
+    For fixed-length periods, each date/time is mapped to the integer ID of the period it falls in. For sorted
+    date/times, the IDs must be strictly increasing, which is checked a slice of rows at a time. Otherwise, the
+    date/times are truncated to the period and the unique values counted.
+
     Args:
        date_times: A Series of date/times to be tested.
        periodicity: The periodicity period that the date/times are checked against.
@@ -455,6 +679,21 @@ def check_periodicity(date_times: pl.Series, periodicity: Period, time_anchor: T
     Returns:
        True if the Series conforms to the periodicity.
     """
-    # Check how many unique values are in the truncated times. It should equal the length of the original
-    # time-series if all time values map to single periodicity
-    return truncate_to_period(date_times, periodicity, time_anchor).n_unique() == date_times.len()
+    units = _fixed_period_units(date_times, periodicity)
+    if units is None:
+        # Check how many unique values are in the truncated times. It should equal the length of the original
+        # time-series if all time values map to single periodicity
+        return truncate_to_period(date_times, periodicity, time_anchor).n_unique() == date_times.len()
+
+    step, offset, nudge = units
+    if time_anchor == "end":
+        # Date/times on a period boundary are the end of the preceding period
+        offset += nudge
+
+    def period_ids(physical: pl.Series) -> pl.Series:
+        return (physical - offset) // step
+
+    physical = date_times.to_physical()
+    if date_times.null_count() == 0 and date_times.is_sorted():
+        return not any((period_ids(chunk).diff() == 0).any() for chunk in _slices(physical, overlap=1))
+    return period_ids(physical).n_unique() == date_times.len()
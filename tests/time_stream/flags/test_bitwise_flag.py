@@ -385,6 +385,26 @@ class TestDecodeFlagColumn:
         assert tf_decoded.df["flag_col_1"].to_list()[row] == expected
         assert tf_decoded.get_flag_column("flag_col_1").is_decoded is True
 
+    def test_repeated_values_decoded_in_row_order(self) -> None:
+        """Test that the distinct values decoded through the lookup table are mapped back onto the rows in order."""
+        tf = self.setup_tf()
+        values = [7, 0, 1, 5, 1, None, 7, 2, 0, 6]
+        df = pl.DataFrame({"flag_col_1": pl.Series(values, dtype=pl.Int64)})
+        decoded = tf.get_flag_column("flag_col_1").decode(df)
+        expected = [
+            ["FLAG_A", "FLAG_B", "FLAG_C"],
+            [],
+            ["FLAG_A"],
+            ["FLAG_A", "FLAG_C"],
+            ["FLAG_A"],
+            [],
+            ["FLAG_A", "FLAG_B", "FLAG_C"],
+            ["FLAG_B"],
+            [],
+            ["FLAG_B", "FLAG_C"],
+        ]
+        assert_series_equal(decoded["flag_col_1"], pl.Series("flag_col_1", expected, dtype=pl.List(pl.String)))
+
     def test_returns_new_timeframe(self) -> None:
         """Test that decode_flag_column returns a new TimeFrame (original unchanged)."""
         tf = self.setup_tf()
@@ -434,6 +454,13 @@ class TestEncodeFlagColumn:
         assert tf_encoded.df["flag_col_1"].to_list()[row] == expected
         assert tf_encoded.get_flag_column("flag_col_1").is_decoded is False
 
+    def test_duplicate_and_null_names(self) -> None:
+        """Test that a flag name listed twice is only counted once, and null lists and names are ignored."""
+        tf = self.setup_tf()
+        df = pl.DataFrame({"flag_col_1": [["FLAG_B", "FLAG_B"], None, ["FLAG_A", None], ["FLAG_C", "FLAG_A"]]})
+        encoded = tf.get_flag_column("flag_col_1").encode(df)
+        assert_series_equal(encoded["flag_col_1"], pl.Series("flag_col_1", [2, 0, 1, 5], dtype=pl.Int64))
+
     def test_returns_new_timeframe(self) -> None:
         """Test that encode_flag_column returns a new TimeFrame (original unchanged)."""
         tf_decoded = self.setup_tf()
@@ -13,10 +13,12 @@ from time_stream.exceptions import (
     CategoricalFlagUnknownError,
     CategoricalFlagValueError,
     ColumnTypeError,
+    FlagSystemTypeError,
 )
 from time_stream.flags.bitwise_flag_system import BitwiseFlag
 from time_stream.flags.categorical_flag_system import CategoricalListFlag, CategoricalSingleFlag
-from time_stream.flags.flag_manager import CategoricalListFlagColumn, CategoricalSingleFlagColumn
+from time_stream.flags.flag_manager import CategoricalListFlagColumn, CategoricalSingleFlagColumn, FlagStorageLiteral
+from time_stream.flags.flag_system import FlagSystemLiteral
 
 
 class FlagsInt(CategoricalSingleFlag):
@@ -561,3 +563,280 @@ class TestRegisterFlagColumnBySystemType:
         tf2 = tf.with_df(df)
         tf2.register_flag_column("my_flags", "qc")
         assert isinstance(tf2.get_flag_column("my_flags"), CategoricalListFlagColumn)
+
+
+class TestEnumStorage:
+    @staticmethod
+    def setup_tf(flag_type: FlagSystemLiteral, flags: dict[str, int | str]) -> TimeFrame:
+        """Create a TimeFrame with a populated flag column held as a ``pl.Enum``."""
+        tf = make_tf().with_flag_system("qc", flags, flag_type=flag_type)
+        tf.init_flag_column("qc", "flag_col", storage="enum")
+        tf.add_flag("flag_col", "FLAG_A", pl.col("value").eq(10))
+        tf.add_flag("flag_col", "FLAG_B", pl.col("value").ge(20))
+        return tf
+
+    @pytest.mark.parametrize(
+        "flag_type,flags,expected_dtype",
+        [
+            ("categorical", {"FLAG_A": "A", "FLAG_B": "B"}, pl.Enum(["A", "B"])),
+            ("categorical", {"FLAG_A": 5, "FLAG_B": 7}, pl.Enum(["5", "7"])),
+            ("categorical_list", {"FLAG_A": "A", "FLAG_B": "B"}, pl.List(pl.Enum(["A", "B"]))),
+        ],
+    )
+    def test_init_dtype(
+        self, flag_type: FlagSystemLiteral, flags: dict[str, int | str], expected_dtype: pl.DataType
+    ) -> None:
+        """Test that the flag column is held as an Enum of the flag values, with strings for int values."""
+        tf = self.setup_tf(flag_type, flags)
+        assert tf.df["flag_col"].dtype == expected_dtype
+        assert tf.get_flag_column("flag_col").storage == "enum"
+
+    def test_single_add_and_remove(self) -> None:
+        """Test that flags are set and cleared on an Enum single flag column."""
+        tf = self.setup_tf("categorical", {"FLAG_A": "A", "FLAG_B": "B"})
+        tf.remove_flag("flag_col", "FLAG_B", pl.col("value").eq(30))
+        assert tf.df["flag_col"].to_list() == ["A", "B", None]
+
+    def test_list_add_and_remove(self) -> None:
+        """Test that flags are appended to and removed from an Enum list flag column."""
+        tf = self.setup_tf("categorical_list", {"FLAG_A": 1, "FLAG_B": 2})
+        tf.add_flag("flag_col", "FLAG_A", pl.col("value").eq(30))
+        tf.remove_flag("flag_col", "FLAG_B", pl.col("value").eq(20))
+        assert tf.df["flag_col"].to_list() == [["1"], [], ["2", "1"]]
+
+    @pytest.mark.parametrize("flag_type", ["categorical", "categorical_list"])
+    def test_decode_keeps_physical_codes(self, flag_type: FlagSystemLiteral) -> None:
+        """Test that decoding reinterprets the physical codes as an Enum of the flag names."""
+        tf = self.setup_tf(flag_type, {"FLAG_A": "A", "FLAG_B": "B"})
+        tf_dec = tf.decode_flag_column("flag_col")
+        column, decoded = tf.df["flag_col"], tf_dec.df["flag_col"]
+        if flag_type == "categorical_list":
+            assert decoded.dtype == pl.List(pl.Enum(["FLAG_A", "FLAG_B"]))
+            column, decoded = column.explode(empty_as_null=False), decoded.explode(empty_as_null=False)
+        else:
+            assert decoded.dtype == pl.Enum(["FLAG_A", "FLAG_B"])
+        assert_series_equal(decoded.cat.physical(), column.cat.physical())
+
+    @pytest.mark.parametrize("flag_type", ["categorical", "categorical_list"])
+    def test_round_trip(self, flag_type: FlagSystemLiteral) -> None:
+        """Test that decode then encode restores the original Enum column."""
+        tf = self.setup_tf(flag_type, {"FLAG_A": 0, "FLAG_B": 1})
+        tf_roundtrip = tf.decode_flag_column("flag_col").encode_flag_column("flag_col")
+        assert_series_equal(tf_roundtrip.df["flag_col"], tf.df["flag_col"])
+
+    def test_encode_plain_names(self) -> None:
+        """Test that a decoded column replaced with plain strings is encoded back to the Enum."""
+        tf_dec = self.setup_tf("categorical", {"FLAG_A": "A", "FLAG_B": "B"}).decode_flag_column("flag_col")
+        tf_dec = tf_dec.with_df(tf_dec.df.with_columns(pl.Series("flag_col", ["FLAG_B", None, "FLAG_A"])))
+        assert tf_dec.encode_flag_column("flag_col").df["flag_col"].to_list() == ["B", None, "A"]
+
+    def test_encode_plain_unknown_name_raises(self) -> None:
+        """Test that a decoded column replaced with unknown plain strings raises CategoricalFlagUnknownError."""
+        tf_dec = self.setup_tf("categorical_list", {"FLAG_A": "A", "FLAG_B": "B"}).decode_flag_column("flag_col")
+        tf_bad = tf_dec.with_df(tf_dec.df.with_columns(pl.Series("flag_col", [["FLAG_A", "UNKNOWN"], [], []])))
+        with pytest.raises(CategoricalFlagUnknownError):
+            tf_bad.encode_flag_column("flag_col")
+
+    @pytest.mark.parametrize("flag_type", ["categorical", "categorical_list"])
+    @pytest.mark.parametrize("decode", [False, True])
+    def test_filter(self, flag_type: FlagSystemLiteral, decode: bool) -> None:
+        """Test that filtering by flag matches rows in both encoded and decoded form."""
+        tf = self.setup_tf(flag_type, {"FLAG_A": "A", "FLAG_B": "B"})
+        if decode:
+            tf = tf.decode_flag_column("flag_col")
+        expr = tf.get_flag_column("flag_col").filter_expr(["FLAG_A", "B"])
+        assert tf.df.select(expr).to_series().to_list() == [True, True, True]
+        expr = tf.get_flag_column("flag_col").filter_expr(["FLAG_A"])
+        assert tf.df.select(expr).to_series().to_list() == [True, False, False]
+
+    @pytest.mark.parametrize(
+        "flag_type,flags,data,dtype",
+        [
+            ("categorical", {"FLAG_A": 0, "FLAG_B": 1}, [0, 1, None], pl.Int32),
+            ("categorical", {"FLAG_A": "A", "FLAG_B": "B"}, ["A", "B", None], pl.Utf8),
+            ("categorical", {"FLAG_A": "A", "FLAG_B": "B"}, ["A", "B", None], pl.Enum(["A", "B"])),
+            ("categorical_list", {"FLAG_A": 0, "FLAG_B": 1}, [[0], [1], []], pl.List(pl.Int32)),
+        ],
+    )
+    def test_register_converts_column(
+        self, flag_type: FlagSystemLiteral, flags: dict[str, int | str], data: list, dtype: pl.DataType
+    ) -> None:
+        """Test that registering a raw-value column with Enum storage converts it to the Enum dtype."""
+        tf = make_tf().with_flag_system("qc", flags, flag_type=flag_type)
+        tf = tf.with_df(tf.df.with_columns(pl.Series("my_flags", data, dtype=dtype)))
+        tf.register_flag_column("my_flags", "qc", storage="enum")
+        assert tf.df["my_flags"].dtype == TimeFrame._flag_dtype(tf.get_flag_system("qc"), "enum")
+        assert tf.filter_by_flag("my_flags", "FLAG_B").df["value"].to_list() == [20]
+
+    def test_register_invalid_values_raises(self) -> None:
+        """Test that registering a column with values outside the flag system raises CategoricalFlagUnknownError."""
+        tf = make_tf().with_flag_system("qc", {"FLAG_A": "A"}, flag_type="categorical")
+        tf = tf.with_df(tf.df.with_columns(pl.Series("my_flags", ["A", "X", None])))
+        with pytest.raises(CategoricalFlagUnknownError):
+            tf.register_flag_column("my_flags", "qc", storage="enum")
+
+    @pytest.mark.parametrize(
+        "flag_type,flags,data,dtype",
+        [
+            ("categorical", {"FLAG_A": 5, "FLAG_B": 7}, ["5", "7", None], pl.Enum(["5", "7"])),
+            ("categorical", {"FLAG_A": "A", "FLAG_B": "B"}, ["A", "B", None], pl.Enum(["A", "B"])),
+            ("categorical_list", {"FLAG_A": 5, "FLAG_B": 7}, [["5"], ["7"], []], pl.List(pl.Enum(["5", "7"]))),
+        ],
+    )
+    def test_register_enum_with_values_storage_raises(
+        self, flag_type: FlagSystemLiteral, flags: dict[str, int | str], data: list, dtype: pl.DataType
+    ) -> None:
+        """Test that registering an Enum column with values storage raises CategoricalFlagTypeError, as the column
+        does not hold the raw flag values."""
+        tf = make_tf().with_flag_system("qc", flags, flag_type=flag_type)
+        tf = tf.with_df(tf.df.with_columns(pl.Series("my_flags", data, dtype=dtype)))
+        with pytest.raises(CategoricalFlagTypeError):
+            tf.register_flag_column("my_flags", "qc", storage="values")
+        assert tf.flag_columns == []
+
+    def test_bitwise_raises(self) -> None:
+        """Test that Enum storage is rejected for bitwise flag systems."""
+        tf = make_tf().with_flag_system("bits", {"FLAG_A": 1})
+        with pytest.raises(FlagSystemTypeError):
+            tf.init_flag_column("bits", "flag_col", storage="enum")
+        assert "flag_col" not in tf.df.columns
+
+    def test_select_keeps_storage(self) -> None:
+        """Test that the storage of a flag column is kept when selecting columns."""
+        tf = self.setup_tf("categorical", {"FLAG_A": "A", "FLAG_B": "B"})
+        assert tf.select(["flag_col"]).get_flag_column("flag_col").storage == "enum"
+
+
+class TestBitsetStorage:
+    @staticmethod
+    def setup_tf() -> TimeFrame:
+        """Create a TimeFrame with a populated list flag column packed into a bitset."""
+        tf = make_tf().with_flag_system(
+            "qc", {"FLAG_A": "A", "FLAG_B": "B", "FLAG_C": "C"}, flag_type="categorical_list"
+        )
+        tf.init_flag_column("qc", "flag_col", storage="bitset")
+        tf.add_flag("flag_col", "FLAG_A", pl.col("value").eq(10))
+        tf.add_flag("flag_col", "FLAG_C", pl.col("value").ge(20))
+        tf.add_flag("flag_col", "B", pl.col("value").eq(30))
+        return tf
+
+    def test_init_dtype(self) -> None:
+        """Test that the flag column is packed into a UInt64 bitmask, with no flags set."""
+        tf = make_tf().with_flag_system("qc", {"FLAG_A": 0, "FLAG_B": 1}, flag_type="categorical_list")
+        tf.init_flag_column("qc", "flag_col", storage="bitset")
+        assert_series_equal(tf.df["flag_col"], pl.Series("flag_col", [0, 0, 0], dtype=pl.UInt64))
+
+    def test_add_flag_sets_bits(self) -> None:
+        """Test that adding flags sets the bits of their positions in the flag system."""
+        assert self.setup_tf().df["flag_col"].to_list() == [0b001, 0b100, 0b110]
+
+    def test_add_flag_twice_is_noop(self) -> None:
+        """Test that adding a flag that is already set leaves the bitmask unchanged."""
+        tf = self.setup_tf()
+        tf.add_flag("flag_col", "FLAG_C")
+        assert tf.df["flag_col"].to_list() == [0b101, 0b100, 0b110]
+
+    def test_remove_flag_clears_bits(self) -> None:
+        """Test that removing a flag clears only its bit, and only where the expression is true."""
+        tf = self.setup_tf()
+        tf.remove_flag("flag_col", "FLAG_C", pl.col("value").gt(20))
+        tf.remove_flag("flag_col", "FLAG_A")
+        assert tf.df["flag_col"].to_list() == [0b000, 0b100, 0b010]
+
+    @pytest.mark.parametrize("decode", [False, True])
+    @pytest.mark.parametrize(
+        "flags,expected",
+        [(["FLAG_A"], [10]), (["FLAG_B", "A"], [10, 30]), (["FLAG_C"], [20, 30])],
+    )
+    def test_filter(self, flags: list[int | str], expected: list[int], decode: bool) -> None:
+        """Test that filtering by flag matches rows in both the packed and decoded form."""
+        tf = self.setup_tf()
+        if decode:
+            tf = tf.decode_flag_column("flag_col")
+        assert tf.filter_by_flag("flag_col", flags).df["value"].to_list() == expected
+
+    def test_decode_to_names(self) -> None:
+        """Test that decoding unpacks each bitmask into a list of flag names, in flag system order."""
+        tf_dec = self.setup_tf().decode_flag_column("flag_col")
+        expected = pl.Series("flag_col", [["FLAG_A"], ["FLAG_C"], ["FLAG_B", "FLAG_C"]], dtype=pl.List(pl.Utf8))
+        assert_series_equal(tf_dec.df["flag_col"], expected)
+
+    def test_round_trip(self) -> None:
+        """Test that decode then encode restores the original bitmasks, keeping null rows."""
+        tf = self.setup_tf()
+        tf = tf.with_df(tf.df.with_columns(pl.when(pl.col("value").eq(20)).then(None).otherwise(pl.col("flag_col"))))
+        tf_roundtrip = tf.decode_flag_column("flag_col").encode_flag_column("flag_col")
+        assert_series_equal(tf_roundtrip.df["flag_col"], tf.df["flag_col"])
+
+    def test_add_flag_on_decoded(self) -> None:
+        """Test that flags can be added to the decoded form of a bitset column."""
+        tf_dec = self.setup_tf().decode_flag_column("flag_col")
+        tf_dec.add_flag("flag_col", "FLAG_B", pl.col("value").eq(10))
+        assert tf_dec.df["flag_col"].to_list() == [["FLAG_A", "FLAG_B"], ["FLAG_C"], ["FLAG_B", "FLAG_C"]]
+
+    def test_encode_unknown_name_raises(self) -> None:
+        """Test that encoding a decoded bitset column with an unknown name raises CategoricalFlagUnknownError."""
+        tf_dec = self.setup_tf().decode_flag_column("flag_col")
+        tf_bad = tf_dec.with_df(tf_dec.df.with_columns(pl.Series("flag_col", [["FLAG_A", "UNKNOWN"], [], []])))
+        with pytest.raises(CategoricalFlagUnknownError):
+            tf_bad.encode_flag_column("flag_col")
+
+    @pytest.mark.parametrize(
+        "data,dtype",
+        [
+            ([["A"], [], ["C", "A", "A"]], pl.List(pl.Utf8)),
+            ([["A"], [], ["C", "A", "A"]], pl.List(pl.Enum(["A", "B", "C"]))),
+            ([1, 0, 5], pl.UInt64),
+        ],
+    )
+    def test_register_packs_column(self, data: list, dtype: pl.DataType) -> None:
+        """Test that registering a list or bitmask column with bitset storage packs it into a bitmask."""
+        tf = make_tf().with_flag_system(
+            "qc", {"FLAG_A": "A", "FLAG_B": "B", "FLAG_C": "C"}, flag_type="categorical_list"
+        )
+        tf = tf.with_df(tf.df.with_columns(pl.Series("my_flags", data, dtype=dtype)))
+        tf.register_flag_column("my_flags", "qc", storage="bitset")
+        assert_series_equal(tf.df["my_flags"], pl.Series("my_flags", [1, 0, 5], dtype=pl.UInt64))
+
+    def test_register_unknown_bits_raises(self) -> None:
+        """Test that registering a bitmask column with bits beyond the flag system raises an error."""
+        tf = make_tf().with_flag_system("qc", {"FLAG_A": "A", "FLAG_B": "B"}, flag_type="categorical_list")
+        tf = tf.with_df(tf.df.with_columns(pl.Series("my_flags", [1, 4, None], dtype=pl.UInt64)))
+        with pytest.raises(CategoricalFlagUnknownError):
+            tf.register_flag_column("my_flags", "qc", storage="bitset")
+
+    @pytest.mark.parametrize("storage", ["values", "enum"])
+    def test_register_bitmask_without_bitset_storage_raises(self, storage: FlagStorageLiteral) -> None:
+        """Test that a bitmask column is only taken to hold packed bitsets when registered with bitset storage."""
+        tf = make_tf().with_flag_system(
+            "qc", {"FLAG_A": "A", "FLAG_B": "B", "FLAG_C": "C"}, flag_type="categorical_list"
+        )
+        tf = tf.with_df(tf.df.with_columns(pl.Series("my_flags", [1, 0, 5], dtype=pl.UInt64)))
+        with pytest.raises(CategoricalFlagUnknownError):
+            tf.register_flag_column("my_flags", "qc", storage=storage)
+        assert tf.flag_columns == []
+
+    def test_sixty_four_flags(self) -> None:
+        """Test that the last of 64 flags uses the top bit of the bitmask."""
+        tf = make_tf().with_flag_system("qc", [f"FLAG_{i:02d}" for i in range(64)], flag_type="categorical_list")
+        tf.init_flag_column("qc", "flag_col", storage="bitset")
+        tf.add_flag("flag_col", "FLAG_63", pl.col("value").eq(10))
+        tf.add_flag("flag_col", "FLAG_00")
+        tf.remove_flag("flag_col", "FLAG_00", pl.col("value").eq(10))
+        assert tf.df["flag_col"].to_list() == [1 << 63, 1, 1]
+        assert tf.decode_flag_column("flag_col").df["flag_col"].to_list() == [["FLAG_63"], ["FLAG_00"], ["FLAG_00"]]
+
+    @pytest.mark.parametrize(
+        "flag_type,flags",
+        [
+            ("categorical_list", [f"FLAG_{i:02d}" for i in range(65)]),
+            ("categorical", ["FLAG_A"]),
+            ("bitwise", ["FLAG_A"]),
+        ],
+    )
+    def test_unsupported_raises(self, flag_type: FlagSystemLiteral, flags: list[str]) -> None:
+        """Test that bitset storage is rejected for more than 64 flags, or for non-list flag systems."""
+        tf = make_tf().with_flag_system("qc", flags, flag_type=flag_type)
+        with pytest.raises(FlagSystemTypeError):
+            tf.init_flag_column("qc", "flag_col", storage="bitset")
+        assert "flag_col" not in tf.df.columns
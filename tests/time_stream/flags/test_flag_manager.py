@@ -248,6 +248,26 @@ class TestCopy:
 
         self.assert_copy(flag_manager_copy)
 
+    def test_copy_shares_flag_systems(self) -> None:
+        """Test that the (immutable) flag system classes are shared with the copy, rather than rebuilt."""
+        flag_manager = self.setup_flag_manager()
+        flag_manager_copy = flag_manager.copy()
+
+        for name, system in flag_manager.flag_systems.items():
+            assert flag_manager_copy.flag_systems[name] is system
+
+    def test_copy_flag_columns_independent(self) -> None:
+        """Test that the flag columns of the copy are new objects, so their decoded state is independent."""
+        flag_manager = self.setup_flag_manager()
+        flag_manager.flag_columns["flag_col_1"].is_decoded = True
+        flag_manager_copy = flag_manager.copy()
+
+        assert flag_manager_copy.flag_columns["flag_col_1"] is not flag_manager.flag_columns["flag_col_1"]
+        assert flag_manager_copy.flag_columns["flag_col_1"].is_decoded
+
+        flag_manager_copy.flag_columns["flag_col_1"].is_decoded = False
+        assert flag_manager.flag_columns["flag_col_1"].is_decoded
+
     def test_standard_lib_copy(self) -> None:
         """Test that the standard library copy module works as expected."""
         flag_manager = self.setup_flag_manager()
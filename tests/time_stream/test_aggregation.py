@@ -1,13 +1,14 @@
 import re
-from datetime import datetime, time
-from typing import Any, Callable
-from unittest.mock import Mock
+from datetime import datetime, time, timedelta
+from typing import Any, Callable, Iterator
+from unittest.mock import Mock, patch
 
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
 from time_stream.aggregation import (
+    AggregationCascade,
     AggregationCtx,
     AggregationFunction,
     AngularMean,
@@ -30,11 +31,12 @@ from time_stream.exceptions import (
     AggregationPeriodError,
     MissingCriteriaError,
     RegistryKeyTypeError,
+    ResolutionError,
     TimeWindowError,
     UnknownRegistryKeyError,
 )
 from time_stream.period import Period
-from time_stream.types import MissingCriteria
+from time_stream.types import MissingCriteria, TimeAnchor
 from time_stream.utils import TimeWindow
 
 
@@ -2327,6 +2329,481 @@ class TestTimeWindowAggregation:
         assert_frame_equal(result.df, expected_df, check_dtypes=False, check_column_order=False)
 
 
+class TestMultiAggregation:
+    @staticmethod
+    def join_results(results: list[TimeFrame]) -> pl.DataFrame:
+        """Join the results of separate aggregations, keeping one copy of the shared count and validity columns."""
+        df = results[0].df
+        for result in results[1:]:
+            df = df.join(result.df.select(pl.exclude(df.columns[1:])), on="timestamp", how="left")
+        return df
+
+    @pytest.mark.parametrize(
+        "functions",
+        [
+            ["mean", "min", "max"],
+            [Sum, MeanSum(), Percentile(p=95)],
+            ["stdev", "angular_mean", Nth(n=3)],
+        ],
+        ids=["names", "classes and instances", "mixed"],
+    )
+    def test_list_matches_separate_aggregations(self, functions: list[Any]) -> None:
+        """Test that a list of functions gives the same columns as aggregating with each function separately."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 100, missing_data=True)
+        columns = ["value", "value_plus1"]
+        missing_criteria = ("percent", 90)
+
+        result = tf.aggregate("P1D", functions, columns, missing_criteria)
+        separate = [tf.aggregate("P1D", function, columns, missing_criteria) for function in functions]
+
+        assert_frame_equal(result.df, self.join_results(separate), check_column_order=False)
+        assert result.resolution == separate[0].resolution
+        assert result.periodicity == separate[0].periodicity
+
+    def test_dict_applies_functions_per_column(self) -> None:
+        """Test that a dict applies each function only to its column, sharing the expected count column."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+
+        result = tf.aggregate("P1D", {"value": ["min", "max"], "value_plus1": "sum"})
+
+        expected = pl.DataFrame(
+            {
+                "timestamp": [datetime(2025, 1, 1), datetime(2025, 1, 2)],
+                "min_value": [0, 24],
+                "timestamp_of_min_value": [datetime(2025, 1, 1), datetime(2025, 1, 2)],
+                "max_value": [23, 47],
+                "timestamp_of_max_value": [datetime(2025, 1, 1, 23), datetime(2025, 1, 2, 23)],
+                "sum_value_plus1": [300, 876],
+                "count_value": [24, 24],
+                "count_value_plus1": [24, 24],
+                "expected_count_timestamp": [24, 24],
+                "valid_value": [True, True],
+                "valid_value_plus1": [True, True],
+            }
+        )
+        assert_frame_equal(result.df, expected, check_dtypes=False)
+
+    def test_kwargs_passed_to_functions(self) -> None:
+        """Test that kwargs are used to initialise the functions given by name."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+
+        result = tf.aggregate("P1D", ["percentile", Nth(n=1)], "value", p=50)
+
+        assert result.df["percentile_value"].to_list() == [12, 36]
+        assert result.df["nth_value"].to_list() == [0, 24]
+
+    def test_grouped_once(self) -> None:
+        """Test that the data is only grouped once for all the functions."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+
+        with patch.object(StandardAggregationPipeline, "_get_grouper", autospec=True) as mock_grouper:
+            mock_grouper.side_effect = lambda pipeline, df: df.group_by_dynamic("timestamp", every="1d")
+            tf.aggregate("P1D", ["mean", "min", "max", "sum"], "value")
+
+        mock_grouper.assert_called_once()
+
+    def test_rolling_aggregate(self) -> None:
+        """Test that a list of functions can be used in a rolling aggregation."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+
+        result = tf.rolling_aggregate("PT3H", ["mean", "sum"], "value")
+        separate = [tf.rolling_aggregate("PT3H", function, "value") for function in ["mean", "sum"]]
+
+        assert_frame_equal(result.df, self.join_results(separate), check_column_order=False)
+
+    def test_duplicate_output_columns_raises(self) -> None:
+        """Test that functions producing the same output column raise an error."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+
+        with pytest.raises(AggregationError, match="percentile_value"):
+            tf.aggregate("P1D", [Percentile(p=5), Percentile(p=95)], "value")
+
+    @pytest.mark.parametrize("functions", [[], {}], ids=["list", "dict"])
+    def test_no_functions_raises(self, functions: list[Any] | dict[str, Any]) -> None:
+        """Test that an empty collection of functions raises an error."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+
+        with pytest.raises(AggregationError, match="At least one"):
+            tf.aggregate("P1D", functions, "value")
+
+
+class TestAggregationCascade:
+    @staticmethod
+    def minute_time_series(time_anchor: TimeAnchor = "start") -> TimeFrame:
+        """A 1-minute TimeFrame over 70 days, with some missing values and a day with no data."""
+        length = 60 * 24 * 70
+        df = pl.DataFrame(
+            {
+                "timestamp": pl.datetime_range(
+                    datetime(2025, 1, 1), datetime(2025, 1, 1) + timedelta(minutes=length - 1), "1m", eager=True
+                ),
+                "value": pl.int_range(length, eager=True).cast(pl.Float64) * 0.5 + 1000,
+            }
+        )
+        df = df.with_columns(pl.when(pl.col("value") % 13 != 0).then(pl.col("value")).alias("value"))
+        df = df.filter(pl.col("timestamp").dt.date() != datetime(2025, 1, 20).date())
+        return TimeFrame(df, "timestamp", "PT1M", time_anchor=time_anchor)
+
+    @pytest.mark.parametrize(
+        "aggregation_function",
+        [["mean", "sum", "min", "max", "stdev", "mean_sum"], "percentile"],
+        ids=["partial aggregates", "original data"],
+    )
+    @pytest.mark.parametrize("aggregation_time_anchor", [None, "start", "end"])
+    @pytest.mark.parametrize("time_anchor", ["start", "end"])
+    def test_matches_separate_aggregations(
+        self,
+        time_anchor: TimeAnchor,
+        aggregation_time_anchor: TimeAnchor | None,
+        aggregation_function: str | list[str],
+    ) -> None:
+        """Test that the cascade gives the same results as aggregating into each period separately."""
+        tf = self.minute_time_series(time_anchor)
+        periods = ["P1M", "PT1H", "P1D", "P1D+T9H", "PT6H", "P1M+T9H"]
+        missing_criteria = ("percent", 95)
+
+        results = tf.aggregate_cascade(
+            periods, aggregation_function, "value", missing_criteria, aggregation_time_anchor, p=90
+        )
+
+        assert len(results) == len(periods)
+        for period, result in zip(periods, results):
+            expected = tf.aggregate(
+                period, aggregation_function, "value", missing_criteria, aggregation_time_anchor, p=90
+            )
+            assert_frame_equal(result.df, expected.df, rel_tol=1e-9)
+            assert result.periodicity == expected.periodicity
+            assert result.time_anchor == expected.time_anchor
+
+    def test_coarser_periods_built_from_finer(self) -> None:
+        """Test that each period is built from the partial aggregates of the coarsest period that nests within it."""
+        tf = self.minute_time_series()
+        sources = {}
+
+        def spy(cascade: AggregationCascade, pipeline: StandardAggregationPipeline, source: Any) -> pl.DataFrame:
+            sources[str(pipeline.aggregation_period)] = None if source is None else len(source)
+            return partial_df(cascade, pipeline, source)
+
+        partial_df = AggregationCascade._partial_df
+        with patch.object(AggregationCascade, "_partial_df", autospec=True, side_effect=spy):
+            tf.aggregate_cascade(["P1M", "PT1H", "P1D", "P1D+T9H"], "mean", "value")
+
+        # Data over 70 days (with one day missing) has 1656 hours and 69 days
+        assert sources == {"PT1H": None, "P1D": 1656, "P1D+T9H": 1656, "P1M": 69}
+
+    def test_invalid_period_raises(self) -> None:
+        """Test that an aggregation period that is incompatible with the periodicity raises an error."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+
+        with pytest.raises(AggregationPeriodError):
+            tf.aggregate_cascade(["P1D", "PT30M"], "mean", "value")
+
+
+class TestReaggregate:
+    @staticmethod
+    def hourly_df(start: datetime, end: datetime) -> pl.DataFrame:
+        """An hourly DataFrame between two times, with a different value for every hour."""
+        times = pl.datetime_range(start, end, "1h", eager=True)
+        return pl.DataFrame({"timestamp": times, "value": pl.int_range(len(times), eager=True).cast(pl.Float64)})
+
+    @pytest.mark.parametrize(
+        "aggregation_period,aggregation_function",
+        [("P1D", "mean"), ("P1D+T9H", ["sum", "max"]), ("P1M", "mean_sum"), ("PT6H", "percentile")],
+    )
+    @pytest.mark.parametrize("aggregation_time_anchor", ["start", "end"])
+    @pytest.mark.parametrize("time_anchor", ["start", "end"])
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            (datetime(2024, 2, 1), datetime(2024, 2, 1)),
+            (datetime(2024, 2, 1, 9), datetime(2024, 2, 3, 5)),
+            (datetime(2024, 1, 1), datetime(2024, 1, 1, 3)),
+            (datetime(2024, 3, 31), datetime(2024, 3, 31, 23)),
+        ],
+        ids=["period boundary", "several periods", "first period", "last period"],
+    )
+    def test_matches_full_aggregation(
+        self,
+        changed: tuple[datetime, datetime],
+        time_anchor: TimeAnchor,
+        aggregation_time_anchor: TimeAnchor,
+        aggregation_period: str,
+        aggregation_function: str | list[str],
+    ) -> None:
+        """Test that re-aggregating the changed periods gives the same result as aggregating all of the data."""
+        df = self.hourly_df(datetime(2024, 1, 1), datetime(2024, 3, 31, 23))
+        tf = TimeFrame(df, "timestamp", "PT1H", time_anchor=time_anchor)
+        kwargs = {"missing_criteria": ("percent", 80), "p": 90}
+        previous = tf.aggregate(
+            aggregation_period, aggregation_function, "value", aggregation_time_anchor=aggregation_time_anchor, **kwargs
+        )
+
+        # Edit the data within the changed range, and remove some of the rows
+        start, end = changed
+        changed_df = df.with_columns(
+            pl.when(pl.col("timestamp").is_between(start, end)).then(-1.0).otherwise(pl.col("value")).alias("value")
+        ).filter(~pl.col("timestamp").is_between(start, end) | (pl.col("timestamp").dt.hour() % 4 != 1))
+        changed_tf = TimeFrame(changed_df, "timestamp", "PT1H", time_anchor=time_anchor)
+
+        result = changed_tf.reaggregate(previous, start, end, aggregation_function, "value", **kwargs)
+        expected = changed_tf.aggregate(
+            aggregation_period, aggregation_function, "value", aggregation_time_anchor=aggregation_time_anchor, **kwargs
+        )
+
+        assert_frame_equal(result.df, expected.df)
+        assert result.periodicity == previous.periodicity
+        assert result.time_anchor == previous.time_anchor
+
+    def test_appended_data(self) -> None:
+        """Test that periods after the end of the previous aggregation are added."""
+        tf = TimeFrame(self.hourly_df(datetime(2024, 1, 1), datetime(2024, 1, 10, 11)), "timestamp", "PT1H")
+        previous = tf.aggregate("P1D", "sum", "value")
+
+        new_rows = self.hourly_df(datetime(2024, 1, 10, 12), datetime(2024, 1, 12, 5))
+        tf = tf.append(new_rows)
+        result = tf.reaggregate(previous, datetime(2024, 1, 10, 12), datetime(2024, 1, 12, 5), "sum", "value")
+
+        assert_frame_equal(result.df, tf.aggregate("P1D", "sum", "value").df)
+
+    def test_removed_period(self) -> None:
+        """Test that a period whose rows have all been removed is dropped from the result."""
+        df = self.hourly_df(datetime(2024, 1, 1), datetime(2024, 1, 10, 23))
+        previous = TimeFrame(df, "timestamp", "PT1H").aggregate("P1D", "sum", "value")
+
+        tf = TimeFrame(df.filter(pl.col("timestamp").dt.day() != 5), "timestamp", "PT1H")
+        result = tf.reaggregate(previous, datetime(2024, 1, 5), datetime(2024, 1, 5, 23), "sum", "value")
+
+        assert datetime(2024, 1, 5) not in result.df["timestamp"].to_list()
+        assert_frame_equal(result.df, tf.aggregate("P1D", "sum", "value").df)
+
+    @pytest.mark.parametrize("time_anchor", ["start", "end"])
+    def test_time_zone_aware(self, time_anchor: TimeAnchor) -> None:
+        """Test that the changed periods of a time zone aware series are found in its local time, which is offset
+        from UTC."""
+        df = self.hourly_df(datetime(2024, 6, 1), datetime(2024, 7, 10, 23)).with_columns(
+            pl.col("timestamp").dt.replace_time_zone("Europe/London")
+        )
+        previous = TimeFrame(df, "timestamp", "PT1H", time_anchor=time_anchor).aggregate("P1D", "sum", "value")
+
+        start, end = datetime(2024, 6, 10), datetime(2024, 6, 10, 23)
+        changed_df = df.with_columns(
+            pl.when(pl.col("timestamp").dt.replace_time_zone(None).is_between(start, end))
+            .then(-1.0)
+            .otherwise(pl.col("value"))
+            .alias("value")
+        )
+        tf = TimeFrame(changed_df, "timestamp", "PT1H", time_anchor=time_anchor)
+        result = tf.reaggregate(previous, start, end, "sum", "value")
+
+        assert_frame_equal(result.df, tf.aggregate("P1D", "sum", "value").df)
+
+    def test_only_changed_periods_aggregated(self) -> None:
+        """Test that only the rows of the periods touched by the changed range are aggregated."""
+        df = self.hourly_df(datetime(2024, 1, 1), datetime(2024, 1, 10, 23))
+        tf = TimeFrame(df, "timestamp", "PT1H")
+        previous = tf.aggregate("P1D", "sum", "value")
+
+        with patch.object(StandardAggregationPipeline, "execute", autospec=True) as mock_execute:
+            mock_execute.return_value = previous.df.slice(3, 2)
+            tf.reaggregate(previous, datetime(2024, 1, 4, 6), datetime(2024, 1, 5, 6), "sum", "value")
+
+        pipeline = mock_execute.call_args.args[0]
+        times = pipeline.ctx.df["timestamp"]
+        assert (times.min(), times.max()) == (datetime(2024, 1, 4), datetime(2024, 1, 5, 23))
+
+    def test_end_before_start_raises(self) -> None:
+        """Test that a changed range that ends before it starts raises an error."""
+        tf = TimeFrame(self.hourly_df(datetime(2024, 1, 1), datetime(2024, 1, 10, 23)), "timestamp", "PT1H")
+        previous = tf.aggregate("P1D", "sum", "value")
+
+        with pytest.raises(AggregationError, match="before the start"):
+            tf.reaggregate(previous, datetime(2024, 1, 5), datetime(2024, 1, 4), "sum", "value")
+
+    def test_different_time_column_raises(self) -> None:
+        """Test that a previous aggregation with a different time column raises an error."""
+        tf = TimeFrame(self.hourly_df(datetime(2024, 1, 1), datetime(2024, 1, 10, 23)), "timestamp", "PT1H")
+        previous = tf.aggregate("P1D", "sum", "value").rename_time_column("time")
+
+        with pytest.raises(AggregationError, match="does not match"):
+            tf.reaggregate(previous, datetime(2024, 1, 4), datetime(2024, 1, 5), "sum", "value")
+
+    @pytest.mark.parametrize(
+        "aggregation_function,columns",
+        [("mean", "value"), (["sum", "max"], "value"), ("sum", ["value", "other"])],
+        ids=["different function", "extra function", "extra column"],
+    )
+    def test_mismatched_columns_raise(self, aggregation_function: str | list[str], columns: str | list[str]) -> None:
+        """Test that a previous aggregation made with other functions or columns raises an error up front."""
+        df = self.hourly_df(datetime(2024, 1, 1), datetime(2024, 1, 10, 23)).with_columns(other=pl.col("value") * 2)
+        tf = TimeFrame(df, "timestamp", "PT1H")
+        previous = tf.aggregate("P1D", "sum", "value")
+
+        with patch.object(StandardAggregationPipeline, "execute", autospec=True) as mock_execute:
+            with pytest.raises(AggregationError, match="columns do not match"):
+                tf.reaggregate(previous, datetime(2024, 1, 4), datetime(2024, 1, 5), aggregation_function, columns)
+        mock_execute.assert_not_called()
+
+    def test_reordered_previous_columns(self) -> None:
+        """Test that the columns of the previous aggregation are matched by name rather than by position."""
+        tf = TimeFrame(self.hourly_df(datetime(2024, 1, 1), datetime(2024, 1, 10, 23)), "timestamp", "PT1H")
+        expected = tf.aggregate("P1D", "sum", "value")
+        previous = expected.select(list(reversed(expected.data_columns)))
+
+        result = tf.reaggregate(previous, datetime(2024, 1, 4), datetime(2024, 1, 5), "sum", "value")
+        assert_frame_equal(result.df, expected.df)
+
+    def test_metadata_carried_over(self) -> None:
+        """Test that the metadata of the previous aggregation is carried over to the result."""
+        tf = TimeFrame(self.hourly_df(datetime(2024, 1, 1), datetime(2024, 1, 10, 11)), "timestamp", "PT1H")
+        previous = tf.aggregate("P1D", "sum", "value")
+        previous.metadata = {"site": "A"}
+        previous.column_metadata = {"sum_value": {"units": "mm"}}
+
+        tf = tf.append(self.hourly_df(datetime(2024, 1, 10, 12), datetime(2024, 1, 12, 5)))
+        result = tf.reaggregate(previous, datetime(2024, 1, 10, 12), datetime(2024, 1, 12, 5), "sum", "value")
+
+        assert result.metadata == {"site": "A"}
+        assert result.column_metadata["sum_value"] == {"units": "mm"}
+        assert result.df["timestamp"].to_list()[-2:] == [datetime(2024, 1, 11), datetime(2024, 1, 12)]
+
+
+class TestChunkedAggregation:
+    @staticmethod
+    def chunks(df: pl.DataFrame, chunk_size: int) -> Iterator[pl.DataFrame]:
+        """Split a DataFrame into chunks of a given number of rows."""
+        return (df.slice(i, chunk_size) for i in range(0, len(df), chunk_size))
+
+    @pytest.mark.parametrize("chunk_size", [5, 24, 100, 10_000])
+    @pytest.mark.parametrize(
+        "resolution,aggregation_period,aggregation_function,kwargs",
+        [
+            ("PT1H", "P1D", "mean", {}),
+            ("PT1H", "P1D+T9H", "mean_sum", {}),
+            ("PT1H", "P1M", "max", {}),
+            ("PT1H", "PT6H", "percentile", {"p": 90}),
+            ("P1D", "P1M", "sum", {}),
+        ],
+    )
+    @pytest.mark.parametrize("time_anchor", ["start", "end"])
+    def test_matches_eager_aggregation(
+        self,
+        resolution: str,
+        aggregation_period: str,
+        aggregation_function: str,
+        kwargs: dict[str, Any],
+        time_anchor: TimeAnchor,
+        chunk_size: int,
+    ) -> None:
+        """Test that aggregating chunks gives the same result as aggregating the whole TimeFrame, wherever the chunks
+        are cut relative to the aggregation periods."""
+        tf = generate_time_series(
+            Period.of_iso_duration(resolution), Period.of_iso_duration(resolution), 1000, None, True
+        )
+        tf = TimeFrame(tf.df, "timestamp", resolution, time_anchor=time_anchor)
+        missing_criteria = ("percent", 90)
+
+        expected = tf.aggregate(aggregation_period, aggregation_function, "value", missing_criteria, **kwargs)
+        actual = TimeFrame.aggregate_chunked(
+            self.chunks(tf.df, chunk_size),
+            "timestamp",
+            aggregation_period,
+            aggregation_function,
+            "value",
+            resolution=resolution,
+            time_anchor=time_anchor,
+            missing_criteria=missing_criteria,
+            **kwargs,
+        )
+
+        assert actual == expected
+
+    def test_lazy_frame_source(self) -> None:
+        """Test that a LazyFrame source is read in batches and gives the same result as the eager aggregation."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 1000, missing_data=True)
+
+        expected = tf.aggregate("P1D", "mean", ["value", "value_plus1"])
+        actual = TimeFrame.aggregate_chunked(
+            tf.df.lazy(), "timestamp", "P1D", "mean", ["value", "value_plus1"], resolution="PT1H"
+        )
+
+        assert actual == expected
+
+    def test_time_window(self) -> None:
+        """Test that a time window is applied to each chunk in the same way as the eager aggregation."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 1000)
+        time_window = TimeWindow(time(9, 0), time(17, 0))
+
+        expected = tf.aggregate("P1D", "sum", "value", time_window=time_window)
+        actual = TimeFrame.aggregate_chunked(
+            self.chunks(tf.df, 50), "timestamp", "P1D", "sum", "value", resolution="PT1H", time_window=time_window
+        )
+
+        assert actual == expected
+
+    @pytest.mark.parametrize("chunk_size", [5, 100])
+    @pytest.mark.parametrize("time_anchor", ["start", "end"])
+    @pytest.mark.parametrize("time_zone", [None, "UTC", "Europe/London"])
+    def test_time_zone(self, time_zone: str | None, time_anchor: TimeAnchor, chunk_size: int) -> None:
+        """Test that chunks are cut at the aggregation periods in the local time of the time column, including a time
+        zone that is offset from UTC."""
+        times = pl.datetime_range(datetime(2024, 6, 1), datetime(2024, 6, 20, 23), "1h", eager=True)
+        df = pl.DataFrame({"timestamp": times.dt.replace_time_zone(time_zone), "value": range(len(times))})
+        tf = TimeFrame(df, "timestamp", "PT1H", time_anchor=time_anchor)
+
+        actual = TimeFrame.aggregate_chunked(
+            self.chunks(df, chunk_size), "timestamp", "P1D", "sum", "value", resolution="PT1H", time_anchor=time_anchor
+        )
+
+        assert actual == tf.aggregate("P1D", "sum", "value")
+
+    def test_pipeline_yields_complete_periods(self) -> None:
+        """Test that the pipeline only yields aggregation periods once all of their rows have been seen."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 72)
+        ctx = AggregationCtx(tf.df, "timestamp", "start", tf.periodicity)
+        pipeline = StandardAggregationPipeline(Sum(), ctx, Period.of_days(1), "value")
+
+        results = list(pipeline.execute_chunked(self.chunks(tf.df, 30)))
+
+        # Chunks end within the 2nd, 3rd and 3rd days, with the 3rd day only aggregated once the source is exhausted
+        assert [result["timestamp"].to_list() for result in results] == [
+            [datetime(2025, 1, 1)],
+            [datetime(2025, 1, 2)],
+            [datetime(2025, 1, 3)],
+        ]
+        assert [result["count_value"].to_list() for result in results] == [[24], [24], [24]]
+
+    def test_empty_chunks_skipped(self) -> None:
+        """Test that empty chunks, including a leading one, do not affect the result."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+        empty = tf.df.head(0)
+        chunks = [empty, tf.df.slice(0, 30), empty, tf.df.slice(30, 18), empty]
+
+        actual = TimeFrame.aggregate_chunked(chunks, "timestamp", "P1D", "mean", "value", resolution="PT1H")
+
+        assert actual == tf.aggregate("P1D", "mean", "value")
+
+    def test_chunks_out_of_order_raises(self) -> None:
+        """Test that chunks that are not in time order raise an error."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+        chunks = [tf.df.slice(24, 24), tf.df.slice(0, 24)]
+
+        with pytest.raises(AggregationError, match="time order"):
+            TimeFrame.aggregate_chunked(chunks, "timestamp", "P1D", "mean", "value", resolution="PT1H")
+
+    def test_misaligned_chunk_raises(self) -> None:
+        """Test that each chunk is validated against the time properties of the source."""
+        tf = generate_time_series(Period.of_hours(1), Period.of_hours(1), 48)
+
+        with pytest.raises(ResolutionError):
+            TimeFrame.aggregate_chunked(self.chunks(tf.df, 10), "timestamp", "P1D", "mean", "value", resolution="P1D")
+
+    @pytest.mark.parametrize("chunks", [[], [pl.DataFrame({"timestamp": [], "value": []})]], ids=["none", "empty"])
+    def test_empty_source_raises(self, chunks: list[pl.DataFrame]) -> None:
+        """Test that a source without any rows raises an error."""
+        with pytest.raises(AggregationError, match="empty"):
+            TimeFrame.aggregate_chunked(chunks, "timestamp", "P1D", "mean", "value", resolution="PT1H")
+
+
 class TestRollingAggregation:
     @pytest.mark.parametrize(
         "aggregator, expected_values, timestamps_of, kwargs",
@@ -1,6 +1,7 @@
 import re
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Any
+from unittest.mock import patch
 
 import polars as pl
 import pytest
@@ -9,16 +10,27 @@ from polars.testing import assert_frame_equal, assert_frame_not_equal, assert_se
 from time_stream.aggregation import Percentile
 from time_stream.base import TimeFrame
 from time_stream.exceptions import (
+    AggregationPeriodError,
     BitwiseFlagUnknownError,
     CategoricalFlagUnknownError,
     ColumnNotFoundError,
     DuplicateColumnError,
+    DuplicateTimeError,
     FlagSystemNotFoundError,
+    InfillError,
     MetadataError,
+    PeriodicityError,
+    QcError,
+    ResolutionError,
+    TimeMutatedError,
+    TimeOrderError,
 )
-from time_stream.flags.flag_manager import BitwiseFlagColumn
-from time_stream.flags.flag_system import FlagSystemBase
+from time_stream.flags.flag_manager import BitwiseFlagColumn, FlagStorageLiteral, FlagUpdateSpec
+from time_stream.flags.flag_system import FlagSystemBase, FlagSystemLiteral
 from time_stream.period import Period
+from time_stream.time_manager import TimeManager
+from time_stream.types import TimeAnchor
+from time_stream.utils import gap_index, pad_time
 
 
 class TestSortTime:
@@ -40,6 +52,15 @@ class TestSortTime:
         tf.sort_time()
         assert_series_equal(tf.df["time"], expected)
 
+    def test_sorted_times_not_resorted(self) -> None:
+        """Test that a TimeFrame built from times in order is not sorted, but its time column is flagged as sorted"""
+        df = pl.DataFrame({"time": [datetime(2024, 1, 1, h) for h in range(5)], "value": range(5)})
+        with patch.object(pl.DataFrame, "sort") as mock_sort:
+            tf = TimeFrame(df, time_name="time")
+            tf.sort_time()
+        mock_sort.assert_not_called()
+        assert tf.df["time"].flags["SORTED_ASC"]
+
     def test_sort_times(self) -> None:
         """Test that times are sorted appropriately"""
         times = [
@@ -360,6 +381,258 @@ class TestMetadata:
         assert self.tf.metadata == {}
 
 
+class TestCopy:
+    @staticmethod
+    def setup_tf() -> TimeFrame:
+        """Set up a TimeFrame with metadata and a flag column."""
+        df = pl.DataFrame({"time": [datetime(2024, 1, i) for i in range(1, 4)], "value": [1, 2, 3], "flags": 0})
+        tf = TimeFrame(df, time_name="time").with_metadata({"site": {"id": 1}})
+        tf.column_metadata["value"]["units"] = "mm"
+        tf.register_flag_system("qc", {"FLAG_A": 1, "FLAG_B": 2})
+        tf.register_flag_column("flags", "qc")
+        return tf
+
+    def test_copy_is_equal(self) -> None:
+        """Test that the copy is equal to the original, but a different object."""
+        tf = self.setup_tf()
+        tf_copy = tf.copy()
+        assert tf_copy == tf
+        assert tf_copy is not tf
+
+    def test_copy_does_not_revalidate(self) -> None:
+        """Test that the already validated time values are not validated again when copying."""
+        tf = self.setup_tf()
+        with patch.object(TimeManager, "validate") as mock_validate:
+            tf.copy()
+        mock_validate.assert_not_called()
+
+    def test_copy_shares_flag_systems(self) -> None:
+        """Test that the (immutable) flag systems are shared with the copy."""
+        tf = self.setup_tf()
+        tf_copy = tf.copy()
+        assert tf_copy.get_flag_system("qc") is tf.get_flag_system("qc")
+
+    def test_copy_flag_columns_independent(self) -> None:
+        """Test that flag column state in the copy is independent of the original."""
+        tf = self.setup_tf()
+        tf_copy = tf.copy()
+        tf_copy.get_flag_column("flags").is_decoded = True
+        assert not tf.get_flag_column("flags").is_decoded
+
+    def test_copy_metadata_independent(self) -> None:
+        """Test that changing the metadata of the copy does not change the original."""
+        tf = self.setup_tf()
+        tf_copy = tf.copy()
+        tf_copy.metadata["site"]["id"] = 2
+        tf_copy.column_metadata["value"]["units"] = "m"
+
+        assert tf.metadata == {"site": {"id": 1}}
+        assert tf.column_metadata["value"] == {"units": "mm"}
+
+    def test_original_metadata_independent(self) -> None:
+        """Test that changing the metadata of the original does not change the copy."""
+        tf = self.setup_tf()
+        tf_copy = tf.copy()
+        tf.metadata["site"]["id"] = 2
+        tf.column_metadata["value"]["units"] = "m"
+
+        assert tf_copy.metadata == {"site": {"id": 1}}
+        assert tf_copy.column_metadata["value"] == {"units": "mm"}
+
+    def test_chained_copies_metadata_independent(self) -> None:
+        """Test that metadata stays independent across a chain of copies."""
+        tf = self.setup_tf()
+        tf_copy = tf.copy().copy().copy()
+        del tf_copy.metadata
+        assert tf.metadata == {"site": {"id": 1}}
+
+
+class TestWithDf:
+    df = pl.DataFrame({"time": [datetime(2024, 1, i) for i in range(1, 4)], "value": [1, 2, 3]})
+
+    def test_with_df_checks_time_integrity(self) -> None:
+        """Test that changing the time values in the new DataFrame raises an error."""
+        tf = TimeFrame(self.df, time_name="time")
+        with pytest.raises(TimeMutatedError):
+            tf.with_df(self.df.with_columns(pl.col("time") + timedelta(days=1)))
+
+    def test_with_df_trust_time_skips_check(self) -> None:
+        """Test that the time integrity check is skipped when the caller trusts the time values."""
+        tf = TimeFrame(self.df, time_name="time")
+        with patch.object(TimeManager, "_check_time_integrity") as mock_check:
+            result = tf.with_df(self.df.with_columns(value=pl.col("value") * 2), trust_time=True)
+        mock_check.assert_not_called()
+        assert_series_equal(result.df["value"], pl.Series("value", [2, 4, 6]))
+
+
+class TestAppend:
+    """Tests for TimeFrame.append()."""
+
+    @staticmethod
+    def setup_tf(**kwargs: Any) -> TimeFrame:
+        """Set up an hourly TimeFrame with a bitwise flag column."""
+        df = pl.DataFrame(
+            {
+                "time": [datetime(2024, 1, 1, hour) for hour in range(4)],
+                "value": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+        tf = TimeFrame(df, "time", "PT1H", periodicity="PT1H", **kwargs)
+        tf.register_flag_system("QC", {"A": 1, "B": 2})
+        tf.init_flag_column("QC", "qc_flags")
+        tf.add_flag("qc_flags", "A", pl.col("value") > 3)
+        return tf
+
+    def test_matches_construction(self) -> None:
+        """Test that appending rows gives the same data as building the TimeFrame from all of the rows."""
+        tf = self.setup_tf()
+        new_rows = pl.DataFrame({"time": [datetime(2024, 1, 1, 4), datetime(2024, 1, 1, 5)], "value": [5.0, 6.0]})
+        result = tf.append(new_rows)
+
+        expected = pl.DataFrame(
+            {
+                "time": [datetime(2024, 1, 1, hour) for hour in range(6)],
+                "value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "qc_flags": [0, 0, 0, 1, 0, 0],
+            }
+        )
+        assert_frame_equal(result.df, expected)
+        assert result.df["time"].flags["SORTED_ASC"]
+        assert result.flag_columns == tf.flag_columns
+
+    def test_original_not_modified(self) -> None:
+        """Test that the original TimeFrame is left unchanged."""
+        tf = self.setup_tf()
+        original = tf.df.clone()
+        tf.append(pl.DataFrame({"time": [datetime(2024, 1, 1, 4)], "value": [5.0]}))
+        assert_frame_equal(tf.df, original)
+
+    def test_new_chunk(self) -> None:
+        """Test that the new rows are added as a new chunk, rather than copying the existing data."""
+        tf = self.setup_tf().with_df(self.setup_tf().df.rechunk(), trust_time=True)
+        result = tf.append(pl.DataFrame({"time": [datetime(2024, 1, 1, 4)], "value": [5.0]}))
+        # The existing rows up to the last one are kept as they are, in their own chunk
+        assert result.df.n_chunks() == 3
+        assert result.df.head(3).n_chunks() == 1
+
+    def test_empty_new_rows(self) -> None:
+        """Test that appending no rows returns a copy of the TimeFrame."""
+        tf = self.setup_tf()
+        result = tf.append(pl.DataFrame({"time": [], "value": []}, schema={"time": pl.Datetime, "value": pl.Float64}))
+        assert result is not tf
+        assert_frame_equal(result.df, tf.df)
+
+    def test_empty_timeframe(self) -> None:
+        """Test that rows can be appended to an empty TimeFrame."""
+        tf = self.setup_tf()
+        tf = tf.with_df(tf.df.head(0), trust_time=True)
+        result = tf.append(pl.DataFrame({"time": [datetime(2024, 1, 1, 4)], "value": [5.0]}))
+        expected = pl.DataFrame({"time": [datetime(2024, 1, 1, 4)], "value": [5.0], "qc_flags": [0]})
+        assert_frame_equal(result.df, expected)
+
+    @pytest.mark.parametrize(
+        "on_duplicates,expected_value,expected_flag",
+        [
+            ("keep_first", 4.0, 1),
+            ("keep_last", 40.0, 0),
+            ("drop", None, None),
+        ],
+    )
+    def test_boundary_duplicate(
+        self, on_duplicates: Any, expected_value: float | None, expected_flag: int | None
+    ) -> None:
+        """Test that a new row at the same time as the last existing row is handled as a duplicate."""
+        tf = self.setup_tf()
+        new_rows = pl.DataFrame({"time": [datetime(2024, 1, 1, 3), datetime(2024, 1, 1, 4)], "value": [40.0, 5.0]})
+        result = tf.append(new_rows, on_duplicates=on_duplicates)
+
+        expected = pl.DataFrame(
+            {
+                "time": [datetime(2024, 1, 1, hour) for hour in range(5)],
+                "value": [1.0, 2.0, 3.0, expected_value, 5.0],
+                "qc_flags": [0, 0, 0, expected_flag, 0],
+            }
+        )
+        if on_duplicates == "drop":
+            expected = expected.filter(pl.col("time") != datetime(2024, 1, 1, 3))
+        assert_frame_equal(result.df, expected)
+
+    def test_boundary_duplicate_error(self) -> None:
+        """Test that a boundary duplicate raises an error with the default duplicate handling."""
+        tf = self.setup_tf()
+        with pytest.raises(DuplicateTimeError):
+            tf.append(pl.DataFrame({"time": [datetime(2024, 1, 1, 3)], "value": [40.0]}))
+
+    def test_default_duplicate_option(self) -> None:
+        """Test that the duplicate handling the TimeFrame was created with is used by default."""
+        tf = self.setup_tf(on_duplicates="keep_last")
+        result = tf.append(pl.DataFrame({"time": [datetime(2024, 1, 1, 3)], "value": [40.0]}))
+        assert result.df["value"].to_list() == [1.0, 2.0, 3.0, 40.0]
+
+    def test_earlier_time_raises(self) -> None:
+        """Test that new rows earlier than the last existing time raise an error."""
+        tf = self.setup_tf()
+        with pytest.raises(TimeOrderError):
+            tf.append(pl.DataFrame({"time": [datetime(2024, 1, 1, 2), datetime(2024, 1, 1, 5)], "value": [0.0, 6.0]}))
+
+    def test_unsorted_new_rows(self) -> None:
+        """Test that the new rows do not need to be in time order."""
+        tf = self.setup_tf()
+        new_rows = pl.DataFrame({"time": [datetime(2024, 1, 1, 5), datetime(2024, 1, 1, 4)], "value": [6.0, 5.0]})
+        result = tf.append(new_rows)
+        assert result.df["value"].to_list() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+    def test_misaligned_rows(self) -> None:
+        """Test that misaligned new rows are validated, or removed if requested."""
+        tf = self.setup_tf()
+        new_rows = pl.DataFrame({"time": [datetime(2024, 1, 1, 4, 30), datetime(2024, 1, 1, 5)], "value": [0.0, 6.0]})
+        with pytest.raises(ResolutionError):
+            tf.append(new_rows)
+
+        result = tf.append(new_rows, on_misaligned_rows="resolve")
+        assert result.df["time"].to_list()[-1] == datetime(2024, 1, 1, 5)
+        assert result.df.height == 5
+
+    def test_periodicity_across_boundary(self) -> None:
+        """Test that the periodicity is checked together with the last existing row."""
+        df = pl.DataFrame({"time": [datetime(2024, 1, day) for day in range(1, 4)], "value": [1.0, 2.0, 3.0]})
+        tf = TimeFrame(df, "time", "PT1H", periodicity="P1D")
+        new_rows = pl.DataFrame({"time": [datetime(2024, 1, 3, 12)], "value": [4.0]})
+        with pytest.raises(PeriodicityError):
+            tf.append(new_rows)
+
+    def test_missing_columns(self) -> None:
+        """Test that missing columns are filled with nulls, and missing flag columns with no flags."""
+        tf = self.setup_tf()
+        tf.init_flag_column("QC", "decoded_flags")
+        tf = tf.decode_flag_column("decoded_flags")
+        result = tf.append(pl.DataFrame({"time": [datetime(2024, 1, 1, 4)]}))
+
+        assert result.df.schema == tf.df.schema
+        last_row = result.df.row(-1, named=True)
+        assert last_row == {"time": datetime(2024, 1, 1, 4), "value": None, "qc_flags": 0, "decoded_flags": []}
+
+    def test_columns_cast(self) -> None:
+        """Test that new columns are cast to the dtypes of the TimeFrame."""
+        tf = self.setup_tf()
+        result = tf.append(pl.DataFrame({"time": [datetime(2024, 1, 1, 4)], "value": [5]}))
+        assert result.df.schema == tf.df.schema
+
+    @pytest.mark.parametrize(
+        "new_rows",
+        [
+            pl.DataFrame({"value": [5.0]}),
+            pl.DataFrame({"time": [datetime(2024, 1, 1, 4)], "other": [5.0]}),
+        ],
+        ids=["missing time column", "unknown column"],
+    )
+    def test_bad_columns(self, new_rows: pl.DataFrame) -> None:
+        """Test that an error is raised if the new rows are missing the time column or have unknown columns."""
+        tf = self.setup_tf()
+        with pytest.raises(ColumnNotFoundError):
+            tf.append(new_rows)
+
+
 class TestInitFlagColumn:
     @staticmethod
     def setup_tf() -> tuple[TimeFrame, type[FlagSystemBase]]:
@@ -793,6 +1066,42 @@ class TestAggregate:
 
         assert_frame_equal(aggregated_tf.df, expected_df, check_dtypes=False)
 
+    @pytest.mark.parametrize("aggregation_period", ["P1D", "P1M", "P1D+T9H", "PT6H"])
+    @pytest.mark.parametrize("time_anchor", ["start", "end"])
+    def test_aggregate_result_is_valid(self, aggregation_period: str, time_anchor: TimeAnchor) -> None:
+        """Test that the aggregation result, which skips constructor validation, passes that validation."""
+        period = Period.of_hours(1)
+        df = pl.DataFrame(
+            {
+                "timestamp": [datetime(2025, 1, 1) + timedelta(hours=i) for i in range(24 * 70)],
+                "value": list(range(24 * 70)),
+            }
+        )
+        tf = TimeFrame(df=df, time_name="timestamp", resolution=period, periodicity=period, time_anchor=time_anchor)
+
+        aggregated_tf = tf.aggregate(aggregation_period, "mean", "value")
+
+        expected = TimeFrame(
+            aggregated_tf.df,
+            time_name="timestamp",
+            resolution=aggregated_tf.resolution,
+            offset=aggregated_tf.offset,
+            periodicity=aggregated_tf.periodicity,
+            time_anchor=aggregated_tf.time_anchor,
+        )
+        assert aggregated_tf == expected
+
+    def test_aggregate_skips_validation(self) -> None:
+        """Test that the aggregation result is not re-validated."""
+        period = Period.of_hours(1)
+        df = pl.DataFrame({"timestamp": [datetime(2025, 1, 1) + timedelta(hours=i) for i in range(48)], "value": 1})
+        tf = TimeFrame(df=df, time_name="timestamp", resolution=period, periodicity=period)
+
+        with patch.object(TimeManager, "validate") as mock_validate:
+            tf.aggregate("P1D", "mean", "value")
+            tf.rolling_aggregate("PT3H", "mean", "value")
+        mock_validate.assert_not_called()
+
 
 class TestCalculateMinMaxEnvelope:
     def test_calculate_min_max_envelope(self) -> None:
@@ -1095,6 +1404,434 @@ class TestQCCheckWithFlagParams:
         assert_series_equal(result.df["flag_col"], expected)
 
 
+class TestQCSuite:
+    """Tests for TimeFrame.qc_suite()."""
+
+    CHECKS = [
+        ("range", "value", {"min_value": 0.0, "max_value": 10.0, "within": False}, ("flag_col", "FLAG_A"), None),
+        ("spike", "value", {"threshold": 8.0}, ("flag_col", "FLAG_B"), None),
+        ("flat_line", "value", {"min_count": 3}, ("flag_col", "FLAG_C"), None),
+        ("comparison", "other", {"compare_to": 0, "operator": "<"}, ("other_flag", "FLAG_A"), None),
+        ("comparison", "other", {"compare_to": 2, "operator": ">"}, ("flag_col", "FLAG_C"), None),
+    ]
+
+    @staticmethod
+    def setup_tf(flag_type: FlagSystemLiteral = "bitwise") -> TimeFrame:
+        """Set up a TimeFrame with two flag columns of the given flag type."""
+        df = pl.DataFrame(
+            {
+                "time": [datetime(2024, 1, i) for i in range(1, 11)],
+                "value": [5.0, 15.0, 3.0, 3.0, 3.0, 20.0, 8.0, 1.0, None, 2.0],
+                "other": [1, -1, 2, 3, 0, -5, 1, 4, 1, 2],
+            }
+        )
+        tf = TimeFrame(df=df, time_name="time")
+        tf.register_flag_system("flags", {"FLAG_A": 1, "FLAG_B": 2, "FLAG_C": 4}, flag_type=flag_type)
+        tf.init_flag_column("flags", "flag_col")
+        tf.init_flag_column("flags", "other_flag")
+        return tf
+
+    @staticmethod
+    def sequential(tf: TimeFrame, checks: list) -> TimeFrame:
+        """Apply the checks one at a time with qc_check."""
+        for check, column, kwargs, flag_params, observation_interval in checks:
+            tf = tf.qc_check(check, column, observation_interval, flag_params=flag_params, **kwargs)
+        return tf
+
+    @pytest.mark.parametrize("flag_type", ["bitwise", "categorical", "categorical_list"])
+    def test_matches_sequential_qc_checks(self, flag_type: FlagSystemLiteral) -> None:
+        """The suite gives the same result as applying each check in turn."""
+        tf = self.setup_tf(flag_type)
+        result = tf.qc_suite(self.CHECKS)
+        assert_frame_equal(result.df, self.sequential(tf, self.CHECKS).df)
+
+    def test_bitwise_flags_combined(self) -> None:
+        """Flags from several checks on the same bitwise column are OR-ed together."""
+        result = self.setup_tf().qc_suite(self.CHECKS)
+        expected = pl.Series("flag_col", [0, 3, 4, 4, 4, 3, 0, 4, 0, 0], dtype=pl.Int64)
+        assert_series_equal(result.df["flag_col"], expected)
+
+    def test_observation_interval(self) -> None:
+        """Checks are limited to their observation interval."""
+        tf = self.setup_tf()
+        checks = [
+            ("range", "value", {"min_value": 0.0, "max_value": 10.0, "within": False}, ("flag_col", "FLAG_A"), None),
+            (
+                "range",
+                "value",
+                {"min_value": 0.0, "max_value": 4.0},
+                ("flag_col", "FLAG_B"),
+                (datetime(2024, 1, 5), None),
+            ),
+        ]
+        result = tf.qc_suite(checks)
+        assert_frame_equal(result.df, self.sequential(tf, checks).df)
+
+    def test_decoded_flag_column(self) -> None:
+        """Decoded flag columns are updated and left in decoded form."""
+        tf = self.setup_tf().decode_flag_column("flag_col")
+        result = tf.qc_suite(self.CHECKS)
+        assert result.get_flag_column("flag_col").is_decoded
+        assert_frame_equal(result.df, self.sequential(tf, self.CHECKS).df)
+
+    def test_single_with_columns(self) -> None:
+        """The checks and the flag updates of all the flag columns are evaluated in a single with_columns call."""
+        tf = self.setup_tf()
+        with patch.object(pl.LazyFrame, "with_columns", autospec=True, side_effect=pl.LazyFrame.with_columns) as mock:
+            tf.qc_suite(self.CHECKS)
+        assert mock.call_count == 1
+
+    def test_original_tf_not_modified(self) -> None:
+        """The suite does not modify the original TimeFrame."""
+        tf = self.setup_tf()
+        original = tf.df.clone()
+        tf.qc_suite(self.CHECKS)
+        assert_frame_equal(tf.df, original)
+
+    @pytest.mark.parametrize(
+        "checks",
+        [
+            [],
+            [("range", "value", {"min_value": 0.0, "max_value": 10.0}, None, None)],
+            [("range", "value", {"min_value": 0.0, "max_value": 10.0}, ("flag_col", "FLAG_A"))],
+        ],
+        ids=["empty", "no_flag_params", "short_spec"],
+    )
+    def test_invalid_checks_raise(self, checks: list) -> None:
+        """An empty suite or a malformed check specification raises QcError."""
+        with pytest.raises(QcError):
+            self.setup_tf().qc_suite(checks)
+
+    def test_unregistered_flag_column_raises(self) -> None:
+        """An unregistered flag column name raises ColumnNotFoundError."""
+        with pytest.raises(ColumnNotFoundError):
+            self.setup_tf().qc_suite([("spike", "value", {"threshold": 8.0}, ("nonexistent_col", "FLAG_A"), None)])
+
+
+class TestFlagMany:
+    """Tests for TimeFrame.flag_many()."""
+
+    UPDATES: list[FlagUpdateSpec] = [
+        ("flag_col", "FLAG_A", pl.col("value") > 10, "add"),
+        ("flag_col", "FLAG_B", pl.col("value") < 4, "add"),
+        ("other_flag", "FLAG_C", pl.col("other") < 0, "add"),
+        ("flag_col", "FLAG_A", pl.col("value") > 18, "remove"),
+        ("flag_col", "FLAG_C", pl.col("value").is_null(), "add"),
+        ("other_flag", "FLAG_C", pl.col("other") < -1, "remove"),
+        ("flag_col", "FLAG_B", pl.col("value") == 1, "remove"),
+    ]
+
+    #: Updates that remove and re-add the same flags, so that the result depends on the order of the updates.
+    ORDERED_UPDATES: list[FlagUpdateSpec] = [
+        ("flag_col", "FLAG_B", pl.col("value") > 4, "add"),
+        ("flag_col", "FLAG_A", pl.col("value") < 10, "add"),
+        ("flag_col", "FLAG_B", pl.col("value") > 10, "remove"),
+        ("flag_col", "FLAG_C", pl.col("other") > 1, "add"),
+        ("flag_col", "FLAG_B", pl.col("value") > 18, "add"),
+        ("flag_col", "FLAG_A", pl.col("other") < 2, "remove"),
+        ("flag_col", "FLAG_A", pl.col("other") == 1, "add"),
+    ]
+
+    @staticmethod
+    def setup_tf(flag_type: FlagSystemLiteral = "bitwise", storage: FlagStorageLiteral = "values") -> TimeFrame:
+        """Set up a TimeFrame with two flag columns of the given flag type and storage."""
+        df = pl.DataFrame(
+            {
+                "time": [datetime(2024, 1, i) for i in range(1, 11)],
+                "value": [5.0, 15.0, 3.0, 3.0, 3.0, 20.0, 8.0, 1.0, None, 2.0],
+                "other": [1, -1, 2, 3, 0, -5, 1, 4, 1, 2],
+            }
+        )
+        tf = TimeFrame(df=df, time_name="time")
+        tf.register_flag_system("flags", {"FLAG_A": 1, "FLAG_B": 2, "FLAG_C": 4}, flag_type=flag_type)
+        tf.init_flag_column("flags", "flag_col", storage=storage)
+        tf.init_flag_column("flags", "other_flag", storage=storage)
+        return tf
+
+    @staticmethod
+    def sequential(tf: TimeFrame, updates: list) -> None:
+        """Apply the updates one at a time with add_flag and remove_flag."""
+        for flag_column_name, flag_value, expr, action in updates:
+            if action == "add":
+                tf.add_flag(flag_column_name, flag_value, expr)
+            else:
+                tf.remove_flag(flag_column_name, flag_value, expr)
+
+    @pytest.mark.parametrize("flag_type", ["bitwise", "categorical", "categorical_list"])
+    def test_matches_sequential_updates(self, flag_type: FlagSystemLiteral) -> None:
+        """Batched flag updates give the same result as adding and removing each flag in turn."""
+        result = self.setup_tf(flag_type)
+        result.flag_many(self.UPDATES)
+        expected = self.setup_tf(flag_type)
+        self.sequential(expected, self.UPDATES)
+        assert_frame_equal(result.df, expected.df)
+
+    @pytest.mark.parametrize(
+        "flag_type,storage",
+        [
+            ("bitwise", "values"),
+            ("categorical", "values"),
+            ("categorical", "enum"),
+            ("categorical_list", "values"),
+            ("categorical_list", "enum"),
+            ("categorical_list", "bitset"),
+        ],
+    )
+    def test_order_sensitive_updates(self, flag_type: FlagSystemLiteral, storage: FlagStorageLiteral) -> None:
+        """Removing and re-adding the same flags gives the same result as applying each update in turn."""
+        result = self.setup_tf(flag_type, storage)
+        result.flag_many(self.ORDERED_UPDATES)
+        expected = self.setup_tf(flag_type, storage)
+        self.sequential(expected, self.ORDERED_UPDATES)
+        assert_frame_equal(result.df, expected.df)
+
+    def test_list_flags_appended_in_update_order(self) -> None:
+        """Flags are appended to categorical lists in the order of the adds that appended them."""
+        tf = self.setup_tf("categorical_list")
+        tf.flag_many(self.ORDERED_UPDATES)
+        assert tf.df["flag_col"].to_list() == [[2, 1], [], [1, 4], [1, 4], [], [2], [2, 1], [1, 4], [1], [1, 4]]
+
+    def test_single_with_columns(self) -> None:
+        """All the updates of all the flag columns are applied in a single with_columns call."""
+        tf = self.setup_tf()
+        with patch.object(pl.LazyFrame, "with_columns", autospec=True, side_effect=pl.LazyFrame.with_columns) as mock:
+            tf.flag_many(self.UPDATES)
+        assert mock.call_count == 1
+
+    def test_expressions_see_data_before_batch(self) -> None:
+        """Expressions that read an updated flag column see its values from before the batch, not the updates made
+        to it earlier in the batch."""
+        updates: list[FlagUpdateSpec] = [
+            ("flag_col", "FLAG_A", pl.col("value") > 10, "add"),
+            ("flag_col", "FLAG_B", (pl.col("flag_col") & 1) > 0, "add"),
+            ("other_flag", "FLAG_C", (pl.col("flag_col") & 1) > 0, "add"),
+        ]
+        tf = self.setup_tf()
+        tf.flag_many(updates)
+        assert tf.df["flag_col"].to_list() == [0, 1, 0, 0, 0, 1, 0, 0, 0, 0]
+        assert tf.df["other_flag"].to_list() == [0] * 10
+
+        expected = self.setup_tf()
+        self.sequential(expected, updates)
+        assert expected.df["flag_col"].to_list() == [0, 3, 0, 0, 0, 3, 0, 0, 0, 0]
+
+    def test_bitwise_flags(self) -> None:
+        """Adds are OR-ed into, and removals cleared from, the bitwise flag columns in order."""
+        tf = self.setup_tf()
+        tf.flag_many(self.UPDATES)
+        assert_series_equal(tf.df["flag_col"], pl.Series("flag_col", [0, 1, 2, 2, 2, 0, 0, 0, 4, 2], dtype=pl.Int64))
+        assert_series_equal(
+            tf.df["other_flag"], pl.Series("other_flag", [0, 4, 0, 0, 0, 0, 0, 0, 0, 0], dtype=pl.Int64)
+        )
+
+    def test_decoded_flag_column(self) -> None:
+        """Decoded flag columns are updated, and left in decoded form, with a single encode and decode."""
+        tf = self.setup_tf().decode_flag_column("flag_col")
+        flag_column = tf.get_flag_column("flag_col")
+        with (
+            patch.object(BitwiseFlagColumn, "encode", wraps=flag_column.encode) as mock_encode,
+            patch.object(BitwiseFlagColumn, "decode", wraps=flag_column.decode) as mock_decode,
+        ):
+            tf.flag_many(self.UPDATES)
+        assert mock_encode.call_count == 1
+        assert mock_decode.call_count == 1
+
+        expected = self.setup_tf()
+        self.sequential(expected, self.UPDATES)
+        assert_frame_equal(tf.df, expected.decode_flag_column("flag_col").df)
+
+    def test_empty_updates(self) -> None:
+        """No updates leaves the data unchanged."""
+        tf = self.setup_tf()
+        df = tf.df
+        tf.flag_many([])
+        assert tf.df is df
+
+    @pytest.mark.parametrize(
+        "updates",
+        [
+            [("flag_col", "FLAG_A", pl.lit(True))],
+            [("flag_col", "FLAG_A", pl.lit(True), "toggle")],
+        ],
+        ids=["missing action", "unknown action"],
+    )
+    def test_invalid_updates_raise(self, updates: list) -> None:
+        """Malformed updates raise ValueError, without changing the flag columns."""
+        tf = self.setup_tf()
+        with pytest.raises(ValueError):
+            tf.flag_many([("flag_col", "FLAG_B", pl.lit(True), "add"), *updates])
+        assert_series_equal(tf.df["flag_col"], pl.Series("flag_col", [0] * 10, dtype=pl.Int64))
+
+    def test_unregistered_flag_column_raises(self) -> None:
+        """An unregistered flag column name raises ColumnNotFoundError."""
+        tf = self.setup_tf()
+        with pytest.raises(ColumnNotFoundError):
+            tf.flag_many([("nonexistent_col", "FLAG_A", pl.lit(True), "add")])
+
+
+class TestFlagSummary:
+    """Tests for TimeFrame.flag_summary()."""
+
+    @staticmethod
+    def setup_tf(flag_type: FlagSystemLiteral = "bitwise", storage: FlagStorageLiteral = "values") -> TimeFrame:
+        """Set up an hourly TimeFrame over two days, with a flag column of the given flag type and storage."""
+        df = pl.DataFrame(
+            {
+                "time": pl.datetime_range(datetime(2024, 1, 1), datetime(2024, 1, 2, 23), "1h", eager=True),
+                "value": list(range(48)),
+            }
+        )
+        tf = TimeFrame(df=df, time_name="time", resolution="PT1H", periodicity="PT1H")
+        tf.register_flag_system("flags", {"FLAG_A": 1, "FLAG_B": 2, "FLAG_C": 4}, flag_type=flag_type)
+        tf.init_flag_column("flags", "flag_col", storage=storage)
+        tf.flag_many(
+            [
+                ("flag_col", "FLAG_A", pl.col("value") < 10, "add"),
+                ("flag_col", "FLAG_C", pl.col("value") % 8 == 0, "add"),
+            ]
+        )
+        return tf
+
+    @staticmethod
+    def expected(flag_a: list[int], flag_c: list[int], times: list[datetime] | None = None) -> pl.DataFrame:
+        """Build the expected flag counts."""
+        counts = pl.DataFrame({"FLAG_A": flag_a, "FLAG_B": [0] * len(flag_a), "FLAG_C": flag_c}).cast(pl.UInt32)
+        if times is not None:
+            counts = counts.insert_column(0, pl.Series("time", times))
+        return counts
+
+    @pytest.mark.parametrize(
+        "flag_type,storage",
+        [
+            ("bitwise", "values"),
+            ("categorical_list", "values"),
+            ("categorical_list", "enum"),
+            ("categorical_list", "bitset"),
+        ],
+    )
+    def test_total_counts(self, flag_type: FlagSystemLiteral, storage: FlagStorageLiteral) -> None:
+        """Without a period, each flag is counted over the whole TimeFrame, whatever the flag type and storage."""
+        result = self.setup_tf(flag_type, storage).flag_summary("flag_col")
+        assert_frame_equal(result, self.expected([10], [6]))
+
+    @pytest.mark.parametrize(
+        "flag_type,storage",
+        [
+            ("bitwise", "values"),
+            ("categorical_list", "values"),
+            ("categorical_list", "enum"),
+            ("categorical_list", "bitset"),
+        ],
+    )
+    def test_period_counts(self, flag_type: FlagSystemLiteral, storage: FlagStorageLiteral) -> None:
+        """With a period, each flag is counted per period, labelled by the start of the period."""
+        result = self.setup_tf(flag_type, storage).flag_summary("flag_col", "P1D")
+        expected = self.expected([10, 0], [3, 3], [datetime(2024, 1, 1), datetime(2024, 1, 2)])
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("storage", ["values", "enum"])
+    def test_categorical_counts(self, storage: FlagStorageLiteral) -> None:
+        """Categorical flag columns are counted by value, so the later of two flags on the same row wins."""
+        result = self.setup_tf("categorical", storage).flag_summary("flag_col", Period.of_days(1))
+        expected = self.expected([8, 0], [3, 3], [datetime(2024, 1, 1), datetime(2024, 1, 2)])
+        assert_frame_equal(result, expected)
+
+    def test_decoded_flag_column(self) -> None:
+        """A decoded flag column gives the same counts as the encoded column."""
+        tf = self.setup_tf()
+        expected = tf.flag_summary("flag_col", "P1D")
+        assert_frame_equal(tf.decode_flag_column("flag_col").flag_summary("flag_col", "P1D"), expected)
+
+    def test_no_rows(self) -> None:
+        """A TimeFrame with no rows gives zero total counts, and no period counts."""
+        tf = self.setup_tf().filter_by_flag("flag_col", "FLAG_B")
+        assert_frame_equal(tf.flag_summary("flag_col"), self.expected([0], [0]))
+        assert tf.flag_summary("flag_col", "P1D").is_empty()
+
+    @pytest.mark.parametrize("period", ["PT30M", "P2D"])
+    def test_invalid_period_raises(self, period: str) -> None:
+        """A period that is not compatible with the periodicity of the TimeFrame raises AggregationPeriodError."""
+        with pytest.raises(AggregationPeriodError):
+            self.setup_tf().flag_summary("flag_col", period)
+
+    def test_unregistered_flag_column_raises(self) -> None:
+        """An unregistered flag column name raises ColumnNotFoundError."""
+        with pytest.raises(ColumnNotFoundError):
+            self.setup_tf().flag_summary("nonexistent_col")
+
+
+class TestGaps:
+    """Tests for TimeFrame.gaps() and the caching of the gap index."""
+
+    @staticmethod
+    def setup_tf() -> TimeFrame:
+        """Set up a daily TimeFrame with null values and a missing time step."""
+        df = pl.DataFrame(
+            {
+                "time": [datetime(2024, 1, day) for day in [1, 2, 3, 4, 6, 7, 8, 9, 10]],
+                "value": [1.0, None, 3.0, None, None, 7.0, 8.0, 9.0, None],
+                "other": [1.0] * 9,
+            }
+        )
+        return TimeFrame(df, "time", "P1D")
+
+    def test_gaps(self) -> None:
+        """Test that gaps include both null values and missing time steps."""
+        result = self.setup_tf().gaps("value")
+        expected = pl.DataFrame(
+            {
+                "start": [datetime(2024, 1, 2), datetime(2024, 1, 4), datetime(2024, 1, 10)],
+                "end": [datetime(2024, 1, 2), datetime(2024, 1, 6), datetime(2024, 1, 10)],
+                "length": [1, 3, 1],
+            },
+            schema_overrides={"length": pl.UInt32},
+        )
+        assert_frame_equal(result, expected)
+
+    def test_no_gaps(self) -> None:
+        """Test that a column with no missing data has no gaps, other than missing time steps."""
+        result = self.setup_tf().gaps("other")
+        assert result["start"].to_list() == [datetime(2024, 1, 5)]
+
+    def test_unknown_column_raises(self) -> None:
+        """Test that asking for the gaps of an unknown column raises an error."""
+        with pytest.raises(ColumnNotFoundError):
+            self.setup_tf().gaps("missing")
+
+    def test_gaps_cached(self) -> None:
+        """Test that the gaps are found once, and reused until the data changes."""
+        tf = self.setup_tf()
+        with patch("time_stream.base.gap_index", wraps=gap_index) as mock_gap_index:
+            first = tf.gaps("value")
+            second = tf.gaps("value")
+            assert mock_gap_index.call_count == 1
+            assert_frame_equal(first, second)
+
+            tf.gaps("other")
+            assert mock_gap_index.call_count == 2
+
+            tf.register_flag_system("QC", {"A": 1})
+            tf.init_flag_column("QC", "qc_flags")
+            tf.gaps("value")
+            assert mock_gap_index.call_count == 3
+
+    def test_infill_reuses_gaps(self) -> None:
+        """Test that infilling a column reuses its cached gaps, and caches the gaps it finds."""
+        df = pl.DataFrame({"time": [datetime(2024, 1, day) for day in range(1, 8)]})
+        df = df.with_columns(pl.Series("value", [1.0, None, 3.0, None, None, 6.0, 7.0]))
+        tf = TimeFrame(df, "time", "P1D")
+
+        with patch("time_stream.base.gap_index", wraps=gap_index) as mock_gap_index:
+            linear = tf.infill("linear", "value", max_gap_size=1)
+            pchip = tf.infill("pchip", "value")
+            gaps = tf.gaps("value")
+
+        assert mock_gap_index.call_count == 1
+        assert linear.df["value"].null_count() == 2
+        assert pchip.df["value"].null_count() == 0
+        assert gaps["length"].to_list() == [1, 2]
+
+
 class TestInfillWithFlagParams:
     """Tests for TimeFrame.infill() with the flag_params parameter."""
 
@@ -1171,6 +1908,115 @@ class TestInfillWithFlagParams:
         assert_series_equal(tf.df["flag_col"], expected)
 
 
+class TestInfillMultipleColumns:
+    """Tests for TimeFrame.infill() with more than one column."""
+
+    @staticmethod
+    def setup_tf() -> TimeFrame:
+        """Set up a TimeFrame with nulls in several columns, and a bitwise flag column."""
+        df = pl.DataFrame(
+            {
+                "time": [datetime(2024, 1, i) for i in range(1, 8)],
+                "a": [1.0, None, 3.0, 4.0, None, None, 7.0],
+                "b": [0.0, 1.0, None, 9.0, 16.0, None, 36.0],
+                "c": [5.0, None, 5.0, 5.0, 5.0, 5.0, 5.0],
+            }
+        )
+        tf = TimeFrame(df=df, time_name="time", resolution=Period.of_days(1), periodicity=Period.of_days(1))
+        tf.register_flag_system("flags", {"FLAG_A": 1, "FLAG_B": 2})
+        tf.init_flag_column("flags", "flag_col")
+        tf.init_flag_column("flags", "flag_col_b")
+        return tf
+
+    @pytest.mark.parametrize(
+        "infill_method,column_name,kwargs",
+        [
+            ("linear", ["a", "b"], {}),
+            ({"a": "linear", "b": "quadratic"}, None, {}),
+            ({"a": "linear", "c": "pchip"}, None, {"max_gap_size": 1}),
+        ],
+        ids=["list of columns", "mapping of methods", "mapping with max gap size"],
+    )
+    def test_same_as_chained_infills(
+        self, infill_method: str | dict[str, str], column_name: list[str] | None, kwargs: dict
+    ) -> None:
+        """Infilling several columns in one call gives the same result as infilling each column in turn."""
+        tf = self.setup_tf()
+        result = tf.infill(infill_method, column_name, flag_params=("flag_col", "FLAG_A"), **kwargs)
+
+        methods = infill_method if isinstance(infill_method, dict) else dict.fromkeys(column_name or [], infill_method)
+        expected = tf
+        for column, method in methods.items():
+            expected = expected.infill(method, column, flag_params=("flag_col", "FLAG_A"), **kwargs)
+
+        assert_frame_equal(result.df, expected.df)
+
+    def test_flags_per_column(self) -> None:
+        """A mapping of flag parameters flags the infilled rows of each column in its own flag column."""
+        tf = self.setup_tf()
+        result = tf.infill(
+            "linear",
+            ["a", "b", "c"],
+            flag_params={"a": ("flag_col", "FLAG_A"), "b": ("flag_col_b", "FLAG_B"), "c": ("flag_col", "FLAG_B")},
+        )
+        assert_series_equal(result.df["flag_col"], pl.Series("flag_col", [0, 3, 0, 0, 1, 1, 0], dtype=pl.Int64))
+        assert_series_equal(result.df["flag_col_b"], pl.Series("flag_col_b", [0, 0, 2, 0, 0, 2, 0], dtype=pl.Int64))
+
+    def test_columns_without_flag_params_not_flagged(self) -> None:
+        """Columns missing from a mapping of flag parameters are infilled, but not flagged."""
+        tf = self.setup_tf()
+        result = tf.infill("linear", ["a", "c"], flag_params={"a": ("flag_col", "FLAG_A")})
+        assert_series_equal(result.df["c"], pl.Series("c", [5.0] * 7))
+        assert_series_equal(result.df["flag_col"], pl.Series("flag_col", [0, 1, 0, 0, 1, 1, 0], dtype=pl.Int64))
+
+    def test_flag_columns_written_once(self) -> None:
+        """The flag columns are updated once for all the infilled columns."""
+        tf = self.setup_tf()
+        with patch.object(TimeFrame, "add_flag") as mock_add_flag:
+            tf.infill("linear", ["a", "b", "c"], flag_params=("flag_col", "FLAG_A"))
+        mock_add_flag.assert_not_called()
+
+    def test_padded_once(self) -> None:
+        """The data is padded once, and the gaps of each column found once, however many columns are infilled."""
+        tf = self.setup_tf()
+        with (
+            patch("time_stream.base.pad_time", wraps=pad_time) as mock_pad_time,
+            patch("time_stream.infill.pad_time", wraps=pad_time) as mock_pipeline_pad_time,
+            patch("time_stream.base.gap_index", wraps=gap_index) as mock_gap_index,
+        ):
+            result = tf.infill({"a": "linear", "b": "quadratic", "c": "pchip"})
+
+        assert mock_pad_time.call_count == 1
+        mock_pipeline_pad_time.assert_not_called()
+        assert mock_gap_index.call_count == 3
+        assert result.df.select(pl.sum_horizontal(pl.col("a", "b", "c").null_count())).item() == 0
+
+    def test_mapping_with_method_kwargs(self) -> None:
+        """Methods in a mapping can be given with their own parameters, as (method, kwargs) tuples."""
+        tf = self.setup_tf()
+        result = tf.infill({"a": ("linear", {"neighbourhood": 1}), "b": "quadratic"})
+
+        expected = tf.infill("linear", "a", neighbourhood=1).infill("quadratic", "b")
+        assert_frame_equal(result.df, expected.df)
+
+    def test_mapping_with_shared_kwargs_raises(self) -> None:
+        """Method parameters given as keyword arguments with a mapping of methods raise InfillError."""
+        tf = self.setup_tf()
+        with pytest.raises(InfillError, match="neighbourhood"):
+            tf.infill({"a": "linear", "b": "quadratic"}, neighbourhood=1)
+
+    @pytest.mark.parametrize(
+        "infill_method,column_name",
+        [("linear", []), ("linear", None), ({}, None), ({"a": "linear"}, "a")],
+        ids=["empty list", "no columns", "empty mapping", "mapping and column name"],
+    )
+    def test_invalid_columns_raises(self, infill_method: str | dict[str, str], column_name: str | None) -> None:
+        """No columns, or columns given both in a method mapping and by name, raises InfillError."""
+        tf = self.setup_tf()
+        with pytest.raises(InfillError):
+            tf.infill(infill_method, column_name)
+
+
 class TestRenameTimeColumnName:
     """Tests for TimeFrame.rename_time_column() with new_time_column name."""
 
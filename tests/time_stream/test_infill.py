@@ -27,7 +27,7 @@ from time_stream.infill import (
     PchipInterpolation,
     QuadraticInterpolation,
 )
-from time_stream.utils import gap_size_count
+from time_stream.utils import gap_index, gap_size_count
 
 TIME_COLUMN = "timestamp"
 PERIODICITY = Period.of_days(1)
@@ -379,6 +379,110 @@ class TestPchipInterpolation:
         assert_series_equal(result["values_pchip"], expected)
 
 
+class TestLocalInterpolation:
+    @pytest.mark.parametrize(
+        "interpolator,input_data,expected_data",
+        [
+            (LinearInterpolation(neighbourhood=1), LINEAR, [1.0, 2.0, 3.0, 4.0, 5.0]),
+            (
+                LinearInterpolation(neighbourhood=1),
+                VARYING_GAPS,
+                [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0],
+            ),
+            (QuadraticInterpolation(neighbourhood=2), QUADRATIC, [0.0, 1.0, 4.0, 9.0, 16.0, 25.0, 36.0]),
+            (CubicInterpolation(neighbourhood=2), CUBIC, [0.0, 1.0, 8.0, 27.0, 64.0, 125.0, 216.0, 343.0, 512.0]),
+        ],
+    )
+    def test_local_interpolation_known_result(
+        self, interpolator: InfillMethod, input_data: pl.DataFrame, expected_data: list
+    ) -> None:
+        """Test interpolation fitted only to the neighbourhood of each gap, with known data."""
+        ctx = InfillCtx(input_data, TIME_COLUMN, PERIODICITY)
+        result = interpolator._fill(input_data, "values", ctx)
+        column = f"values_{interpolator.name}"
+        assert_series_equal(result[column], pl.Series(column, expected_data))
+
+    def test_window_shifted_at_series_ends(self) -> None:
+        """Test that the neighbourhood window is shifted at the ends of the series, so it still has enough points
+        for the interpolation method."""
+        # A neighbourhood of 1 only gives 2 points either side of a gap, but the cubic needs 4.
+        ctx = InfillCtx(CUBIC, TIME_COLUMN, PERIODICITY)
+        result = CubicInterpolation(neighbourhood=1)._fill(CUBIC, "values", ctx)
+        expected = pl.Series("values_cubic", [0.0, 1.0, 8.0, 27.0, 64.0, 125.0, 216.0, 343.0, 512.0])
+        assert_series_equal(result["values_cubic"], expected)
+
+    @pytest.mark.parametrize(
+        "input_data,expected_data",
+        [
+            (START_GAP_WITH_MID_GAP, [np.nan, 2.0, 3.0, 4.0, 5.0, 6.0]),
+            (END_GAP_WITH_MID_GAP, [1.0, 2.0, 3.0, 4.0, 5.0, np.nan]),
+        ],
+    )
+    def test_start_and_end_gaps_not_interpolated(self, input_data: pl.DataFrame, expected_data: list) -> None:
+        """Test that gaps at the start and end of the series are left as they are."""
+        ctx = InfillCtx(input_data, TIME_COLUMN, PERIODICITY)
+        result = LinearInterpolation(neighbourhood=1)._fill(input_data, "values", ctx)
+        assert_series_equal(result["values_linear"], pl.Series("values_linear", expected_data))
+
+    def test_matches_global_interpolation(self) -> None:
+        """Test that local interpolation matches the global interpolation for methods that only depend on the
+        points either side of a gap."""
+        rng = np.random.default_rng(42)
+        values = pl.Series("values", rng.normal(size=500)).scatter(rng.choice(500, 100, replace=False), None)
+        df = pl.DataFrame({"values": values})
+        ctx = InfillCtx(df, TIME_COLUMN, PERIODICITY)
+
+        for interpolator, local_interpolator in [
+            (LinearInterpolation(), LinearInterpolation(neighbourhood=1)),
+            (PchipInterpolation(), PchipInterpolation(neighbourhood=3)),
+            (AkimaInterpolation(), AkimaInterpolation(neighbourhood=4)),
+        ]:
+            column = f"values_{interpolator.name}"
+            expected = interpolator._fill(df, "values", ctx)[column]
+            result = local_interpolator._fill(df, "values", ctx)[column]
+            gap_rows = values.is_null() & (pl.int_range(500, eager=True) > 0)
+            assert_series_equal(result.filter(gap_rows), expected.filter(gap_rows))
+
+    def test_parallel_matches_sequential(self) -> None:
+        """Test that interpolating the gaps with several threads gives the same result as doing so in turn."""
+        rng = np.random.default_rng(7)
+        values = pl.Series("values", rng.normal(size=1000)).scatter(rng.choice(1000, 200, replace=False), None)
+        df = pl.DataFrame({"values": values})
+        ctx = InfillCtx(df, TIME_COLUMN, PERIODICITY)
+
+        expected = CubicInterpolation(neighbourhood=3)._fill(df, "values", ctx)
+        result = CubicInterpolation(neighbourhood=3, max_workers=4)._fill(df, "values", ctx)
+        assert_frame_equal(result, expected)
+
+    def test_uses_gaps_from_context(self) -> None:
+        """Test that the gap index in the context is used to find the gaps to interpolate."""
+        df = VARYING_GAPS.with_columns(
+            pl.Series("timestamp", [datetime(2025, 1, d) for d in range(1, len(VARYING_GAPS) + 1)])
+        )
+        gaps = gap_index(df, "timestamp", "values").filter(pl.col("length") == 2)
+        ctx = InfillCtx(df, "timestamp", PERIODICITY, gaps=gaps)
+        result = LinearInterpolation(neighbourhood=1)._fill(df, "values", ctx)
+        expected = pl.Series(
+            "values_linear", [1.0, None, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, None, None, None, 13.0]
+        ).fill_null(float("nan"))
+        assert_series_equal(result["values_linear"], expected)
+
+    @pytest.mark.parametrize("kwargs", [{"neighbourhood": 0}, {"max_workers": 0}])
+    def test_invalid_arguments(self, kwargs: dict) -> None:
+        """Test that a neighbourhood or number of workers less than 1 raises an error."""
+        with pytest.raises(ValueError):
+            LinearInterpolation(**kwargs)
+
+    def test_apply(self) -> None:
+        """Test that the local interpolation honours the infill pipeline constraints."""
+        df = VARYING_GAPS.with_columns(
+            pl.Series("timestamp", [datetime(2025, 1, d) for d in range(1, len(VARYING_GAPS) + 1)])
+        )
+        result = LinearInterpolation(neighbourhood=2).apply(df, "timestamp", PERIODICITY, "values", max_gap_size=2)
+        expected = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, None, None, None, 13.0]
+        assert_series_equal(result["values"], pl.Series("values", expected))
+
+
 class TestApply:
     @staticmethod
     def create_tf(df: pl.DataFrame) -> TimeFrame:
@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta
+from typing import Literal
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal, assert_series_equal
+
+from time_stream.base import TimeFrame
+from time_stream.exceptions import ColumnNotFoundError, ColumnTypeError, DuplicateTimeError, QcError
+from time_stream.lazy import LazyTimeFrame
+from time_stream.period import Period
+
+
+def setup_tf() -> TimeFrame:
+    """Set up an hourly TimeFrame with gaps, spikes and a bitwise flag column."""
+    values: list[float | None] = [float(i % 24) for i in range(72)]
+    values[5] = None
+    values[6] = None
+    values[30] = 500.0
+    df = pl.DataFrame(
+        {
+            "time": [datetime(2024, 1, 1) + timedelta(hours=i) for i in range(72)],
+            "value": values,
+            "other": list(range(72)),
+        }
+    )
+    tf = TimeFrame(df, time_name="time", resolution=Period.of_hours(1), periodicity=Period.of_hours(1))
+    tf.register_flag_system("flags", {"RANGE": 1, "INFILLED": 2})
+    tf.init_flag_column("flags", "flag_col")
+    tf.metadata = {"site": "A"}
+    tf.column_metadata["value"]["units"] = "degC"
+    return tf
+
+
+class TestLazyTimeFrame:
+    def test_lazy_returns_lazy_time_frame(self) -> None:
+        """Test that TimeFrame.lazy returns a LazyTimeFrame carrying over the time properties."""
+        tf = setup_tf()
+        ltf = tf.lazy()
+        assert isinstance(ltf, LazyTimeFrame)
+        assert ltf.time_name == tf.time_name
+        assert ltf.resolution == tf.resolution
+        assert ltf.periodicity == tf.periodicity
+        assert ltf.flag_columns == ["flag_col"]
+        assert ltf.data_columns == ["value", "other"]
+
+    def test_round_trip(self) -> None:
+        """Test that collecting an unmodified query plan returns an equal TimeFrame."""
+        tf = setup_tf()
+        assert tf.lazy().collect() == tf
+
+    def test_collect_validates_time(self) -> None:
+        """Test that the time values of the query plan are validated when it is collected."""
+        lf = pl.LazyFrame({"time": [datetime(2024, 1, 1), datetime(2024, 1, 1)], "value": [1, 2]})
+        ltf = LazyTimeFrame(lf, time_name="time")
+        with pytest.raises(DuplicateTimeError):
+            ltf.collect()
+
+    def test_qc_check_matches_eager(self) -> None:
+        """Test that a lazy QC check flags the same rows as the eager QC check."""
+        tf = setup_tf()
+        kwargs = {"min_value": 0, "max_value": 100, "within": False, "flag_params": ("flag_col", "RANGE")}
+        expected = tf.qc_check("range", "value", **kwargs)
+        result = tf.lazy().qc_check("range", "value", **kwargs).collect()
+        assert_frame_equal(result.df, expected.df)
+
+    def test_qc_check_without_flag_params_raises(self) -> None:
+        """Test that a lazy QC check needs a flag column to record its result in."""
+        tf = setup_tf()
+        with pytest.raises(QcError):
+            tf.lazy().qc_check("range", "value", min_value=0, max_value=100)
+
+    def test_infill_matches_eager(self) -> None:
+        """Test that a lazy infill matches the eager infill, including the infill flags."""
+        tf = setup_tf()
+        expected = tf.infill("linear", "value", flag_params=("flag_col", "INFILLED"))
+        result = tf.lazy().infill("linear", "value", flag_params=("flag_col", "INFILLED")).collect()
+        assert_frame_equal(result.df, expected.df)
+
+    def test_filter_after_infill(self) -> None:
+        """Test that a filter after an infill is not pushed down before it, which would remove the rows that the
+        gaps are infilled from."""
+        tf = setup_tf()
+        tf.add_flag("flag_col", "RANGE", pl.col("value").is_null())
+        expected = tf.infill("linear", "value", flag_params=("flag_col", "INFILLED")).filter_by_flag(
+            "flag_col", "RANGE"
+        )
+        result = (
+            tf.lazy()
+            .infill("linear", "value", flag_params=("flag_col", "INFILLED"))
+            .filter_by_flag("flag_col", "RANGE")
+            .collect()
+        )
+        assert_frame_equal(result.df, expected.df)
+        assert result.df["value"].to_list() == pytest.approx([5.0, 6.0])
+
+    @pytest.mark.parametrize("engine", ["in-memory", "streaming"])
+    def test_aggregate_matches_eager(self, engine: Literal["in-memory", "streaming"]) -> None:
+        """Test that a lazy aggregation matches the eager aggregation."""
+        tf = setup_tf()
+        expected = tf.aggregate("P1D", "mean", "value", missing_criteria=("available", 20))
+        result = tf.lazy().aggregate("P1D", "mean", "value", missing_criteria=("available", 20)).collect(engine)
+        assert result == expected
+
+    def test_chain_matches_eager(self) -> None:
+        """Test that a chain of operations collected once matches the same chain run eagerly."""
+        tf = setup_tf()
+        expected = (
+            tf.qc_check("range", "value", min_value=0, max_value=100, within=False, flag_params=("flag_col", "RANGE"))
+            .infill("linear", "value", max_gap_size=3)
+            .aggregate("P1D", "max", "value")
+        )
+        result = (
+            tf.lazy()
+            .qc_check("range", "value", min_value=0, max_value=100, within=False, flag_params=("flag_col", "RANGE"))
+            .infill("linear", "value", max_gap_size=3)
+            .aggregate("P1D", "max", "value")
+            .collect(engine="streaming")
+        )
+        assert result == expected
+
+    def test_remove_flag(self) -> None:
+        """Test that a flag can be added and removed in the query plan."""
+        tf = setup_tf()
+        result = (
+            tf.lazy()
+            .add_flag("flag_col", "RANGE")
+            .add_flag("flag_col", "INFILLED")
+            .remove_flag("flag_col", "RANGE", pl.col("other") < 10)
+            .collect()
+        )
+        expected = pl.Series("flag_col", [2] * 10 + [3] * 62, dtype=pl.Int64)
+        assert_series_equal(result.df["flag_col"], expected)
+
+    def test_filter_by_flag(self) -> None:
+        """Test filtering the query plan by a flag."""
+        tf = setup_tf()
+        result = (
+            tf.lazy()
+            .add_flag("flag_col", "RANGE", pl.col("other") >= 70)
+            .filter_by_flag("flag_col", "RANGE", include=False)
+            .collect()
+        )
+        assert result.df.height == 70
+
+    def test_decoded_flag_column_raises(self) -> None:
+        """Test that a decoded flag column cannot be updated in the query plan."""
+        tf = setup_tf().decode_flag_column("flag_col")
+        with pytest.raises(ColumnTypeError):
+            tf.lazy().add_flag("flag_col", "RANGE")
+
+    def test_select(self) -> None:
+        """Test that selecting columns prunes column metadata and flag columns."""
+        tf = setup_tf()
+        result = tf.lazy().select("value").collect()
+        assert result.columns == ["value"]
+        assert result.flag_columns == []
+        assert result.column_metadata["value"]["units"] == "degC"
+        assert result.metadata == {"site": "A"}
+
+    def test_select_missing_column_raises(self) -> None:
+        """Test that selecting a column not in the query plan raises an error."""
+        tf = setup_tf()
+        with pytest.raises(ColumnNotFoundError):
+            tf.lazy().select("missing")
+
+    def test_original_not_modified(self) -> None:
+        """Test that building a query plan does not modify the original TimeFrame."""
+        tf = setup_tf()
+        tf.lazy().add_flag("flag_col", "RANGE").collect()
+        assert_series_equal(tf.df["flag_col"], pl.Series("flag_col", [0] * 72, dtype=pl.Int64))
@@ -10,6 +10,8 @@ from dataclasses import (
 from typing import Any, Callable
 from unittest.mock import Mock, patch
 
+import numpy as np
+import polars as pl
 import pytest
 
 import time_stream.period as p
@@ -8833,3 +8835,91 @@ class TestEquivalentPeriods:
         """Test all periods in list are the same period"""
         period_set: set[Period] = set(period_list)
         assert len(period_set) == 1, f"Multiple periods in set: {name}: {period_set}"
+
+
+_VECTORISED_PERIODS = [
+    Period.of_years(1),
+    Period.of_years(3),
+    Period.of_months(1),
+    Period.of_months(3),
+    Period.of_days(1),
+    Period.of_days(7),
+    Period.of_hours(6),
+    Period.of_minutes(15),
+    Period.of_seconds(10),
+    Period.of_microseconds(500_000),
+    Period.of_microseconds(1),
+    Period.of("P1Y+9MT9H"),
+    Period.of("P3M+2M1D"),
+    Period.of("P1D+T9H"),
+    Period.of("PT15M+T5M"),
+    Period.of_days(1).with_origin(datetime.datetime(2000, 1, 1, 9)),
+    Period.of_months(1).with_origin(datetime.datetime(2000, 3, 1)),
+    Period.of_hours(1).with_tzinfo(TZ_UTC),
+]
+
+_VECTORISED_DATETIMES = [
+    datetime.datetime(100, 1, 1),
+    datetime.datetime(1969, 12, 31, 23, 59, 59, 999_999),
+    datetime.datetime(1970, 1, 1),
+    datetime.datetime(2000, 10, 1, 8, 59, 59),
+    datetime.datetime(2000, 10, 1, 9),
+    datetime.datetime(2024, 2, 29, 23, 59, 59, 999_999),
+    datetime.datetime(2024, 3, 1, 0, 4, 59, 123_456),
+    datetime.datetime(2024, 3, 1, 0, 5),
+    datetime.datetime(9999, 12, 1),
+]
+
+
+class TestVectorisedOrdinals:
+    """Test the vectorised ordinals and datetimes methods against their scalar equivalents"""
+
+    @pytest.mark.parametrize("period", _VECTORISED_PERIODS, ids=repr)
+    def test_ordinals_match_ordinal(self, period: Period) -> None:
+        """Test ordinals gives the same values as ordinal for each datetime"""
+        result = period.ordinals(pl.Series("time", _VECTORISED_DATETIMES))
+        assert result.dtype == pl.Int64
+        assert result.to_list() == [period.ordinal(value) for value in _VECTORISED_DATETIMES]
+
+    @pytest.mark.parametrize("period", _VECTORISED_PERIODS, ids=repr)
+    def test_datetimes_match_datetime(self, period: Period) -> None:
+        """Test datetimes gives the same values as datetime for each ordinal"""
+        ordinals = [period.ordinal(value) for value in _VECTORISED_DATETIMES[1:-1]]
+        result = period.datetimes(pl.Series("ordinal", ordinals))
+        assert result.to_list() == [p._naive(period.datetime(ordinal)) for ordinal in ordinals]
+
+    def test_ordinals_ignore_time_zone(self) -> None:
+        """Test the local date and time fields of time zone aware values are used, as with ordinal"""
+        values = pl.Series([datetime.datetime(2024, 3, 31, 0, 30), datetime.datetime(2024, 3, 31, 1, 30)])
+        values = values.dt.replace_time_zone("Europe/London", ambiguous="earliest", non_existent="null")
+        assert Period.of_hours(1).ordinals(values).to_list() == [Period.of_hours(1).ordinal(values[0]), None]
+
+    def test_ordinals_of_dates(self) -> None:
+        """Test ordinals of Date values"""
+        values = pl.Series([datetime.date(2024, 1, 31), datetime.date(2024, 2, 1)])
+        assert Period.of_months(1).ordinals(values).to_list() == [2024 * 12, 2024 * 12 + 1]
+
+    def test_numpy_round_trip(self) -> None:
+        """Test NumPy arrays are accepted and returned"""
+        period = Period.of_minutes(15)
+        values = np.array(["2024-01-01T00:14:59", "2024-01-01T00:15:00"], dtype="datetime64[us]")
+        ordinals = period.ordinals(values)
+        assert isinstance(ordinals, np.ndarray)
+        np.testing.assert_array_equal(
+            period.datetimes(ordinals), np.array(["2024-01-01T00:00", "2024-01-01T00:15"], dtype="datetime64[us]")
+        )
+
+    def test_datetimes_time_unit_and_zone(self) -> None:
+        """Test the time unit and time zone of the returned datetimes"""
+        result = Period.of_days(1).datetimes(pl.Series([739_000]), time_unit="ms", time_zone="UTC")
+        assert result.dtype == pl.Datetime("ms", "UTC")
+        assert result.to_list() == [datetime.datetime.fromordinal(739_000).replace(tzinfo=datetime.timezone.utc)]
+
+    @pytest.mark.parametrize(
+        "method,values",
+        [("ordinals", pl.Series([1, 2])), ("datetimes", pl.Series([datetime.datetime(2024, 1, 1)]))],
+    )
+    def test_illegal_dtype(self, method: str, values: pl.Series) -> None:
+        """Test an error is raised for values of the wrong type"""
+        with pytest.raises(PeriodValidationError):
+            getattr(Period.of_days(1), method)(values)
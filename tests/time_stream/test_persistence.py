@@ -0,0 +1,315 @@
+import gc
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import polars as pl
+import pyarrow as pa
+import pytest
+from polars.testing import assert_frame_equal
+
+from time_stream.base import TimeFrame
+from time_stream.exceptions import MetadataError, PeriodicityError
+from time_stream.period import Period
+from time_stream.persistence import (
+    STATE_METADATA_KEY,
+    IpcCompression,
+    TimeFrameState,
+    read_ipc_state,
+    read_parquet_state,
+    write_ipc,
+)
+from time_stream.time_manager import TimeManager
+
+FORMATS = ["parquet", "ipc"]
+
+
+def setup_tf() -> TimeFrame:
+    """Set up a water-day TimeFrame with flag columns and metadata."""
+    df = pl.DataFrame(
+        {
+            "time": [datetime(2024, 1, 1, 9) + timedelta(days=i) for i in range(10)],
+            "value": [float(i) for i in range(10)],
+            "other": list(range(10)),
+        }
+    )
+    tf = TimeFrame(df, time_name="time", resolution="P1D", offset="+T9H", time_anchor="end")
+    tf.register_flag_system("qc", {"FLAG_A": 1, "FLAG_B": 2})
+    tf.init_flag_column("qc", "qc_flags")
+    tf.register_flag_system("status", {"good": "g", "bad": "b"}, flag_type="categorical")
+    tf.init_flag_column("status", "status_flags")
+    tf.add_flag("qc_flags", "FLAG_A", pl.col("value") > 5)
+    tf.add_flag("status_flags", "good")
+    tf.metadata = {"site": "ABC", "elevation": 101.5}
+    tf.column_metadata["value"]["units"] = "mm"
+    return tf
+
+
+def write(tf: TimeFrame, path: Path, file_format: str) -> None:
+    """Write a TimeFrame to the given file format."""
+    if file_format == "parquet":
+        tf.write_parquet(path)
+    else:
+        tf.write_ipc(path)
+
+
+def read(path: Path, file_format: str, **kwargs) -> TimeFrame:
+    """Read a TimeFrame from the given file format."""
+    if file_format == "parquet":
+        return TimeFrame.read_parquet(path, **kwargs)
+    return TimeFrame.read_ipc(path, **kwargs)
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+class TestRoundTrip:
+    def test_round_trip(self, tmp_path: Path, file_format: str) -> None:
+        """Test that a TimeFrame read back from file is equal to the one written."""
+        tf = setup_tf()
+        path = tmp_path / f"tf.{file_format}"
+        write(tf, path, file_format)
+        result = read(path, file_format)
+
+        assert result == tf
+        assert result.offset == tf.offset
+        assert result.alignment == tf.alignment
+
+    def test_round_trip_decoded_flag_column(self, tmp_path: Path, file_format: str) -> None:
+        """Test that the decoded state of a flag column is restored."""
+        tf = setup_tf().decode_flag_column("qc_flags")
+        path = tmp_path / f"tf.{file_format}"
+        write(tf, path, file_format)
+        result = read(path, file_format)
+
+        assert result.get_flag_column("qc_flags").is_decoded
+        assert result.encode_flag_column("qc_flags") == tf.encode_flag_column("qc_flags")
+
+    def test_round_trip_enum_flag_column(self, tmp_path: Path, file_format: str) -> None:
+        """Test that a flag column held as an Enum is restored with its storage."""
+        tf = setup_tf()
+        tf.init_flag_column("status", "enum_flags", data="g", storage="enum")
+        path = tmp_path / f"tf.{file_format}"
+        write(tf, path, file_format)
+        result = read(path, file_format)
+
+        assert result == tf
+        assert result.get_flag_column("enum_flags").storage == "enum"
+        assert result.df["enum_flags"].dtype == pl.Enum(["g", "b"])
+
+    def test_round_trip_bitset_flag_column(self, tmp_path: Path, file_format: str) -> None:
+        """Test that a list flag column packed into a bitset is restored with its storage."""
+        tf = setup_tf()
+        tf.register_flag_system("sources", ["gauge", "radar"], flag_type="categorical_list")
+        tf.init_flag_column("sources", "source_flags", storage="bitset")
+        tf.add_flag("source_flags", "radar", pl.col("value") > 2)
+        path = tmp_path / f"tf.{file_format}"
+        write(tf, path, file_format)
+        result = read(path, file_format)
+
+        assert result == tf
+        assert result.get_flag_column("source_flags").storage == "bitset"
+        assert result.filter_by_flag("source_flags", "radar").df.height == 7
+
+    def test_round_trip_periodicity(self, tmp_path: Path, file_format: str) -> None:
+        """Test that a periodicity different from the resolution is restored."""
+        df = pl.DataFrame({"time": [datetime(2020 + i, 11, 1, 9) for i in range(5)], "value": 1})
+        tf = TimeFrame(df, time_name="time", resolution="P1D", offset="+T9H", periodicity="P1Y+9MT9H")
+        path = tmp_path / f"tf.{file_format}"
+        write(tf, path, file_format)
+        result = read(path, file_format)
+
+        assert result == tf
+        assert result.periodicity == Period.of_duration("P1Y+9MT9H")
+
+    def test_read_does_not_validate(self, tmp_path: Path, file_format: str) -> None:
+        """Test that the stored time values are trusted on read."""
+        tf = setup_tf()
+        path = tmp_path / f"tf.{file_format}"
+        write(tf, path, file_format)
+
+        with patch.object(TimeManager, "validate") as mock_validate:
+            result = read(path, file_format)
+        mock_validate.assert_not_called()
+        assert result.df[tf.time_name].flags["SORTED_ASC"]
+
+    def test_read_verify(self, tmp_path: Path, file_format: str) -> None:
+        """Test that the time values are validated on read, if requested."""
+        path = tmp_path / f"tf.{file_format}"
+        df = pl.DataFrame({"time": [datetime(2024, 1, 1), datetime(2024, 1, 1, 12)], "value": [1, 2]})
+        bad_tf = TimeFrame(df, time_name="time")
+        state = TimeFrameState.from_timeframe(bad_tf)
+        # Write a state that the data does not conform to
+        state = TimeFrameState(
+            time_name=state.time_name,
+            resolution=Period.of_hours(1),
+            offset=None,
+            periodicity=Period.of_days(1),
+            time_anchor="start",
+        )
+        if file_format == "parquet":
+            df.write_parquet(path, metadata={STATE_METADATA_KEY: state.to_json()})
+        else:
+            write_ipc(df, state, path)
+
+        read(path, file_format)
+        with pytest.raises(PeriodicityError):
+            read(path, file_format, verify=True)
+
+    def test_column_projection(self, tmp_path: Path, file_format: str) -> None:
+        """Test that only the requested columns are read, along with their flags and metadata."""
+        tf = setup_tf()
+        path = tmp_path / f"tf.{file_format}"
+        write(tf, path, file_format)
+        result = read(path, file_format, columns=["value", "qc_flags"])
+
+        assert result.df.columns == ["time", "value", "qc_flags"]
+        assert result.flag_columns == ["qc_flags"]
+        assert set(result.flag_systems) == {"qc", "status"}
+        assert result.column_metadata == {"time": {}, "value": {"units": "mm"}, "qc_flags": {}}
+        assert_frame_equal(result.df, tf.df.select(["time", "value", "qc_flags"]))
+
+    def test_read_plain_file_raises(self, tmp_path: Path, file_format: str) -> None:
+        """Test that reading a file not written from a TimeFrame raises an error."""
+        path = tmp_path / f"tf.{file_format}"
+        df = setup_tf().df
+        if file_format == "parquet":
+            df.write_parquet(path)
+        else:
+            df.write_ipc(path)
+
+        with pytest.raises(MetadataError):
+            read(path, file_format)
+
+    def test_metadata_not_json_serialisable_raises(self, tmp_path: Path, file_format: str) -> None:
+        """Test that metadata that cannot be stored in the file raises an error."""
+        tf = setup_tf().with_metadata({"created": datetime(2024, 1, 1)})
+        with pytest.raises(MetadataError):
+            write(tf, tmp_path / f"tf.{file_format}", file_format)
+
+
+class TestTimeFrameState:
+    def test_json_round_trip(self) -> None:
+        """Test that the state is unchanged by serialising to JSON and back."""
+        state = TimeFrameState.from_timeframe(setup_tf())
+        assert TimeFrameState.from_json(state.to_json()) == state
+
+    def test_state_without_storage(self) -> None:
+        """Test that flag columns in a state written before storage was recorded hold the raw values."""
+        state = TimeFrameState.from_timeframe(setup_tf()).to_json().replace(', "storage": "values"', "")
+        assert TimeFrameState.from_json(state).flag_columns["status_flags"] == ("status", False, "values")
+
+    def test_newer_version_raises(self) -> None:
+        """Test that a state written by a newer, unsupported, version raises an error."""
+        state = TimeFrameState.from_timeframe(setup_tf()).to_json().replace('"version": 1', '"version": 99')
+        with pytest.raises(MetadataError):
+            TimeFrameState.from_json(state)
+
+    @pytest.mark.parametrize("value", ["not json", '{"version": 1}'], ids=["invalid json", "missing keys"])
+    def test_invalid_state_raises(self, value: str) -> None:
+        """Test that an invalid state raises an error."""
+        with pytest.raises(MetadataError):
+            TimeFrameState.from_json(value)
+
+    def test_read_state_without_data(self, tmp_path: Path) -> None:
+        """Test reading just the stored state from a file."""
+        tf = setup_tf()
+        tf.write_parquet(tmp_path / "tf.parquet")
+        tf.write_ipc(tmp_path / "tf.arrow")
+
+        expected = TimeFrameState.from_timeframe(tf)
+        assert read_parquet_state(tmp_path / "tf.parquet") == expected
+        assert read_ipc_state(tmp_path / "tf.arrow") == expected
+
+
+class TestScanIpc:
+    @staticmethod
+    def scan_with_spy(path: Path, **kwargs) -> tuple[TimeFrame, list[tuple[pa.MemoryMappedFile, int]]]:
+        """Scan an IPC file, capturing the memory maps that are opened and the address that each is mapped at."""
+        memory_maps = []
+        memory_map = pa.memory_map
+
+        def spy(*args, **kw) -> pa.MemoryMappedFile:
+            mapped = memory_map(*args, **kw)
+            memory_maps.append((mapped, mapped.read_buffer(1).address))
+            mapped.seek(0)
+            return mapped
+
+        with patch("pyarrow.memory_map", side_effect=spy):
+            tf = TimeFrame.scan_ipc(path, **kwargs)
+        return tf, memory_maps
+
+    def test_scan_ipc(self, tmp_path: Path) -> None:
+        """Test that a memory-mapped TimeFrame is equal to the one written."""
+        tf = setup_tf()
+        tf.write_ipc(tmp_path / "tf.arrow")
+        assert TimeFrame.scan_ipc(tmp_path / "tf.arrow") == tf
+
+    def test_scan_ipc_is_zero_copy(self, tmp_path: Path) -> None:
+        """Test that the columns of the TimeFrame are views onto the memory-mapped file."""
+        path = tmp_path / "tf.arrow"
+        setup_tf().write_ipc(path)
+        tf, memory_maps = self.scan_with_spy(path)
+
+        # The data is read through the last memory map opened
+        _, start = memory_maps[-1]
+        end = start + path.stat().st_size
+
+        for column in ["time", "value", "other", "qc_flags"]:
+            address = tf.df[column].to_arrow().buffers()[1].address
+            assert start <= address < end
+
+    def test_scan_ipc_closes_memory_map(self, tmp_path: Path) -> None:
+        """Test that the memory-mapped file is closed, and the data stays valid once nothing else references it."""
+        path = tmp_path / "tf.arrow"
+        expected = setup_tf()
+        expected.write_ipc(path)
+        tf, memory_maps = self.scan_with_spy(path)
+
+        assert all(mapped.closed for mapped, _ in memory_maps)
+        del memory_maps
+        gc.collect()
+        assert tf == expected
+
+    @pytest.mark.skipif(not Path("/proc/self/fd").exists(), reason="Requires /proc to count open file descriptors.")
+    def test_scan_ipc_does_not_leak_file_descriptors(self, tmp_path: Path) -> None:
+        """Test that repeatedly scanning a file, and holding on to the results, leaves no file descriptors open."""
+        path = tmp_path / "tf.arrow"
+        setup_tf().write_ipc(path)
+        open_fds = len(os.listdir("/proc/self/fd"))
+
+        gc.disable()
+        try:
+            results = [TimeFrame.scan_ipc(path) for _ in range(20)]
+            assert len(os.listdir("/proc/self/fd")) == open_fds
+        finally:
+            gc.enable()
+        assert all(result == results[0] for result in results)
+
+    def test_scan_ipc_does_not_validate(self, tmp_path: Path) -> None:
+        """Test that the time properties are read from file, rather than recomputed."""
+        path = tmp_path / "tf.arrow"
+        setup_tf().write_ipc(path)
+        with patch.object(TimeManager, "validate") as mock_validate:
+            TimeFrame.scan_ipc(path)
+        mock_validate.assert_not_called()
+
+    def test_scan_ipc_columns(self, tmp_path: Path) -> None:
+        """Test that a column projection is applied to the memory-mapped data."""
+        tf = setup_tf()
+        tf.write_ipc(tmp_path / "tf.arrow")
+        result = TimeFrame.scan_ipc(tmp_path / "tf.arrow", columns=["other"])
+        assert result.df.columns == ["time", "other"]
+        assert result.flag_columns == []
+
+    @pytest.mark.parametrize("compression", ["lz4", "zstd"])
+    def test_scan_ipc_compressed(self, tmp_path: Path, compression: IpcCompression) -> None:
+        """Test that compressed files can still be scanned (although the data is decompressed into memory)."""
+        tf = setup_tf()
+        tf.write_ipc(tmp_path / "tf.arrow", compression=compression)
+        assert TimeFrame.scan_ipc(tmp_path / "tf.arrow") == tf
+
+    def test_scan_ipc_without_memory_map(self, tmp_path: Path) -> None:
+        """Test that the file can be read into memory instead of being memory-mapped."""
+        tf = setup_tf()
+        tf.write_ipc(tmp_path / "tf.arrow")
+        assert TimeFrame.scan_ipc(tmp_path / "tf.arrow", memory_map=False) == tf
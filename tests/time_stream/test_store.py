@@ -0,0 +1,141 @@
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from time_stream.base import TimeFrame
+from time_stream.period import Period
+from time_stream.store import TimeFrameStore
+
+
+def setup_tf(periodicity: str = "PT1H", length: int = 24 * 90) -> TimeFrame:
+    """Set up a TimeFrame starting in December 2023, with a flag column and metadata."""
+    period = Period.of_duration(periodicity)
+    start = period.ordinal(datetime(2023, 12, 1))
+    df = pl.DataFrame(
+        {
+            "time": [period.datetime(start + i) for i in range(length)],
+            "value": [float(i) for i in range(length)],
+        }
+    )
+    tf = TimeFrame(df, time_name="time", resolution=periodicity, periodicity=periodicity)
+    tf.register_flag_system("qc", {"FLAG_A": 1})
+    tf.init_flag_column("qc", "qc_flags")
+    tf.metadata = {"station": "ABC"}
+    return tf
+
+
+class TestTimeFrameStore:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that reading a whole series returns the TimeFrame written."""
+        store = TimeFrameStore(tmp_path)
+        tf = setup_tf()
+        store.write("abc", tf)
+        assert store.read("abc") == tf
+
+    @pytest.mark.parametrize(
+        "periodicity,length,expected_partitions",
+        [
+            ("PT15M", 4 * 24 * 70, {"year=2023/month=12", "year=2024/month=01", "year=2024/month=02"}),
+            ("PT1H", 24 * 70, {"year=2023/month=12", "year=2024/month=01", "year=2024/month=02"}),
+            ("P1D", 70, {"year=2023", "year=2024"}),
+            ("P1M", 12, {"."}),
+        ],
+    )
+    def test_partition_layout(
+        self, tmp_path: Path, periodicity: str, length: int, expected_partitions: set[str]
+    ) -> None:
+        """Test that the partition granularity is chosen from the periodicity of the TimeFrame."""
+        store = TimeFrameStore(tmp_path)
+        store.write("abc", setup_tf(periodicity, length=length))
+
+        series_dir = tmp_path / "series=abc"
+        partitions = {path.parent.relative_to(series_dir).as_posix() for path in series_dir.rglob("data.parquet")}
+        assert partitions == expected_partitions
+
+    @pytest.mark.parametrize("periodicity", ["PT1H", "P1D", "P1M"])
+    @pytest.mark.parametrize(
+        "start,end",
+        [
+            (datetime(2024, 1, 10), datetime(2024, 1, 20)),
+            (datetime(2023, 12, 31), datetime(2024, 1, 1)),
+            (datetime(2024, 1, 15), None),
+            (None, datetime(2023, 12, 15)),
+            (datetime(2030, 1, 1), None),
+        ],
+    )
+    def test_read_time_range(
+        self, tmp_path: Path, periodicity: str, start: datetime | None, end: datetime | None
+    ) -> None:
+        """Test that reading a time range returns the same rows as filtering the full TimeFrame."""
+        store = TimeFrameStore(tmp_path)
+        tf = setup_tf(periodicity, length=90)
+        store.write("abc", tf)
+
+        result = store.read("abc", start=start, end=end)
+
+        expected = tf.df
+        if start is not None:
+            expected = expected.filter(pl.col("time") >= start)
+        if end is not None:
+            expected = expected.filter(pl.col("time") <= end)
+        assert_frame_equal(result.df, expected)
+        assert result.flag_columns == ["qc_flags"]
+        assert result.metadata == {"station": "ABC"}
+
+    def test_read_only_overlapping_partitions(self, tmp_path: Path) -> None:
+        """Test that only the partition files overlapping the time range are scanned."""
+        store = TimeFrameStore(tmp_path)
+        store.write("abc", setup_tf())
+
+        with patch("polars.scan_parquet", wraps=pl.scan_parquet) as mock_scan:
+            store.read("abc", start=datetime(2024, 1, 10), end=datetime(2024, 1, 20))
+
+        files = mock_scan.call_args.args[0]
+        assert [Path(f).parent.relative_to(tmp_path).as_posix() for f in files] == ["series=abc/year=2024/month=01"]
+
+    def test_read_columns(self, tmp_path: Path) -> None:
+        """Test reading a subset of columns."""
+        store = TimeFrameStore(tmp_path)
+        store.write("abc", setup_tf())
+        result = store.read("abc", columns=["value"])
+        assert result.df.columns == ["time", "value"]
+        assert result.flag_columns == []
+
+    def test_write_replaces_series(self, tmp_path: Path) -> None:
+        """Test that writing a series again replaces the existing data."""
+        store = TimeFrameStore(tmp_path)
+        store.write("abc", setup_tf("PT1H"))
+        tf = setup_tf("P1D", length=10)
+        store.write("abc", tf)
+        assert store.read("abc") == tf
+
+    def test_series_ids(self, tmp_path: Path) -> None:
+        """Test listing, and deleting, the series in the store, including IDs that are not safe directory names."""
+        store = TimeFrameStore(tmp_path / "store")
+        assert store.series_ids() == []
+
+        tf = setup_tf("P1D", length=10)
+        for series_id in ["station_1/rainfall", "station_2=flow", "abc"]:
+            store.write(series_id, tf)
+        assert store.series_ids() == ["abc", "station_1/rainfall", "station_2=flow"]
+        assert store.read("station_1/rainfall") == tf
+
+        store.delete("station_1/rainfall")
+        assert store.series_ids() == ["abc", "station_2=flow"]
+
+    def test_read_missing_series_raises(self, tmp_path: Path) -> None:
+        """Test that reading a series not in the store raises an error."""
+        store = TimeFrameStore(tmp_path)
+        with pytest.raises(KeyError):
+            store.read("abc")
+        with pytest.raises(KeyError):
+            store.delete("abc")
+
+    def test_empty_series_id_raises(self, tmp_path: Path) -> None:
+        """Test that an empty series ID is rejected."""
+        with pytest.raises(ValueError):
+            TimeFrameStore(tmp_path).write("", setup_tf())
@@ -1,6 +1,7 @@
 import logging
 import re
 from datetime import datetime
+from unittest.mock import patch
 
 import polars as pl
 import pytest
@@ -299,6 +300,45 @@ class TestHandleTimeDuplicates:
         assert_frame_equal(result, expected)
 
 
+class TestHandleTimeDuplicatesOrder:
+    """Tests for the sorting carried out when handling duplicate times."""
+
+    # Unsorted times, with the duplicates of 2024-01-01 in the order of colA
+    df = pl.DataFrame(
+        {
+            "time": [datetime(2024, 1, 3), datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 1)],
+            "colA": [3, 1, 2, 4],
+        }
+    )
+
+    @pytest.mark.parametrize(
+        "on_duplicates,expected",
+        [("keep_first", [1, 2, 3]), ("keep_last", [4, 2, 3]), ("merge", [1, 2, 3]), ("drop", [2, 3])],
+    )
+    def test_unsorted_duplicates_keep_original_order(self, tm: TimeManager, on_duplicates: str, expected: list) -> None:
+        """Duplicates in unsorted times are resolved in the order the rows were given."""
+        tm._on_duplicates = on_duplicates  # type: ignore[assignment]
+        result = tm._handle_time_duplicates(self.df)
+        assert result["colA"].to_list() == expected
+        assert result["time"].flags["SORTED_ASC"]
+
+    def test_sorted_times_not_resorted(self, tm: TimeManager) -> None:
+        """Times that are already in order are not sorted again, but are flagged as sorted."""
+        tm._on_duplicates = "error"
+        df = self.df.filter(pl.col("colA") != 4).sort("colA")
+        with patch.object(pl.DataFrame, "sort") as mock_sort:
+            result = tm._handle_time_duplicates(df)
+        mock_sort.assert_not_called()
+        assert_frame_equal(result, df)
+        assert result["time"].flags["SORTED_ASC"]
+
+    def test_sorted_duplicates_found(self, tm: TimeManager) -> None:
+        """Duplicates are found in times that are flagged as sorted."""
+        tm._on_duplicates = "error"
+        with pytest.raises(DuplicateTimeError):
+            tm._handle_time_duplicates(self.df.sort("time"))
+
+
 class TestCheckTimeIntegrity:
     df = pl.DataFrame(
         {"time": [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3), datetime(2024, 1, 4)]}
@@ -317,6 +357,40 @@ class TestCheckTimeIntegrity:
         with pytest.raises(TimeMutatedError):
             self.tm._check_time_integrity(self.df, new_df)
 
+    def test_reordered_time_values(self) -> None:
+        """Test that reordering the time values is valid"""
+        self.tm._check_time_integrity(self.df, self.df.reverse())
+
+    def test_unchanged_time_values_not_sorted(self) -> None:
+        """Test that an unchanged time column is accepted by a direct comparison, without sorting"""
+        new_df = self.df.with_columns(value=pl.lit(1))
+        with patch.object(pl.Series, "sort") as mock_sort:
+            self.tm._check_time_integrity(self.df, new_df)
+        mock_sort.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "new_times",
+        [
+            [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3)],
+            [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3), None],
+            [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3), datetime(2024, 1, 5)],
+            [datetime(2024, 1, 2), datetime(2024, 1, 1), datetime(2024, 1, 3), datetime(2024, 1, 3)],
+            [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3), datetime(2024, 1, 3)],
+        ],
+        ids=["fewer rows", "null", "different max", "reordered duplicate", "sorted duplicate"],
+    )
+    def test_changed_time_values(self, new_times: list) -> None:
+        """Test that each kind of change to the time values is caught"""
+        new_df = pl.DataFrame({"time": new_times})
+        with pytest.raises(TimeMutatedError):
+            self.tm._check_time_integrity(self.df, new_df)
+
+    def test_unsorted_old_time_values(self) -> None:
+        """Test that reordered time values are valid when the old time values are not sorted"""
+        old_df = self.df.reverse()
+        new_df = self.df.sample(fraction=1.0, shuffle=True, seed=1)
+        self.tm._check_time_integrity(old_df, new_df)
+
 
 class TestConfigureResolutionProperty:
     def test_resolution_string_parsed(self) -> None:
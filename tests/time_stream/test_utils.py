@@ -1,6 +1,7 @@
 import re
 from datetime import datetime, time, timedelta
 from typing import Any
+from unittest.mock import patch
 
 import polars as pl
 import pytest
@@ -15,6 +16,9 @@ from time_stream.utils import (
     check_columns_in_dataframe,
     check_periodicity,
     epoch_check,
+    expand_gaps,
+    gap_index,
+    gap_size_count,
     get_date_filter,
     pad_time,
     truncate_to_period,
@@ -940,6 +944,51 @@ class TestPadTime:
         result = pad_time(df_to_pad, "time", periodicity, start=start_date, end=end_date)
         assert_frame_equal(expected_df, result)
 
+    def test_complete_series_not_padded(self) -> None:
+        """Test that a complete series with a fixed-length periodicity is returned without building the expected
+        datetimes."""
+        df = pl.DataFrame({"time": pl.datetime_range(datetime(2025, 1, 1), datetime(2025, 1, 2), "1h", eager=True)})
+        with patch("time_stream.utils.pl.datetime_range") as mock_datetime_range:
+            result = pad_time(df, "time", Period.of_hours(1))
+        mock_datetime_range.assert_not_called()
+        assert_frame_equal(result, df)
+
+    def test_padded_rows_sorted_and_null(self) -> None:
+        """Test that the padded rows are merged into the data in time order, with nulls in all other columns."""
+        df = pl.DataFrame(
+            {
+                "value": [3.0, 1.0],
+                "time": [datetime(2025, 1, 4), datetime(2025, 1, 1)],
+                "flags": [["A"], []],
+            }
+        )
+        result = pad_time(df, "time", Period.of_days(1))
+
+        expected = pl.DataFrame(
+            {
+                "time": [datetime(2025, 1, day) for day in range(1, 5)],
+                "value": [1.0, None, None, 3.0],
+                "flags": [[], None, None, ["A"]],
+            },
+            schema_overrides={"flags": pl.List(pl.String)},
+        )
+        assert_frame_equal(result, expected)
+        assert result["time"].flags["SORTED_ASC"]
+
+    def test_end_anchor_time_zone_not_padded(self) -> None:
+        """Test that an end anchored daily series across a daylight saving change is not padded with duplicate times,
+        where the truncated times of the data differ from the actual times."""
+        df = pl.DataFrame(
+            {
+                "time": pl.datetime_range(
+                    datetime(2025, 3, 25), datetime(2025, 4, 5), "1d", eager=True, time_zone="Europe/London"
+                )
+            }
+        )
+        result = pad_time(df, "time", Period.of_days(1), "end")
+        assert result["time"].is_unique().all()
+        assert set(df["time"]) <= set(result["time"])
+
 
 class TestCheckAlignment:
     def _check_success(self, _: str, times: list, resolution: Period, time_anchor: TimeAnchor) -> None:
@@ -2018,6 +2067,66 @@ class TestCheckPeriodicity:
         self._check_failure(name, times, periodicity, time_anchor)
 
 
+class TestIntegerCheckPath:
+    """Tests for the integer arithmetic paths of check_alignment and check_periodicity."""
+
+    TIMES = [
+        datetime(1969, 12, 31, 23, 45),
+        datetime(2024, 2, 29, 23, 45),
+        datetime(2024, 3, 1, 0, 0),
+        datetime(2024, 3, 1, 0, 15),
+        datetime(2024, 3, 1, 0, 15, 0, 1_000),
+        datetime(2024, 3, 1, 0, 30),
+    ]
+
+    @staticmethod
+    def series(times: list, time_unit: str, time_zone: str | None) -> pl.Series:
+        """Build a datetime Series in the given time unit and time zone."""
+        return pl.Series("time", times).dt.cast_time_unit(time_unit).dt.replace_time_zone(time_zone)  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("time_unit", ["ns", "us", "ms"])
+    @pytest.mark.parametrize("time_zone", [None, "UTC", "Asia/Kolkata"])
+    @pytest.mark.parametrize("time_anchor", ["start", "end"])
+    @pytest.mark.parametrize("period", ["PT15M", "PT30M+T15M", "P1D", "PT0.001S"])
+    @pytest.mark.parametrize("rows", [[0, 1, 2, 3, 5], [1, 2, 3, 4], [5, 1, 2], [2, 2], [0, 4]])
+    def test_matches_truncation(
+        self, time_unit: str, time_zone: str | None, time_anchor: TimeAnchor, period: str, rows: list[int]
+    ) -> None:
+        """The checks give the same results as truncating the date/times to the period."""
+        date_times = self.series([self.TIMES[i] for i in rows], time_unit, time_zone)
+        result = (
+            check_alignment(date_times, Period.of(period), time_anchor),
+            check_periodicity(date_times, Period.of(period), time_anchor),
+        )
+        with patch("time_stream.utils._fixed_period_units", return_value=None):
+            expected = (
+                check_alignment(date_times, Period.of(period), time_anchor),
+                check_periodicity(date_times, Period.of(period), time_anchor),
+            )
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "times,expected",
+        [
+            ([datetime(2024, 1, 1, h) for h in range(10)], True),
+            ([datetime(2024, 1, 1, h) for h in range(10)] + [datetime(2024, 1, 1, 9, 30)], False),
+            (
+                [datetime(2024, 1, 1, h) for h in range(3)] + [datetime(2024, 1, 1, 2, 30), datetime(2024, 1, 1, 3)],
+                False,
+            ),
+        ],
+    )
+    def test_sorted_periodicity_across_slices(self, times: list, expected: bool) -> None:
+        """Period IDs are compared across the boundaries between slices of a sorted Series."""
+        with patch("time_stream.utils._CHECK_SLICE_LENGTH", 3):
+            assert check_periodicity(pl.Series("time", times), Period.of_hours(1), "start") == expected
+
+    def test_millisecond_end_anchor_truncation(self) -> None:
+        """Millisecond date/times on a period boundary are the end of their own period."""
+        date_times = pl.Series("time", [datetime(2024, 1, 1, 0, 15)]).dt.cast_time_unit("ms")
+        assert_series_equal(truncate_to_period(date_times, Period.of_minutes(15), "end"), date_times)
+
+
 class TestEpochCheck:
     @pytest.mark.parametrize(
         "period",
@@ -2077,6 +2186,76 @@ class TestEpochCheck:
         epoch_check(period)
 
 
+class TestGapIndex:
+    @staticmethod
+    def df(values: list[float | None]) -> pl.DataFrame:
+        """A daily DataFrame of the given values."""
+        return pl.DataFrame(
+            {"time": [datetime(2025, 1, day) for day in range(1, len(values) + 1)], "values": values},
+            schema={"time": pl.Datetime, "values": pl.Float64},
+        )
+
+    @pytest.mark.parametrize(
+        "values,expected_runs",
+        [
+            ([1.0, 2.0, 3.0], []),
+            ([1.0, None, 3.0], [(1, 1)]),
+            ([None, None, 3.0, None, 5.0, None, None, None], [(0, 1), (3, 3), (5, 7)]),
+            ([None, None, None], [(0, 2)]),
+            ([], []),
+        ],
+        ids=["no gaps", "single gap", "start, middle and end gaps", "all null", "empty"],
+    )
+    def test_gap_index(self, values: list[float | None], expected_runs: list[tuple[int, int]]) -> None:
+        """Test that the gap index has one row per run of consecutive nulls."""
+        df = self.df(values)
+        result = gap_index(df, "time", "values")
+
+        expected = pl.DataFrame(
+            {
+                "start_row": [start for start, _ in expected_runs],
+                "end_row": [end for _, end in expected_runs],
+                "start": [datetime(2025, 1, start + 1) for start, _ in expected_runs],
+                "end": [datetime(2025, 1, end + 1) for _, end in expected_runs],
+                "length": [end - start + 1 for start, end in expected_runs],
+            },
+            schema={
+                "start_row": pl.UInt32,
+                "end_row": pl.UInt32,
+                "start": pl.Datetime,
+                "end": pl.Datetime,
+                "length": pl.UInt32,
+            },
+        )
+        assert_frame_equal(result, expected)
+
+    def test_expand_gaps(self) -> None:
+        """Test that a column of the gap index is expanded to the rows of each gap."""
+        df = self.df([None, 2.0, None, None, 5.0, None])
+        result = expand_gaps(gap_index(df, "time", "values"), df.height, "length")
+        assert_series_equal(result, pl.Series("length", [1, None, 2, 2, None, 1], dtype=pl.UInt32))
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [1.0, 2.0, 3.0],
+            [None, None, 3.0, None, 5.0, None, None, None],
+            [None, None, None],
+            [1.0, None, 3.0, None, None, 6.0],
+        ],
+    )
+    def test_gap_size_count(self, values: list[float | None]) -> None:
+        """Test that the gap size of each row is the length of the gap that the row is in, or 0 if it is not null."""
+        df = self.df(values)
+        result = gap_size_count(df, "values")
+
+        # Count the gap sizes with a window over the ID of each run of nulls
+        null_mask = pl.col("values").is_null()
+        run_id = (null_mask != null_mask.shift(1, fill_value=False)).cum_sum()
+        expected = df.with_columns(pl.when(null_mask).then(pl.len().over(run_id)).otherwise(0).alias("gap_size"))
+        assert_frame_equal(result, expected)
+
+
 class TestTimeWindow:
     def test_default_closed_is_both(self) -> None:
         """Omitting closed defaults to "both"."""